@@ -0,0 +1,93 @@
+import argparse
+import os
+from pathlib import Path
+from typing import Iterator, Literal
+
+import openpyxl
+
+KeyType = Literal["key", "mnemonic"]
+
+
+def generate_secrets(count: int, key_type: KeyType = "key") -> Iterator[str]:
+    if key_type == "mnemonic":
+        from eth_account.hdaccount import Language, generate_mnemonic
+
+        for _ in range(count):
+            yield generate_mnemonic(12, Language.ENGLISH)
+    else:
+        for _ in range(count):
+            yield os.urandom(32).hex()
+
+
+def write_accounts_file(
+    path: str | Path,
+    count: int,
+    key_type: KeyType = "key",
+    proxies: list[str] | None = None
+) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(["Mnemonic", "Proxy"] if proxies else ["Mnemonic"])
+
+    for idx, secret in enumerate(generate_secrets(count, key_type)):
+        if proxies:
+            ws.append([secret, proxies[idx % len(proxies)]])
+        else:
+            ws.append([secret])
+
+    wb.save(path)
+    return path
+
+
+def write_settings_file(
+    path: str | Path,
+    threads: int,
+    processes: int = 1,
+    extra: str = ""
+) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f"threads: {threads}\n"
+        f"processes: {processes}\n"
+        "delay_before_start:\n"
+        "    min: 0\n"
+        "    max: 0\n"
+        f"{extra}",
+        encoding="utf-8"
+    )
+    return path
+
+
+def create_home(
+    home: str | Path,
+    count: int,
+    threads: int,
+    key_type: KeyType = "key",
+    proxies: list[str] | None = None,
+    processes: int = 1,
+    extra_settings: str = ""
+) -> Path:
+    home = Path(home)
+    write_settings_file(home / "config" / "settings.yaml", threads, processes, extra_settings)
+    write_accounts_file(home / "config" / "data" / "client" / "accounts.xlsx", count, key_type, proxies)
+    return home
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic accounts.xlsx")
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--key-type", choices=["key", "mnemonic"], default="key")
+    parser.add_argument("--proxy", action="append", dest="proxies", help="proxy URL, repeat for several")
+    args = parser.parse_args()
+
+    write_accounts_file(args.output, args.count, args.key_type, args.proxies)
+    print(f"Wrote {args.count} accounts to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import argparse
+import json
+from pathlib import Path
+
+METRICS = (
+    ("throughput", "accounts/s", True),
+    ("latency_p50", "s", False),
+    ("latency_p99", "s", False),
+    ("cpu_per_account", "s", False),
+    ("peak_rss_bytes", "bytes", False),
+)
+
+
+def load(path: Path) -> dict:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    args = parser.parse_args()
+
+    baseline, candidate = load(args.baseline), load(args.candidate)
+    print(f"{baseline['label']} ({baseline['revision']}) -> {candidate['label']} ({candidate['revision']})")
+
+    for name, unit, higher_is_better in METRICS:
+        old = baseline["metrics"].get(name, 0.0)
+        new = candidate["metrics"].get(name, 0.0)
+        change = (new - old) / old * 100 if old else 0.0
+        better = change > 0 if higher_is_better else change < 0
+        marker = "+" if better else ("-" if change else " ")
+        print(f"{marker} {name:<16} {old:>14.4f} -> {new:>14.4f} {unit:<10} ({change:+.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+import argparse
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import random
+import socket
+import time
+from dataclasses import asdict, dataclass
+
+from aiohttp import web
+
+
+@dataclass
+class MockAPISettings:
+    latency: float = 0.05
+    jitter: float = 0.02
+    rate_limit_ratio: float = 0.0
+    server_error_ratio: float = 0.0
+    drop_ratio: float = 0.0
+    hang_ratio: float = 0.0
+    hang_time: float = 60.0
+    rewards: int = 0
+    compress: bool = False
+    seed: int | None = None
+
+
+def points_for(address: str) -> int:
+    digest = hashlib.blake2b(address.lower().encode(), digest_size=4).digest()
+    return int.from_bytes(digest, "big") % 100_000
+
+
+def create_app(settings: MockAPISettings) -> web.Application:
+    rng = random.Random(settings.seed)
+    stats = {"requests": 0, "ok": 0, "rate_limited": 0, "server_errors": 0, "dropped": 0, "hung": 0}
+
+    async def dashboard(request: web.Request) -> web.StreamResponse:
+        stats["requests"] += 1
+        delay = settings.latency + rng.uniform(-settings.jitter, settings.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        roll = rng.random()
+        if roll < settings.drop_ratio:
+            stats["dropped"] += 1
+            request.transport.close()
+            return web.Response(status=503)
+        roll -= settings.drop_ratio
+
+        if roll < settings.hang_ratio:
+            stats["hung"] += 1
+            await asyncio.sleep(settings.hang_time)
+        roll -= settings.hang_ratio
+
+        if roll < settings.rate_limit_ratio:
+            stats["rate_limited"] += 1
+            return web.json_response({"message": "Too many requests"}, status=429)
+        roll -= settings.rate_limit_ratio
+
+        if roll < settings.server_error_ratio:
+            stats["server_errors"] += 1
+            return web.json_response({"message": "Internal server error"}, status=503)
+
+        address = request.query.get("walletAddress", "")
+        stats["ok"] += 1
+        response = web.json_response({
+            "walletAddress": address,
+            "totalPoints": points_for(address),
+            "stakedAmount": "0",
+            "rewards": [
+                {"epoch": epoch, "points": points_for(f"{address}:{epoch}"), "type": "staking"}
+                for epoch in range(settings.rewards)
+            ]
+        })
+        if settings.compress:
+            response.enable_compression()
+        return response
+
+    async def get_stats(request: web.Request) -> web.Response:
+        return web.json_response(stats)
+
+    app = web.Application()
+    app.router.add_get("/staking/v1/dashboard", dashboard)
+    app.router.add_get("/_stats", get_stats)
+    return app
+
+
+def serve(host: str, port: int, settings: MockAPISettings) -> None:
+    logging.getLogger("aiohttp").setLevel(logging.CRITICAL)
+    web.run_app(
+        create_app(settings),
+        host=host,
+        port=port,
+        access_log=None,
+        print=None,
+        handle_signals=True
+    )
+
+
+def free_port(host: str = "127.0.0.1") -> int:
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(host: str, port: int, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise TimeoutError(f"Mock server {host}:{port} did not start in {timeout}s")
+
+
+class MockAPIServer:
+    def __init__(
+        self,
+        settings: MockAPISettings | None = None,
+        host: str = "127.0.0.1",
+        port: int | None = None
+    ) -> None:
+        self.settings = settings or MockAPISettings()
+        self.host = host
+        self.port = port or free_port(host)
+        self._process: multiprocessing.Process | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> None:
+        context = multiprocessing.get_context("spawn")
+        self._process = context.Process(
+            target=serve,
+            args=(self.host, self.port, self.settings),
+            daemon=True
+        )
+        self._process.start()
+        wait_for_port(self.host, self.port)
+
+    def stop(self) -> None:
+        if self._process and self._process.is_alive():
+            self._process.terminate()
+            self._process.join(timeout=5)
+        self._process = None
+
+    def __enter__(self) -> "MockAPIServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local mock of the SFI staking API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=MockAPISettings.latency)
+    parser.add_argument("--jitter", type=float, default=MockAPISettings.jitter)
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="share of 429 responses")
+    parser.add_argument("--server-errors", type=float, default=0.0, help="share of 5xx responses")
+    parser.add_argument("--drops", type=float, default=0.0, help="share of dropped connections")
+    parser.add_argument("--hangs", type=float, default=0.0, help="share of responses delayed by --hang-time")
+    parser.add_argument("--hang-time", type=float, default=MockAPISettings.hang_time)
+    parser.add_argument("--rewards", type=int, default=0, help="reward history entries per dashboard response")
+    parser.add_argument("--compress", action="store_true", help="compress responses per Accept-Encoding")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    settings = MockAPISettings(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit_ratio=args.rate_limit,
+        server_error_ratio=args.server_errors,
+        drop_ratio=args.drops,
+        hang_ratio=args.hangs,
+        hang_time=args.hang_time,
+        rewards=args.rewards,
+        compress=args.compress,
+        seed=args.seed
+    )
+    print(f"Serving mock SFI API on http://{args.host}:{args.port} with {asdict(settings)}")
+    serve(args.host, args.port, settings)
+
+
+if __name__ == "__main__":
+    main()
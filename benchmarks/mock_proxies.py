@@ -0,0 +1,270 @@
+import argparse
+import asyncio
+import multiprocessing
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from benchmarks.accounts import write_accounts_file
+from benchmarks.mock_api import free_port, wait_for_port
+
+
+@dataclass
+class MockProxySettings:
+    latency: float = 0.0
+    jitter: float = 0.0
+    ban_ratio: float = 0.0
+    failure_ratio: float = 0.0
+    seed: int | None = None
+
+
+@dataclass
+class MockProxyStats:
+    connections: int = 0
+    tunnels: int = 0
+    forwarded: int = 0
+    banned: int = 0
+    failed: int = 0
+
+
+@dataclass
+class MockProxy:
+    host: str
+    port: int
+    latency: float = 0.0
+    jitter: float = 0.0
+    failure_ratio: float = 0.0
+    banned: bool = False
+    stats: MockProxyStats = field(default_factory=MockProxyStats)
+    rng: random.Random = field(default_factory=random.Random)
+    server: asyncio.AbstractServer | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+
+    async def stop(self) -> None:
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.stats.connections += 1
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+
+        delay = self.latency + self.rng.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self.banned:
+            self.stats.banned += 1
+            writer.write(b"HTTP/1.1 403 Forbidden\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            await self._close(writer)
+            return
+
+        if self.rng.random() < self.failure_ratio:
+            self.stats.failed += 1
+            writer.transport.abort()
+            return
+
+        method, target, _ = head.split(b"\r\n", 1)[0].decode("latin-1").split(" ", 2)
+        try:
+            if method == "CONNECT":
+                host, port = target.rsplit(":", 1)
+                upstream_reader, upstream_writer = await asyncio.open_connection(host, int(port))
+                writer.write(b"HTTP/1.1 200 Connection established\r\n\r\n")
+                self.stats.tunnels += 1
+            else:
+                authority = target.split("://", 1)[-1].split("/", 1)[0]
+                host, _, port = authority.partition(":")
+                upstream_reader, upstream_writer = await asyncio.open_connection(host, int(port or 80))
+                upstream_writer.write(head)
+                self.stats.forwarded += 1
+        except (OSError, ValueError):
+            self.stats.failed += 1
+            writer.write(b"HTTP/1.1 502 Bad Gateway\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            await self._close(writer)
+            return
+
+        await asyncio.gather(
+            self._pipe(reader, upstream_writer),
+            self._pipe(upstream_reader, writer)
+        )
+
+    @staticmethod
+    async def _pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while data := await reader.read(65536):
+                writer.write(data)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            await MockProxy._close(writer)
+
+    @staticmethod
+    async def _close(writer: asyncio.StreamWriter) -> None:
+        if writer.is_closing():
+            return
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+class MockProxyFleet:
+    def __init__(
+        self,
+        count: int,
+        settings: MockProxySettings | None = None,
+        host: str = "127.0.0.1",
+        ports: list[int] | None = None
+    ) -> None:
+        self.settings = settings or MockProxySettings()
+        rng = random.Random(self.settings.seed)
+        ports = ports or [free_port(host) for _ in range(count)]
+        self.proxies = [
+            MockProxy(
+                host=host,
+                port=port,
+                latency=self.settings.latency,
+                jitter=self.settings.jitter,
+                failure_ratio=self.settings.failure_ratio,
+                banned=rng.random() < self.settings.ban_ratio,
+                rng=random.Random(rng.random())
+            )
+            for port in ports
+        ]
+
+    @property
+    def urls(self) -> list[str]:
+        return [proxy.url for proxy in self.proxies]
+
+    def ban(self, index: int, banned: bool = True) -> None:
+        self.proxies[index].banned = banned
+
+    def set_latency(self, index: int, latency: float) -> None:
+        self.proxies[index].latency = latency
+
+    def set_failure_ratio(self, index: int, ratio: float) -> None:
+        self.proxies[index].failure_ratio = ratio
+
+    def stats(self) -> dict[str, MockProxyStats]:
+        return {proxy.url: proxy.stats for proxy in self.proxies}
+
+    def write_accounts_file(self, path: str | Path, count: int, key_type: str = "key") -> Path:
+        return write_accounts_file(path, count, key_type, self.urls)
+
+    async def start(self) -> None:
+        await asyncio.gather(*(proxy.start() for proxy in self.proxies))
+
+    async def stop(self) -> None:
+        await asyncio.gather(*(proxy.stop() for proxy in self.proxies))
+
+    async def __aenter__(self) -> "MockProxyFleet":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+
+def serve_fleet(host: str, ports: list[int], settings: MockProxySettings) -> None:
+    async def run() -> None:
+        async with MockProxyFleet(len(ports), settings, host, ports):
+            await asyncio.Event().wait()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+class MockProxyFleetProcess:
+    def __init__(
+        self,
+        count: int,
+        settings: MockProxySettings | None = None,
+        host: str = "127.0.0.1",
+        base_port: int | None = None
+    ) -> None:
+        self.settings = settings or MockProxySettings()
+        self.host = host
+        self.ports = [
+            base_port + idx if base_port else free_port(host)
+            for idx in range(count)
+        ]
+        self._process: multiprocessing.Process | None = None
+
+    @property
+    def urls(self) -> list[str]:
+        return [f"http://{self.host}:{port}" for port in self.ports]
+
+    def start(self) -> None:
+        context = multiprocessing.get_context("spawn")
+        self._process = context.Process(
+            target=serve_fleet,
+            args=(self.host, self.ports, self.settings),
+            daemon=True
+        )
+        self._process.start()
+        for port in self.ports:
+            wait_for_port(self.host, port)
+
+    def stop(self) -> None:
+        if self._process and self._process.is_alive():
+            self._process.terminate()
+            self._process.join(timeout=5)
+        self._process = None
+
+    def __enter__(self) -> "MockProxyFleetProcess":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local fleet of mock HTTP CONNECT proxies")
+    parser.add_argument("--count", type=int, default=10)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--base-port", type=int, default=18000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--bans", type=float, default=0.0, help="share of banned proxies")
+    parser.add_argument("--failures", type=float, default=0.0, help="share of aborted connections")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--accounts-file", type=Path, help="also write a matching accounts.xlsx")
+    parser.add_argument("--accounts", type=int, default=1000)
+    args = parser.parse_args()
+
+    settings = MockProxySettings(
+        latency=args.latency,
+        jitter=args.jitter,
+        ban_ratio=args.bans,
+        failure_ratio=args.failures,
+        seed=args.seed
+    )
+    ports = [args.base_port + idx for idx in range(args.count)]
+    fleet = MockProxyFleet(args.count, settings, args.host, ports)
+
+    if args.accounts_file:
+        fleet.write_accounts_file(args.accounts_file, args.accounts)
+        print(f"Wrote {args.accounts} accounts to {args.accounts_file}")
+
+    print(f"Serving {args.count} proxies on {args.host}:{ports[0]}-{ports[-1]}")
+    serve_fleet(args.host, ports, settings)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+import argparse
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import random
+from dataclasses import asdict, dataclass
+
+from aiohttp import web
+from eth_abi import decode, encode
+
+from benchmarks.mock_api import free_port, wait_for_port
+from src.api.multicall import (
+    AGGREGATE3_SELECTOR,
+    BALANCE_OF_SELECTOR,
+    DECIMALS_SELECTOR,
+    MULTICALL3_ADDRESS,
+)
+
+MOCK_TOKEN_ADDRESS = "0x1111111111111111111111111111111111111111"
+
+
+@dataclass
+class MockRPCSettings:
+    latency: float = 0.02
+    jitter: float = 0.01
+    error_ratio: float = 0.0
+    decimals: int = 18
+    seed: int | None = None
+
+
+def balance_for(address: str) -> int:
+    digest = hashlib.blake2b(bytes.fromhex(address.removeprefix("0x").lower()), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % 10 ** 24
+
+
+def create_app(settings: MockRPCSettings) -> web.Application:
+    rng = random.Random(settings.seed)
+    stats = {"http_requests": 0, "calls": 0, "aggregated_calls": 0, "errors": 0}
+    block_number = 20_000_000
+
+    def call_token(data: bytes) -> tuple[bool, bytes]:
+        selector, args = data[:4], data[4:]
+        if selector == BALANCE_OF_SELECTOR:
+            (address,) = decode(["address"], args)
+            return True, encode(["uint256"], [balance_for(address)])
+        if selector == DECIMALS_SELECTOR:
+            return True, encode(["uint8"], [settings.decimals])
+        return False, b""
+
+    def eth_call(params: list) -> str:
+        target = params[0]["to"].lower()
+        data = bytes.fromhex(params[0]["data"].removeprefix("0x"))
+
+        if target == MULTICALL3_ADDRESS.lower() and data[:4] == AGGREGATE3_SELECTOR:
+            (calls,) = decode(["(address,bool,bytes)[]"], data[4:])
+            stats["aggregated_calls"] += len(calls)
+            results = [
+                call_token(call_data) if token.lower() == MOCK_TOKEN_ADDRESS else (False, b"")
+                for token, _, call_data in calls
+            ]
+            return "0x" + encode(["(bool,bytes)[]"], [results]).hex()
+
+        if target == MOCK_TOKEN_ADDRESS:
+            success, result = call_token(data)
+            if success:
+                return "0x" + result.hex()
+        raise ValueError("execution reverted")
+
+    def handle_call(call: dict) -> dict:
+        nonlocal block_number
+        stats["calls"] += 1
+        response = {"jsonrpc": "2.0", "id": call.get("id")}
+
+        if rng.random() < settings.error_ratio:
+            stats["errors"] += 1
+            response["error"] = {"code": -32005, "message": "limit exceeded"}
+            return response
+
+        try:
+            match call.get("method"):
+                case "eth_call":
+                    response["result"] = eth_call(call["params"])
+                case "eth_blockNumber":
+                    block_number += 1
+                    response["result"] = hex(block_number)
+                case "eth_chainId":
+                    response["result"] = "0x1"
+                case method:
+                    response["error"] = {"code": -32601, "message": f"Method {method} not found"}
+        except Exception as e:
+            response["error"] = {"code": -32000, "message": str(e)}
+        return response
+
+    async def rpc(request: web.Request) -> web.Response:
+        stats["http_requests"] += 1
+        delay = settings.latency + rng.uniform(-settings.jitter, settings.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        payload = await request.json()
+        if isinstance(payload, list):
+            return web.json_response([handle_call(call) for call in payload])
+        return web.json_response(handle_call(payload))
+
+    async def get_stats(request: web.Request) -> web.Response:
+        return web.json_response(stats)
+
+    app = web.Application(client_max_size=64 * 2 ** 20)
+    app.router.add_post("/", rpc)
+    app.router.add_get("/_stats", get_stats)
+    return app
+
+
+def serve(host: str, port: int, settings: MockRPCSettings) -> None:
+    logging.getLogger("aiohttp").setLevel(logging.CRITICAL)
+    web.run_app(create_app(settings), host=host, port=port, access_log=None, print=None)
+
+
+class MockRPCServer:
+    def __init__(
+        self,
+        settings: MockRPCSettings | None = None,
+        host: str = "127.0.0.1",
+        port: int | None = None
+    ) -> None:
+        self.settings = settings or MockRPCSettings()
+        self.host = host
+        self.port = port or free_port(host)
+        self._process: multiprocessing.Process | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self) -> None:
+        context = multiprocessing.get_context("spawn")
+        self._process = context.Process(
+            target=serve,
+            args=(self.host, self.port, self.settings),
+            daemon=True
+        )
+        self._process.start()
+        wait_for_port(self.host, self.port)
+
+    def stop(self) -> None:
+        if self._process and self._process.is_alive():
+            self._process.terminate()
+            self._process.join(timeout=5)
+        self._process = None
+
+    def __enter__(self) -> "MockRPCServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local JSON-RPC stand-in with Multicall3 support")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8545)
+    parser.add_argument("--latency", type=float, default=MockRPCSettings.latency)
+    parser.add_argument("--jitter", type=float, default=MockRPCSettings.jitter)
+    parser.add_argument("--errors", type=float, default=0.0, help="share of calls answered with an RPC error")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    settings = MockRPCSettings(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_ratio=args.errors,
+        seed=args.seed
+    )
+    print(
+        f"Serving mock JSON-RPC on http://{args.host}:{args.port}/ "
+        f"(token {MOCK_TOKEN_ADDRESS}) with {asdict(settings)}"
+    )
+    serve(args.host, args.port, settings)
+
+
+if __name__ == "__main__":
+    main()
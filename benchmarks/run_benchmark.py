@@ -0,0 +1,233 @@
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Iterator
+
+ROOT_DIR = Path(__file__).parent.parent.absolute()
+RESULTS_DIR = ROOT_DIR / "benchmarks" / "results"
+
+sys.path.insert(0, str(ROOT_DIR))
+
+from benchmarks.accounts import create_home
+from benchmarks.mock_api import MockAPIServer, MockAPISettings
+from benchmarks.mock_proxies import MockProxyFleetProcess, MockProxySettings
+from benchmarks.mock_rpc import MOCK_TOKEN_ADDRESS, MockRPCServer, MockRPCSettings
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def children_cpu_time() -> float:
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+@contextlib.contextmanager
+def silenced_stdout() -> Iterator[None]:
+    """Point file descriptor 1 at /dev/null, so spawned shard processes inherit the silence too."""
+    sys.stdout.flush()
+    saved = os.dup(1)
+    with open(os.devnull, "w") as devnull:
+        os.dup2(devnull.fileno(), 1)
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        os.dup2(saved, 1)
+        os.close(saved)
+
+
+async def run_pipeline(module: str, api_url: str, quiet: bool) -> dict:
+    from module_processor import ModuleProcessor
+    from bot_loader import progress
+    from src.api import request_tracer
+    from src.api.rpc_gateway import close_rpc_gateway
+    from src.tasks import CheckerModule
+
+    CheckerModule.BASE_URL = api_url
+    # Shards send their samples and stats back with their results, so this covers --processes too
+    request_tracer.samples = []
+
+    with silenced_stdout() if quiet else contextlib.nullcontext():
+        started = time.perf_counter()
+        cpu_started = time.process_time()
+        children_started = children_cpu_time()
+        await ModuleProcessor(module).execute()
+        elapsed = time.perf_counter() - started
+        # Sharded runs do the work in child processes, which are joined by now
+        cpu = time.process_time() - cpu_started + children_cpu_time() - children_started
+        await close_rpc_gateway()
+
+    latencies = request_tracer.samples
+    stats = request_tracer.stats.values()
+    statuses: dict[str, int] = {}
+    for proxy_stats in stats:
+        for status, count in proxy_stats.statuses.items():
+            statuses[status] = statuses.get(status, 0) + count
+    accounts = progress.processed
+    return {
+        "accounts": accounts,
+        "wall_time": elapsed,
+        "throughput": accounts / elapsed if elapsed else 0.0,
+        "requests": len(latencies),
+        "statuses": statuses,
+        "wire_bytes": sum(proxy_stats.wire_bytes for proxy_stats in stats),
+        "body_bytes": sum(proxy_stats.body_bytes for proxy_stats in stats),
+        "hedges": sum(proxy_stats.hedges for proxy_stats in stats),
+        "hedge_wins": sum(proxy_stats.hedge_wins for proxy_stats in stats),
+        "latency_p50": percentile(latencies, 0.50),
+        "latency_p99": percentile(latencies, 0.99),
+        "latency_max": max(latencies, default=0.0),
+        "cpu_time": cpu,
+        "cpu_per_account": cpu / accounts if accounts else 0.0,
+        "peak_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        # Largest finished child process, i.e. the biggest shard with --processes
+        "peak_rss_children_bytes": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * 1024,
+        "proxies": request_tracer.summary()
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline benchmark of the checker pipeline")
+    parser.add_argument("--module", choices=["checker", "sfi_balance", "hd_scan", "pipeline"], default="checker")
+    parser.add_argument("--accounts", type=int, default=1000, help="number of synthetic accounts (1k..1M)")
+    parser.add_argument("--threads", type=int, default=100)
+    parser.add_argument("--processes", type=int, default=1, help="sharded worker processes")
+    parser.add_argument("--key-type", choices=["key", "mnemonic"], default="key")
+    parser.add_argument("--latency", type=float, default=MockAPISettings.latency)
+    parser.add_argument("--jitter", type=float, default=MockAPISettings.jitter)
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="share of 429 responses")
+    parser.add_argument("--server-errors", type=float, default=0.0, help="share of 5xx responses")
+    parser.add_argument("--drops", type=float, default=0.0, help="share of dropped connections")
+    parser.add_argument("--hangs", type=float, default=0.0, help="share of responses delayed by --hang-time")
+    parser.add_argument("--hang-time", type=float, default=MockAPISettings.hang_time)
+    parser.add_argument("--hedge", action="store_true", help="enable hedged dashboard requests")
+    parser.add_argument("--rewards", type=int, default=0, help="reward history entries per dashboard response")
+    parser.add_argument("--compress", action="store_true", help="compress responses per Accept-Encoding")
+    parser.add_argument("--proxies", type=int, default=0, help="route accounts through N local mock proxies")
+    parser.add_argument("--proxy-base-port", type=int, default=18000)
+    parser.add_argument("--proxy-latency", type=float, default=0.0)
+    parser.add_argument("--proxy-bans", type=float, default=0.0, help="share of banned proxies")
+    parser.add_argument("--proxy-failures", type=float, default=0.0, help="share of aborted proxy connections")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--label", default=None, help="name of the result file")
+    parser.add_argument("--home", type=Path, default=None, help="reuse a generated config directory")
+    parser.add_argument("--quiet", action="store_true", help="suppress per-account console logs")
+    args = parser.parse_args()
+
+    settings = MockAPISettings(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit_ratio=args.rate_limit,
+        server_error_ratio=args.server_errors,
+        drop_ratio=args.drops,
+        hang_ratio=args.hangs,
+        hang_time=args.hang_time,
+        rewards=args.rewards,
+        compress=args.compress,
+        seed=args.seed
+    )
+
+    proxy_settings = MockProxySettings(
+        latency=args.proxy_latency,
+        ban_ratio=args.proxy_bans,
+        failure_ratio=args.proxy_failures,
+        seed=args.seed
+    )
+    fleet = (
+        MockProxyFleetProcess(args.proxies, proxy_settings, base_port=args.proxy_base_port)
+        if args.proxies
+        else None
+    )
+
+    rpc = MockRPCServer(MockRPCSettings(latency=args.latency, jitter=args.jitter, seed=args.seed))
+    extra_settings = (
+        "onchain:\n"
+        f"    rpc_urls: [\"{rpc.url}\"]\n"
+        f"    token_address: \"{MOCK_TOKEN_ADDRESS}\"\n"
+    )
+    if args.hedge:
+        extra_settings += "hedging:\n    enabled: true\n"
+
+    home = args.home or Path(tempfile.mkdtemp(prefix="sfi-bench-"))
+    if not (home / "config" / "data" / "client" / "accounts.xlsx").exists():
+        print(f"Generating {args.accounts} accounts in {home}")
+        create_home(
+            home, args.accounts, args.threads, args.key_type,
+            fleet.urls if fleet else None, args.processes, extra_settings
+        )
+    os.environ["SFI_CHECKER_HOME"] = str(home)
+
+    with (
+        MockAPIServer(settings) as server,
+        fleet or contextlib.nullcontext(),
+        rpc if args.module in ("sfi_balance", "pipeline") else contextlib.nullcontext()
+    ):
+        metrics = asyncio.run(run_pipeline(args.module, server.url, args.quiet))
+
+    label = args.label or f"{args.module}_{args.accounts}_{time.strftime('%Y%m%d_%H%M%S')}"
+    result = {
+        "label": label,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            "module": args.module,
+            "accounts": args.accounts,
+            "threads": args.threads,
+            "processes": args.processes,
+            "key_type": args.key_type,
+            "server": asdict(settings),
+            "proxies": args.proxies,
+            "hedge": args.hedge,
+            "proxy": asdict(proxy_settings) if fleet else None
+        },
+        "metrics": metrics
+    }
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    output = RESULTS_DIR / f"{label}.json"
+    output.write_text(json.dumps(result, indent=2), encoding="utf-8")
+
+    from src.api.tracing import format_bytes
+
+    print(
+        f"{metrics['accounts']} accounts in {metrics['wall_time']:.2f}s "
+        f"({metrics['throughput']:.1f}/s) | p50 {metrics['latency_p50'] * 1000:.1f}ms "
+        f"p99 {metrics['latency_p99'] * 1000:.1f}ms | "
+        f"CPU/account {metrics['cpu_per_account'] * 1000:.2f}ms | "
+        f"peak RSS {metrics['peak_rss_bytes'] / 2 ** 20:.1f} MiB"
+        + (f" (shard {metrics['peak_rss_children_bytes'] / 2 ** 20:.1f} MiB)" if args.processes > 1 else "")
+        + " | "
+        f"wire {format_bytes(metrics['wire_bytes'])} body {format_bytes(metrics['body_bytes'])}"
+        + (f" | hedged {metrics['hedges']} won {metrics['hedge_wins']}" if metrics["hedges"] else "")
+    )
+    print(f"Results saved to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,55 +1,55 @@
-import asyncio
-from typing import Callable
+import contextlib
+import time
+from typing import Any, Callable
 
+from src.api import request_tracer
 from src.console import Console
 from src.task_manager import TaskManager
 from src.logger import AsyncLogger
-from src.models import Account
-from src.utils import get_address, random_sleep
-from bot_loader import config, progress, semaphore
+from src.models import Account, proxy_keys
+from src.daemon import CheckerDaemon
+from src.distributed import Coordinator
+from src.scheduler import LiveSchedule, StartPlanner, dispatch
+from src.settings_watcher import SettingsWatcher
+from src.sharding import ShardedRunner
+from src.shutdown import shutdown_controller
+from src.utils import get_address, prime_derivation_index
+from src.utils.profiler import PipelineProfiler
+from bot_loader import config, progress
 
 
-async def process_execution(account: Account, process_func: Callable) -> tuple[bool, str]:
+async def process_execution(account: Account, process_func: Callable) -> tuple[bool, Any]:
     logger = AsyncLogger()
 
-    address = get_address(account.mnemonic)
-    
-    async with semaphore:
-        try:
-            if config.delay_before_start.min > 0:
-                await random_sleep(
-                    address, config.delay_before_start.min, config.delay_before_start.max
-                )
-            result = await process_func(account)
-            success = (
-                result[0]
-                if isinstance(result, tuple) and len(result) == 2
-                else bool(result)
-            )
-            message = (
-                result[1]
-                if isinstance(result, tuple) and len(result) == 2
-                else (
-                    "Completed successfully" if success else "Execution failed"
-                )
-            )
-            return success, message
-        except Exception as e:
-            await logger.logger_msg(
-                f"Error: {str(e)}",
-                address=address,
-                type_msg="error", 
-                method_name="process_execution"
-            )
-            return False, str(e)
+    try:
+        result = await process_func(account)
+        if isinstance(result, tuple) and len(result) == 2:
+            return result
+        return bool(result), result if result else "Execution failed"
+    except Exception as e:
+        await logger.logger_msg(
+            f"Error: {str(e)}",
+            address=get_address(account.mnemonic),
+            type_msg="error", 
+            method_name="process_execution"
+        )
+        return False, str(e)
 
 
 class ModuleProcessor(AsyncLogger):
-    __slots__ = ("console", "module_functions")
+    __slots__ = ("console", "module", "coordinator", "daemon", "module_functions")
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        module: str | None = None,
+        coordinator: bool = False,
+        daemon: bool = False
+    ) -> None:
         super().__init__()
         self.console = Console()
+        self.module = module
+        self.coordinator = coordinator
+        self.daemon = daemon
         
         self.module_functions: dict[str, Callable] = {}
         
@@ -73,8 +73,58 @@ class ModuleProcessor(AsyncLogger):
                 method_name="process_view_statistics"
             )
 
+    async def run_accounts(self, module: str, process_account: Callable) -> list[tuple[bool, Any]]:
+        results: list[tuple[bool, Any]] = [(False, "Not started")] * len(config.accounts)
+        sink = TaskManager.create_sink(module, config.report)
+        TaskManager.disable_inplace_writes()
+
+        async def handle(item: tuple[int, Account]) -> None:
+            idx, account = item
+            started = time.perf_counter()
+            results[idx] = await process_account(account)
+            await sink.add(
+                account.mnemonic, get_address(account.mnemonic), *results[idx],
+                time.perf_counter() - started
+            )
+
+        try:
+            planner = StartPlanner.from_config(config)
+            keys = proxy_keys(config.accounts)
+            live = LiveSchedule.from_config(config, planner)
+            async with (
+                TaskManager.shared_clients(module, config.accounts, config.warmup),
+                SettingsWatcher(live, config.reload).watch()
+            ):
+                await dispatch(
+                    [(idx, config.accounts[idx]) for idx in planner.arrange(keys)],
+                    planner.plan(len(config.accounts)),
+                    config.threads,
+                    handle,
+                    on_start=lambda item, waited: request_tracer.record_slot_wait(item[1].proxy, waited),
+                    key=lambda item: keys[item[0]],
+                    per_key_limit=planner.per_proxy_limit,
+                    stop=shutdown_controller.event,
+                    grace=shutdown_controller.grace,
+                    live=live
+                )
+        finally:
+            await sink.close()
+        return results
+
+    async def log_trace_summary(self) -> None:
+        summary = request_tracer.summary()
+        if not summary:
+            return
+        
+        await self.logger_msg("Request timings per proxy:", type_msg="info")
+        for line in summary:
+            await self.logger_msg(line, type_msg="info")
+
     async def execute(self) -> bool:
-        self.console.build()
+        if self.module:
+            config.module = self.module
+        else:
+            self.console.build()
         
         match config.module:
             case "exit":
@@ -85,32 +135,49 @@ class ModuleProcessor(AsyncLogger):
                 return False
             case module if module in self.module_functions:
                 async def process_account(account): 
-                    success, message = await process_execution(account, self.module_functions[module])
+                    success, data = await process_execution(account, self.module_functions[module])
                     progress.increment()
                     await self.logger_msg(
                         f"Processed accounts: {progress.processed}/{progress.total}",
                         type_msg="info"
                     )
-                    return success, message
+                    return success, data
                     
-                tasks = []
-                batch_size = config.threads
-                for i in range(0, len(config.accounts), batch_size):
-                    batch = config.accounts[i : i + batch_size]
+                profiler = (
+                    PipelineProfiler(config.profiling, module)
+                    if config.profiling.enabled
+                    else contextlib.nullcontext()
+                )
+                async with shutdown_controller.guard(config.shutdown):
+                    await prime_derivation_index(
+                        (account.mnemonic for account in config.accounts), config.processes,
+                        shutdown_controller.event
+                    )
+                    if self.daemon:
+                        await CheckerDaemon(module, config, progress).run()
+                        return True
+
+                    async with profiler:
+                        request_tracer.reset()
+                        if self.coordinator:
+                            results = await Coordinator(module, config, progress).run()
+                        elif config.processes > 1:
+                            results = await ShardedRunner(module, config, progress).run()
+                        else:
+                            results = await self.run_accounts(module, process_account)
                     
-                    async with asyncio.TaskGroup() as tg:
-                        for account in batch:
-                            tasks.append(tg.create_task(process_account(account)))
-                            
-                    if i + batch_size < len(config.accounts):
-                        await asyncio.sleep(0.5)
+                        success_count = sum(1 for success, _ in results if success)
+                        await self.logger_msg(f"Results of {module}:", type_msg="info")
+                        await self.logger_msg(f"✅ Success: {success_count}/{len(results)}", type_msg="info")
+                        await self.logger_msg(f"❌ Failed: {len(results) - success_count}/{len(results)}", type_msg="info")
+                        if shutdown_controller.stopping:
+                            await self.logger_msg(
+                                f"⏹ Stopped early: {progress.total - progress.processed} accounts were not checked",
+                                type_msg="warning"
+                            )
+                        await self.log_trace_summary()
                 
-                success_count = sum(1 for task in tasks if task.result()[0])
-                await self.logger_msg(f"Results of {module}:", type_msg="info")
-                await self.logger_msg(f"✅ Success: {success_count}/{len(tasks)}", type_msg="info")
-                await self.logger_msg(f"❌ Failed: {len(tasks) - success_count}/{len(tasks)}", type_msg="info")
-                
-                return False
+                return shutdown_controller.stopping
             case _:
                 await self.logger_msg(
                     f"Module {config.module} is not implemented!", 
@@ -1,49 +1,137 @@
+import argparse
 import asyncio
 import os
 import sys
 
-from bot_loader import progress
-from module_processor import ModuleProcessor
 from src.logger import AsyncLogger
 
 
-async def main_loop() -> None:
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="SFI Checker")
+    parser.add_argument(
+        "--module",
+        help="run a single module (e.g. checker) without the interactive menu and exit"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="profile the run and write a report to logs/"
+    )
+    role = parser.add_mutually_exclusive_group()
+    role.add_argument(
+        "--coordinator",
+        action="store_true",
+        help="serve account leases to distributed workers instead of checking locally"
+    )
+    role.add_argument(
+        "--daemon",
+        action="store_true",
+        help="keep running and recheck all accounts every daemon.interval seconds"
+    )
+    role.add_argument(
+        "--serve",
+        action="store_true",
+        help="serve on-demand points lookups over HTTP (see service in settings.yaml)"
+    )
+    role.add_argument(
+        "--worker",
+        metavar="URL",
+        help="process account leases from the coordinator at URL"
+    )
+    return parser.parse_args()
+
+
+async def main_loop(
+    module: str | None = None,
+    coordinator: bool = False,
+    daemon: bool = False
+) -> None:
+    from bot_loader import progress
+    from module_processor import ModuleProcessor
+
     logger = AsyncLogger()
     await logger.logger_msg("✅ Program start", type_msg="info")
 
-    while True:
-        progress.reset()
-        try:
-            exit_flag = await ModuleProcessor().execute()
-            if exit_flag:
+    try:
+        while True:
+            progress.reset()
+            try:
+                exit_flag = await ModuleProcessor(module, coordinator, daemon).execute()
+                if exit_flag or module:
+                    break
+            except KeyboardInterrupt:
+                await logger.logger_msg("🚨 Manual interruption!", type_msg="warning", method_name="main_loop")
+                break
+            except asyncio.CancelledError:
                 break
-        except KeyboardInterrupt:
-            await logger.logger_msg("🚨 Manual interruption!", type_msg="warning", method_name="main_loop")
-            break
-        except asyncio.CancelledError:
-            break
-
-        input("\nPress Enter to return to menu...")
-        os.system("cls" if os.name == "nt" else "clear")
 
+            input("\nPress Enter to return to menu...")
+            os.system("cls" if os.name == "nt" else "clear")
+    finally:
+        await shutdown()
     await logger.logger_msg("👋 Goodbye! Terminal is ready for commands.", type_msg="info")
 
-async def shutdown(loop):
-    tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
-    
-    for task in tasks:
-        task.cancel()
-    
-    await asyncio.gather(*tasks, return_exceptions=True)
-    loop.stop()
+async def worker_loop(coordinator_url: str) -> None:
+    from src.distributed import DistributedWorker
+    from src.shutdown import shutdown_controller
+    from src.utils import load_settings
+
+    logger = AsyncLogger()
+    try:
+        settings = load_settings()
+        async with shutdown_controller.guard(settings.shutdown):
+            await DistributedWorker(coordinator_url, settings).run()
+    except Exception as e:
+        await logger.logger_msg(
+            f"Worker stopped: {str(e)}", type_msg="error", method_name="worker_loop"
+        )
+    finally:
+        await shutdown()
+
+async def serve_loop() -> None:
+    from bot_loader import config
+    from src.service import PointsService
+    from src.shutdown import shutdown_controller
+
+    logger = AsyncLogger()
+    try:
+        async with shutdown_controller.guard(config.shutdown):
+            await PointsService(config).run()
+    except Exception as e:
+        await logger.logger_msg(
+            f"Service stopped: {str(e)}", type_msg="error", method_name="serve_loop"
+        )
+    finally:
+        await shutdown()
+
+async def shutdown() -> None:
+    """Release process-wide resources however the entrypoint ended; results are flushed by the runners."""
+    from src.api.rpc_gateway import close_rpc_gateway
+    from src.utils import close_derivation_index
+
+    await close_rpc_gateway()
+    close_derivation_index()
 
 if __name__ == "__main__":
+    args = parse_args()
+    if args.worker:
+        entrypoint = worker_loop(args.worker)
+    elif args.serve:
+        entrypoint = serve_loop()
+    else:
+        from bot_loader import config
+
+        if args.profile:
+            config.profiling = config.profiling.model_copy(update={"enabled": True})
+        module = args.module or ("checker" if args.coordinator or args.daemon else None)
+        entrypoint = main_loop(module, args.coordinator, args.daemon)
+
     if sys.platform == "win32":
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
     
     try:
-        asyncio.run(main_loop())
-    except KeyboardInterrupt:
+        asyncio.run(entrypoint)
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print("\n\n🚨 Program stopped. Terminal is ready for commands.")
     finally:
         if sys.platform != "win32":
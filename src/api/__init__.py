@@ -1 +1,3 @@
-from .base_client import BaseAPIClient
\ No newline at end of file
+from .base_client import BaseAPIClient
+from .client_pool import ClientPool
+from .tracing import RequestTiming, RequestTracer, request_tracer
\ No newline at end of file
@@ -1,17 +1,27 @@
 import asyncio
 import random
+import time
 import orjson
 import ssl as ssl_module
 from types import TracebackType
-from typing import Literal, Any, Self, Type
+from typing import TYPE_CHECKING, Callable, Literal, Any, Mapping, Self, Type
 
 import aiohttp
-import ua_generator
+from multidict import CIMultiDictProxy
 from yarl import URL
 from better_proxy import Proxy
 
-from src.exceptions.custom_exceptions import APIError, ServerError, SessionRateLimited
+from src.exceptions.custom_exceptions import APIError, ResponseTooLarge, ServerError, SessionRateLimited
 from src.logger import AsyncLogger
+from .compression import decode_body
+from .dns import get_resolver
+from .fingerprints import get_fingerprint_pool
+from .hedging import Hedger, get_hedger
+from .timeouts import AdaptiveTimeouts, get_adaptive_timeouts
+from .tracing import RequestTiming, RequestTracer, request_tracer
+
+if TYPE_CHECKING:
+    from .client_pool import ClientPool
 
 
 class HttpStatusError(APIError):
@@ -20,6 +30,9 @@ class HttpStatusError(APIError):
         self.status_code: int = status_code
         
 
+ResponseMode = Literal["auto", "json", "bytes", "text"]
+
+
 class BaseAPIClient(AsyncLogger):
     RETRYABLE_ERRORS = (
         ServerError, 
@@ -28,46 +41,56 @@ class BaseAPIClient(AsyncLogger):
         asyncio.TimeoutError,
         HttpStatusError
     )
+    _SSL_CONTEXT: ssl_module.SSLContext | None = None
     
     def __init__(
         self, 
         base_url: str, 
-        proxy: Proxy | None = None
+        proxy: Proxy | None = None,
+        tracer: RequestTracer | None = None,
+        connection_limit: int = 10,
+        timeouts: AdaptiveTimeouts | None = None,
+        hedger: Hedger | None = None,
+        ssl_context: ssl_module.SSLContext | None = None,
+        trace_key: str | None = None
     ) -> None:
         super().__init__()
         self.base_url: str = base_url
         self.proxy: Proxy | None = proxy
+        self.tracer: RequestTracer = tracer or request_tracer
+        # Non-dashboard traffic (RPC, coordinator) is traced apart from the direct connection
+        self.trace_key: str | None = trace_key
+        self.timeouts: AdaptiveTimeouts = timeouts or get_adaptive_timeouts()
+        self.hedger: Hedger = hedger or get_hedger()
+        self.pool: ClientPool | None = None
+        self.connection_limit: int = connection_limit
         self.session: aiohttp.ClientSession | None = None
         self._lock: asyncio.Lock = asyncio.Lock()
         self._session_active: bool = False
-        self._headers: dict[str, str | bool | list[str]] = self._generate_headers()
-        self._ssl_context: ssl_module.SSLContext = ssl_module.create_default_context()
+        self._headers: CIMultiDictProxy[str] = get_fingerprint_pool().for_proxy(proxy).headers
+        self._ssl_context: ssl_module.SSLContext = ssl_context or self._shared_ssl_context()
         self._connector: aiohttp.TCPConnector = self._create_connector()
         
-    @staticmethod
-    def _generate_headers() -> dict[str, str | bool | list[str]]:
-        user_agent = ua_generator.generate(
-            device='desktop', 
-            platform='windows', 
-            browser='chrome'
-        )
-        
-        return {
-            'accept-language': 'en-US;q=0.9,en;q=0.8',
-            'sec-ch-ua': user_agent.ch.brands,
-            'sec-ch-ua-mobile': user_agent.ch.mobile,
-            'sec-ch-ua-platform': user_agent.ch.platform,
-            'user-agent': user_agent.text
-        }
-    
+    @classmethod
+    def _shared_ssl_context(cls) -> ssl_module.SSLContext:
+        if cls._SSL_CONTEXT is None:
+            cls._SSL_CONTEXT = ssl_module.create_default_context()
+        return cls._SSL_CONTEXT
+
     def _create_connector(self) -> aiohttp.TCPConnector:
         return aiohttp.TCPConnector(
             enable_cleanup_closed=True,
             force_close=False,
             ssl=self._ssl_context,
-            limit=10
+            limit=self.connection_limit,
+            resolver=get_resolver(),
+            use_dns_cache=False
         )
 
+    @property
+    def address_family(self) -> int:
+        return self._connector.family
+
     async def _get_session(self) -> aiohttp.ClientSession:
         async with self._lock:
             if self.session is None or self.session.closed:
@@ -78,8 +101,11 @@ class BaseAPIClient(AsyncLogger):
                 )
                 self.session = aiohttp.ClientSession(
                     connector=self._connector,
-                    timeout=aiohttp.ClientTimeout(total=120),
-                    headers=self._headers
+                    connector_owner=False,
+                    auto_decompress=False,
+                    timeout=self.timeouts.default,
+                    headers=self._headers,
+                    trace_configs=[self.tracer.trace_config]
                 )
             return self.session
 
@@ -119,27 +145,73 @@ class BaseAPIClient(AsyncLogger):
         
         if self._connector and not self._connector.closed:
             await self._connector.close()
+
+    @staticmethod
+    async def _read_body(response: aiohttp.ClientResponse, max_body_size: int | None) -> bytes:
+        if max_body_size is None:
+            return await response.read()
+        
+        if (response.content_length or 0) > max_body_size:
+            raise ResponseTooLarge(
+                f"Response body of {response.content_length} bytes exceeds {max_body_size} bytes"
+            )
+        
+        body = bytearray()
+        async for chunk in response.content.iter_any():
+            body += chunk
+            if len(body) > max_body_size:
+                raise ResponseTooLarge(f"Response body exceeds {max_body_size} bytes")
+        return bytes(body)
+
+    @staticmethod
+    async def _backoff(delay: float, timing: RequestTiming) -> None:
+        started = time.perf_counter()
+        await asyncio.sleep(delay)
+        timing.backoff += time.perf_counter() - started
             
     async def send_request(
         self,
         request_type: Literal["POST", "GET", "PUT", "OPTIONS"] = "POST",
         method: str | None = None,
-        json_data: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | list[Any] | None = None,
         data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
         url: str | None = None,
-        headers: dict[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
         cookies: dict[str, str] | None = None,
         verify: bool = True,
         allow_redirects: bool = True,
         ssl: bool | ssl_module.SSLContext = True,
         max_retries: int = 3,
         retry_delay: tuple[float, float] = (1.5, 5.0),
-        user_agent: str | None = None
+        user_agent: str | None = None,
+        response_mode: ResponseMode = "auto",
+        max_body_size: int | None = None,
+        extract: Callable[[Any], Any] | None = None,
+        hedge: bool = False
     ) -> dict[str, Any] | str:
         
         if not url and not method:
             raise ValueError("Either url or method must be provided")
+
+        if hedge and request_type == "GET" and self.hedger.enabled:
+            return await self.hedger.send(self, dict(
+                request_type=request_type,
+                method=method,
+                params=params,
+                url=url,
+                headers=headers,
+                cookies=cookies,
+                verify=verify,
+                allow_redirects=allow_redirects,
+                ssl=ssl,
+                max_retries=max_retries,
+                retry_delay=retry_delay,
+                user_agent=user_agent,
+                response_mode=response_mode,
+                max_body_size=max_body_size,
+                extract=extract
+            ))
         
         if url:
             try:
@@ -147,16 +219,19 @@ class BaseAPIClient(AsyncLogger):
                 if parsed_url.scheme == 'https' and parsed_url.port == 80:
                     parsed_url = parsed_url.with_port(None)
                 target_url = str(parsed_url)
+                host = parsed_url.host or ''
             except:
                 target_url = url
+                host = ''
         else:
             base = URL(self.base_url)
             method_path = method.lstrip('/') if method else ''
             target_url = str(base / method_path)
+            host = base.host or ''
             
-        custom_headers = dict(headers) if headers else {}
+        request_headers = headers
         if user_agent:
-            custom_headers['user-agent'] = user_agent
+            request_headers = {**(headers or {}), 'user-agent': user_agent}
             
         ssl_param = True
         if isinstance(ssl, bool):
@@ -164,134 +239,164 @@ class BaseAPIClient(AsyncLogger):
         elif isinstance(ssl, ssl_module.SSLContext):
             ssl_param = ssl
 
-        for attempt in range(1, max_retries + 1):
-            try:
-                session = await self._get_session()
-                
-                if not await self._check_session_valid():
-                    await self.logger_msg(
-                        msg="Session was closed, recreating...", 
-                        type_msg="debug", 
-                        method_name="send_request"
-                    )
+        timing = self.tracer.start(self.proxy, target_url, self.trace_key)
+        try:
+            for attempt in range(1, max_retries + 1):
+                try:
                     session = await self._get_session()
                 
-                merged_headers = dict(session.headers)
-                if custom_headers:
-                    merged_headers.update(custom_headers)
-        
-                try:
-                    async with session.request(
-                        method=request_type,
-                        url=target_url,
-                        json=json_data,
-                        data=data,
-                        params=params,
-                        headers=merged_headers,
-                        cookies=cookies,
-                        proxy=self.proxy.as_url if self.proxy else None,
-                        ssl=ssl_param,
-                        allow_redirects=allow_redirects,
-                        raise_for_status=False
-                    ) as response:
-                        content_type = response.headers.get('Content-Type', '').lower()
-                        status_code = response.status
+                    if not await self._check_session_valid():
+                        await self.logger_msg(
+                            msg="Session was closed, recreating...", 
+                            type_msg="debug", 
+                            method_name="send_request"
+                        )
+                        session = await self._get_session()
+                
+                    timeout = self.timeouts.timeout_for(timing.proxy, host)
+                    try:
+                        async with session.request(
+                            method=request_type,
+                            url=target_url,
+                            json=json_data,
+                            data=data,
+                            params=params,
+                            headers=request_headers,
+                            cookies=cookies,
+                            proxy=self.proxy.as_url if self.proxy else None,
+                            ssl=ssl_param,
+                            allow_redirects=allow_redirects,
+                            raise_for_status=False,
+                            timeout=timeout,
+                            trace_request_ctx=timing
+                        ) as response:
+                            content_type = response.headers.get('Content-Type', '').lower()
+                            status_code = response.status
                         
-                        text = await response.text()
-                        result = {
-                            "status_code": status_code,
-                            "url": str(response.url),
-                            "text": text,
-                            "data": None
-                        }
+                            body_started = time.perf_counter()
+                            raw_body = await self._read_body(response, max_body_size)
+                            body = decode_body(
+                                raw_body, response.headers.get('Content-Encoding', ''), max_body_size
+                            )
+                            timing.transfer += time.perf_counter() - body_started
+                            timing.wire_bytes += len(raw_body)
+                            timing.body_bytes += len(body)
+                            timing.status = status_code
+                            result = {
+                                "status_code": status_code,
+                                "url": str(response.url),
+                                "text": None,
+                                "data": None
+                            }
                         
-                        try:
-                            if text and ('application/json' in content_type or 'json' in content_type or text.strip().startswith('{')):
-                                result["data"] = orjson.loads(text)
-                        except orjson.JSONDecodeError:
-                            pass
+                            if response_mode == "bytes":
+                                result["content"] = body
+                            elif response_mode == "json":
+                                try:
+                                    result["data"] = orjson.loads(body) if body else None
+                                except orjson.JSONDecodeError:
+                                    result["text"] = body.decode(response.charset or 'utf-8', errors='replace')
+                            else:
+                                text = body.decode(response.charset or 'utf-8')
+                                result["text"] = text
+                                try:
+                                    if response_mode == "auto" and text and ('json' in content_type or text.strip().startswith('{')):
+                                        result["data"] = orjson.loads(text)
+                                except orjson.JSONDecodeError:
+                                    pass
+                            
+                            if extract is not None and result["data"] is not None and status_code < 400:
+                                result["data"] = extract(result["data"])
                             
-                        if verify:
-                            if status_code == 429:
-                                raise SessionRateLimited(f"Too many requests: {status_code}", result)
-                            elif 400 <= status_code < 500:
-                                raise HttpStatusError(f"Client error: {status_code}", status_code, result)
-                            elif status_code >= 500:
-                                raise ServerError(f"Server error: {status_code}", result)
+                            if verify:
+                                if status_code == 429:
+                                    raise SessionRateLimited(f"Too many requests: {status_code}", result)
+                                elif 400 <= status_code < 500:
+                                    raise HttpStatusError(f"Client error: {status_code}", status_code, result)
+                                elif status_code >= 500:
+                                    raise ServerError(f"Server error: {status_code}", result)
                         
-                        return result
+                            return result
                         
-                except aiohttp.ClientConnectorError as e:
+                    except aiohttp.ClientConnectorError as e:
+                        await self.logger_msg(
+                            msg=f"Connection error: {e}", 
+                            type_msg="error", 
+                            method_name="send_request"
+                        )
+                        raise
+
+                except ResponseTooLarge:
+                    raise
+
+                except (aiohttp.ClientOSError, aiohttp.ServerDisconnectedError) as e:
                     await self.logger_msg(
-                        msg=f"Connection error: {e}", 
-                        type_msg="error", 
+                        msg=f"Connection disrupted: {e}. Resetting session", 
+                        type_msg="warning", 
                         method_name="send_request"
                     )
-                    raise
-
-            except (aiohttp.ClientOSError, aiohttp.ServerDisconnectedError) as e:
-                await self.logger_msg(
-                    msg=f"Connection disrupted: {e}. Resetting session", 
-                    type_msg="warning", 
-                    method_name="send_request"
-                )
                 
-                if self.session and not self.session.closed:
-                    await self._safely_close_session(self.session)
-                    self.session = None
+                    if self.session and not self.session.closed:
+                        await self._safely_close_session(self.session)
+                        self.session = None
                 
-                if attempt < max_retries:
-                    delay = random.uniform(*retry_delay) * min(2 ** (attempt - 1), 30)
-                    await asyncio.sleep(delay)
-                    continue
-                raise
+                    if attempt < max_retries:
+                        delay = random.uniform(*retry_delay) * min(2 ** (attempt - 1), 30)
+                        await self._backoff(delay, timing)
+                        continue
+                    raise
 
-            except self.RETRYABLE_ERRORS as error:
-                if isinstance(error, HttpStatusError) and getattr(error, 'status_code', 0) != 429:
-                    raise error
+                except self.RETRYABLE_ERRORS as error:
+                    if isinstance(error, HttpStatusError) and getattr(error, 'status_code', 0) != 429:
+                        raise error
                 
-                if attempt < max_retries:
-                    delay = random.uniform(*retry_delay) * min(2 ** (attempt - 1), 30)
+                    if attempt < max_retries:
+                        delay = random.uniform(*retry_delay) * min(2 ** (attempt - 1), 30)
                     
-                    if isinstance(error, SessionRateLimited):
-                        await self.logger_msg(
-                            msg=f"Rate limit error. Retry {attempt}/{max_retries} in {delay:.2f} seconds", 
-                            type_msg="debug", 
-                            method_name="send_request"
-                        )
-                    else:
-                        await self.logger_msg(
-                            msg=f"Error {type(error).__name__}: {error}. Retry {attempt}/{max_retries} after {delay:.2f} seconds", 
-                            type_msg="debug", 
-                            method_name="send_request"
-                        )
+                        if isinstance(error, SessionRateLimited):
+                            await self.logger_msg(
+                                msg=f"Rate limit error. Retry {attempt}/{max_retries} in {delay:.2f} seconds", 
+                                type_msg="debug", 
+                                method_name="send_request"
+                            )
+                        else:
+                            await self.logger_msg(
+                                msg=f"Error {type(error).__name__}: {error}. Retry {attempt}/{max_retries} after {delay:.2f} seconds", 
+                                type_msg="debug", 
+                                method_name="send_request"
+                            )
                     
-                    await asyncio.sleep(delay)
-                    continue
+                        await self._backoff(delay, timing)
+                        continue
                 
-                raise ServerError(
-                    f"The request failed after {max_retries} attempts to {target_url}. Error {error}"
-                ) from error
+                    raise ServerError(
+                        f"The request failed after {max_retries} attempts to {target_url}. Error {error}"
+                    ) from error
                     
-            except Exception as error:
-                await self.logger_msg(
-                    msg=f"Unexpected error when querying to {target_url}: {type(error).__name__}: {error}", 
-                    type_msg="error", 
-                    method_name="send_request"
-                )
+                except Exception as error:
+                    await self.logger_msg(
+                        msg=f"Unexpected error when querying to {target_url}: {type(error).__name__}: {error}", 
+                        type_msg="error", 
+                        method_name="send_request"
+                    )
                 
-                if attempt < max_retries:
-                    delay = random.uniform(*retry_delay) * min(2 ** (attempt - 1), 30)
+                    if attempt < max_retries:
+                        delay = random.uniform(*retry_delay) * min(2 ** (attempt - 1), 30)
                     
-                    if self.session and not self.session.closed:
-                        await self._safely_close_session(self.session)
-                        self.session = None
+                        if self.session and not self.session.closed:
+                            await self._safely_close_session(self.session)
+                            self.session = None
                         
-                    await asyncio.sleep(delay)
-                    continue
+                        await self._backoff(delay, timing)
+                        continue
                 
-                raise ServerError(
-                    f"The request failed after {max_retries} attempts to {target_url}"
-                ) from error
+                    raise ServerError(
+                        f"The request failed after {max_retries} attempts to {target_url}"
+                    ) from error
 
-        raise ServerError(f"Unreachable code: all {max_retries} attempts have been exhausted")
\ No newline at end of file
+            raise ServerError(f"Unreachable code: all {max_retries} attempts have been exhausted")
+        except BaseException as error:
+            timing.error = type(error).__name__
+            raise
+        finally:
+            self.tracer.finish(timing)
@@ -0,0 +1,33 @@
+from better_proxy import Proxy
+
+from .base_client import BaseAPIClient
+
+
+class ClientPool:
+    def __init__(self, base_url: str, connection_limit: int = 10) -> None:
+        self.base_url = base_url
+        self.connection_limit = connection_limit
+        self._clients: dict[str, BaseAPIClient] = {}
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def clients(self) -> list[BaseAPIClient]:
+        return list(self._clients.values())
+
+    def get(self, proxy: Proxy | None) -> BaseAPIClient:
+        key = proxy.as_url if proxy else ""
+        client = self._clients.get(key)
+        if client is None:
+            client = self._clients[key] = BaseAPIClient(
+                base_url=self.base_url,
+                proxy=proxy,
+                connection_limit=self.connection_limit
+            )
+            client.pool = self
+        return client
+
+    async def close(self) -> None:
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.__aexit__(None, None, None)
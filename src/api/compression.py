@@ -0,0 +1,116 @@
+import zlib
+from typing import Callable
+
+from src.exceptions.custom_exceptions import ResponseTooLarge
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+try:
+    from compression import zstd
+except ImportError:
+    try:
+        from backports import zstd
+    except ImportError:
+        zstd = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def _inflate(body: bytes, limit: int, wbits: int) -> bytes:
+    decompressor = zlib.decompressobj(wbits)
+    data = decompressor.decompress(body, limit + 1 if limit else 0)
+    if not limit:
+        data += decompressor.flush()
+    return data
+
+
+def _decode_gzip(body: bytes, limit: int) -> bytes:
+    return _inflate(body, limit, zlib.MAX_WBITS | 16)
+
+
+def _decode_deflate(body: bytes, limit: int) -> bytes:
+    try:
+        return _inflate(body, limit, zlib.MAX_WBITS)
+    except zlib.error:
+        return _inflate(body, limit, -zlib.MAX_WBITS)
+
+
+def _decode_zstd(body: bytes, limit: int) -> bytes:
+    if not limit:
+        return zstd.decompress(body)
+    return zstd.ZstdDecompressor().decompress(body, max_length=limit + 1)
+
+
+def _decode_zstandard(body: bytes, limit: int) -> bytes:
+    if not limit:
+        return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+    chunks = []
+    size = 0
+    with zstandard.ZstdDecompressor().stream_reader(body) as reader:
+        while size <= limit:
+            chunk = reader.read(limit + 1 - size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+    return b"".join(chunks)
+
+
+def _decode_br(body: bytes, limit: int) -> bytes:
+    decompressor = brotli.Decompressor()
+    if not limit:
+        return decompressor.process(body)
+    return decompressor.process(body, output_buffer_limit=limit + 1)
+
+
+def _brotli_bounded() -> bool:
+    # output_buffer_limit appeared in brotli 1.2; older builds cannot stop at the body cap
+    try:
+        brotli.Decompressor().process(b"", output_buffer_limit=1)
+    except TypeError:
+        return False
+    except Exception:
+        pass
+    return True
+
+
+DECODERS: dict[str, Callable[[bytes, int], bytes]] = {}
+
+if zstd is not None:
+    DECODERS["zstd"] = _decode_zstd
+elif zstandard is not None:
+    DECODERS["zstd"] = _decode_zstandard
+
+if brotli is not None and _brotli_bounded():
+    DECODERS["br"] = _decode_br
+
+DECODERS["gzip"] = _decode_gzip
+DECODERS["x-gzip"] = _decode_gzip
+DECODERS["deflate"] = _decode_deflate
+
+ACCEPT_ENCODING = ", ".join(encoding for encoding in ("zstd", "br", "gzip", "deflate") if encoding in DECODERS)
+
+
+def decode_body(body: bytes, content_encoding: str, max_size: int | None = None) -> bytes:
+    encodings = [
+        encoding.strip().lower()
+        for encoding in content_encoding.split(",")
+        if encoding.strip() and encoding.strip().lower() != "identity"
+    ]
+    for encoding in reversed(encodings):
+        decoder = DECODERS.get(encoding)
+        if decoder is None:
+            raise ValueError(f"Unsupported content encoding: {encoding}")
+        body = decoder(body, max_size or 0)
+        if max_size is not None and len(body) > max_size:
+            raise ResponseTooLarge(f"Decoded response body exceeds {max_size} bytes")
+    return body
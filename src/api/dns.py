@@ -0,0 +1,54 @@
+import asyncio
+import socket
+import time
+
+from aiohttp.abc import AbstractResolver, ResolveResult
+from aiohttp.resolver import DefaultResolver
+
+
+class CachingResolver(AbstractResolver):
+    def __init__(self, ttl: float = 300.0) -> None:
+        self.ttl = ttl
+        self.loop = asyncio.get_running_loop()
+        self.hits = 0
+        self.misses = 0
+        self._resolver = DefaultResolver()
+        self._cache: dict[tuple[str, int, int], tuple[float, list[ResolveResult]]] = {}
+        self._inflight: dict[tuple[str, int, int], asyncio.Task] = {}
+
+    async def resolve(
+        self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET
+    ) -> list[ResolveResult]:
+        key = (host, port, family)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            self.hits += 1
+            return cached[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = self._inflight[key] = asyncio.create_task(self._resolver.resolve(host, port, family))
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        results = await asyncio.shield(task)
+        self._cache[key] = (time.monotonic() + self.ttl, results)
+        return results
+
+    async def close(self) -> None:
+        self._cache.clear()
+        await self._resolver.close()
+
+
+_resolver: CachingResolver | None = None
+
+
+def get_resolver(ttl: float | None = None) -> CachingResolver:
+    global _resolver
+
+    loop = asyncio.get_running_loop()
+    if _resolver is None or _resolver.loop is not loop:
+        _resolver = CachingResolver()
+    if ttl is not None:
+        _resolver.ttl = ttl
+    return _resolver
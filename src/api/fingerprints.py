@@ -0,0 +1,80 @@
+import hashlib
+from dataclasses import dataclass, field
+from typing import Mapping
+
+import ua_generator
+from better_proxy import Proxy
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from .compression import ACCEPT_ENCODING
+
+
+def frozen_headers(headers: Mapping[str, str]) -> CIMultiDictProxy[str]:
+    """Immutable header mapping that aiohttp merges into a request without converting it first."""
+    return CIMultiDictProxy(CIMultiDict(headers))
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    user_agent: str
+    brands: str
+    mobile: str
+    platform: str
+    headers: CIMultiDictProxy[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "headers", frozen_headers({
+            'accept-encoding': ACCEPT_ENCODING,
+            'accept-language': 'en-US;q=0.9,en;q=0.8',
+            'sec-ch-ua': self.brands,
+            'sec-ch-ua-mobile': self.mobile,
+            'sec-ch-ua-platform': self.platform,
+            'user-agent': self.user_agent
+        }))
+
+    @classmethod
+    def generate(cls) -> "Fingerprint":
+        user_agent = ua_generator.generate(
+            device='desktop',
+            platform='windows',
+            browser='chrome'
+        )
+        return cls(user_agent.text, user_agent.ch.brands, user_agent.ch.mobile, user_agent.ch.platform)
+
+
+class FingerprintPool:
+    def __init__(self, size: int = 32) -> None:
+        self.size = size
+        self._profiles: list[Fingerprint] = []
+        self._pinned: dict[str, Fingerprint] = {}
+
+    def profiles(self) -> list[Fingerprint]:
+        if not self._profiles:
+            self._profiles = [Fingerprint.generate() for _ in range(self.size)]
+        return self._profiles
+
+    def for_proxy(self, proxy: Proxy | None) -> Fingerprint:
+        key = proxy.as_url if proxy else ""
+        fingerprint = self._pinned.get(key)
+        if fingerprint is None:
+            profiles = self.profiles()
+            slot = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big") % len(profiles)
+            fingerprint = self._pinned[key] = profiles[slot]
+        return fingerprint
+
+
+_pool: FingerprintPool | None = None
+
+
+def get_fingerprint_pool() -> FingerprintPool:
+    global _pool
+
+    if _pool is None:
+        from src.utils import load_settings
+
+        try:
+            size = load_settings().fingerprints.pool_size
+        except Exception:
+            size = FingerprintPool().size
+        _pool = FingerprintPool(size)
+    return _pool
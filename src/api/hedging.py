@@ -0,0 +1,131 @@
+import asyncio
+import random
+from typing import TYPE_CHECKING, Any
+
+from yarl import URL
+
+from src.models import HedgeSettings
+from .timeouts import AdaptiveTimeouts, get_adaptive_timeouts
+from .tracing import RequestTiming, RequestTracer, proxy_key, request_tracer
+
+if TYPE_CHECKING:
+    from .base_client import BaseAPIClient
+
+
+class HedgeBudget:
+    """Token bucket: every request earns `ratio` of a hedge, at most `burst` hedges are saved up."""
+
+    __slots__ = ("ratio", "burst", "tokens")
+
+    def __init__(self, ratio: float, burst: int) -> None:
+        self.ratio = ratio
+        self.burst = burst
+        self.tokens = float(burst)
+
+    def earn(self) -> None:
+        self.tokens = min(self.burst, self.tokens + self.ratio)
+
+    def spend(self) -> bool:
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class Hedger:
+    def __init__(
+        self,
+        settings: HedgeSettings,
+        timeouts: AdaptiveTimeouts | None = None,
+        tracer: RequestTracer | None = None
+    ) -> None:
+        self.settings = settings
+        self.timeouts = timeouts or get_adaptive_timeouts()
+        self.tracer = tracer or request_tracer
+        self.budget = HedgeBudget(settings.budget, settings.burst)
+        self._failures: dict[str, int] = {}
+        if settings.enabled:
+            self.tracer.add_callback(self.record)
+
+    @property
+    def enabled(self) -> bool:
+        return self.settings.enabled
+
+    def record(self, timing: RequestTiming) -> None:
+        if timing.error == "CancelledError":
+            return
+        if timing.error is None:
+            self._failures.pop(timing.proxy, None)
+        else:
+            self._failures[timing.proxy] = self._failures.get(timing.proxy, 0) + 1
+
+    def healthy(self, client: "BaseAPIClient") -> bool:
+        return self._failures.get(proxy_key(client.proxy), 0) < self.settings.max_failures
+
+    def alternate(self, client: "BaseAPIClient", host: str) -> "BaseAPIClient":
+        """Another healthy client of the same pool, the faster of two random picks; the client itself otherwise."""
+        if not self.settings.alternate_proxy or client.pool is None:
+            return client
+
+        candidates = [
+            peer for peer in client.pool.clients()
+            if peer.proxy != client.proxy and self.healthy(peer)
+        ]
+        if not candidates:
+            return client
+
+        picks = random.sample(candidates, min(2, len(candidates)))
+        return min(picks, key=lambda peer: self.timeouts.latency(proxy_key(peer.proxy), host) or float("inf"))
+
+    async def send(self, client: "BaseAPIClient", request: dict[str, Any]) -> dict[str, Any] | str:
+        host = URL(request.get("url") or client.base_url).host or ""
+        self.budget.earn()
+        delay = self.timeouts.latency(proxy_key(client.proxy), host)
+        if delay is None:
+            return await client.send_request(**request)
+
+        primary = asyncio.create_task(client.send_request(**request))
+        hedge: asyncio.Task | None = None
+        running = {primary}
+        try:
+            done, _ = await asyncio.wait(running, timeout=max(delay, self.settings.min_delay))
+            if not done:
+                if not self.budget.spend():
+                    return await primary
+                hedge = asyncio.create_task(self.alternate(client, host).send_request(**request))
+                running.add(hedge)
+
+            last_error: BaseException | None = None
+            while running:
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if hedge is not None:
+                            self.tracer.record_hedge(client.proxy, task is hedge)
+                        return task.result()
+                    last_error = task.exception()
+
+            if hedge is not None:
+                self.tracer.record_hedge(client.proxy, False)
+            raise last_error
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
+
+_hedger: Hedger | None = None
+
+
+def get_hedger() -> Hedger:
+    global _hedger
+
+    if _hedger is None:
+        from src.utils import load_settings
+
+        try:
+            settings = load_settings().hedging
+        except Exception:
+            settings = HedgeSettings()
+        _hedger = Hedger(settings)
+    return _hedger
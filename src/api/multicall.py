@@ -0,0 +1,116 @@
+import asyncio
+
+from eth_abi import decode, encode
+from eth_utils import function_signature_to_4byte_selector, to_checksum_address
+
+from .rpc_gateway import RPCGateway
+
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+AGGREGATE3_SELECTOR = function_signature_to_4byte_selector("aggregate3((address,bool,bytes)[])")
+BALANCE_OF_SELECTOR = function_signature_to_4byte_selector("balanceOf(address)")
+DECIMALS_SELECTOR = function_signature_to_4byte_selector("decimals()")
+
+
+def encode_balance_of(address: str) -> bytes:
+    return BALANCE_OF_SELECTOR + encode(["address"], [to_checksum_address(address)])
+
+
+def encode_aggregate3(token_address: str, addresses: list[str]) -> str:
+    token = to_checksum_address(token_address)
+    calls = [(token, True, encode_balance_of(address)) for address in addresses]
+    return "0x" + (AGGREGATE3_SELECTOR + encode(["(address,bool,bytes)[]"], [calls])).hex()
+
+
+def decode_aggregate3(result: str) -> list[int | None]:
+    (returns,) = decode(["(bool,bytes)[]"], bytes.fromhex(result.removeprefix("0x")))
+    return [
+        int.from_bytes(data, "big") if success and len(data) == 32 else None
+        for success, data in returns
+    ]
+
+
+class MulticallBalanceReader:
+    def __init__(self, gateway: RPCGateway, token_address: str, chunk_size: int = 500) -> None:
+        self.gateway = gateway
+        self.token_address = to_checksum_address(token_address)
+        self.chunk_size = chunk_size
+
+    async def _eth_call(self, to: str, data: str) -> str:
+        return await self.gateway.call("eth_call", [{"to": to, "data": data}, "latest"])
+
+    async def decimals(self) -> int:
+        return int(await self._eth_call(self.token_address, "0x" + DECIMALS_SELECTOR.hex()), 16)
+
+    async def balances_of(self, addresses: list[str]) -> dict[str, int | None]:
+        chunks = [
+            addresses[i : i + self.chunk_size]
+            for i in range(0, len(addresses), self.chunk_size)
+        ]
+        results = await asyncio.gather(*(
+            self._eth_call(MULTICALL3_ADDRESS, encode_aggregate3(self.token_address, chunk))
+            for chunk in chunks
+        ))
+
+        balances: dict[str, int | None] = {}
+        for chunk, result in zip(chunks, results):
+            balances.update(zip(chunk, decode_aggregate3(result)))
+        return balances
+
+
+class BalanceBatcher:
+    def __init__(self, reader: MulticallBalanceReader, linger: float = 0.05) -> None:
+        self.reader = reader
+        self.linger = linger
+        self.max_pending = reader.chunk_size * reader.gateway.max_batch
+        self.loop = asyncio.get_running_loop()
+        self._pending: dict[str, asyncio.Future] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._decimals: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def decimals(self) -> int:
+        if self._decimals is None:
+            self._decimals = asyncio.create_task(self.reader.decimals())
+            self._decimals.add_done_callback(self._forget_failed_decimals)
+        # Shared by every account, so one cancelled caller must not cancel the lookup for the rest
+        return await asyncio.shield(self._decimals)
+
+    def _forget_failed_decimals(self, task: asyncio.Task) -> None:
+        if task.cancelled() or task.exception() is not None:
+            self._decimals = None
+
+    async def balance_of(self, address: str) -> int | None:
+        future = self._pending.get(address)
+        if future is None:
+            future = self._pending[address] = self.loop.create_future()
+
+        if len(self._pending) >= self.max_pending:
+            self._flush()
+        elif self._timer is None:
+            self._timer = self.loop.call_later(self.linger, self._flush)
+        # Callers of the same address share the future; a cancelled one must not cancel the others
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        task = asyncio.create_task(self._resolve(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, pending: dict[str, asyncio.Future]) -> None:
+        try:
+            balances = await self.reader.balances_of(list(pending))
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for address, future in pending.items():
+            if not future.done():
+                future.set_result(balances.get(address))
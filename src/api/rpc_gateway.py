@@ -0,0 +1,315 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from web3.providers.async_base import AsyncBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+from yarl import URL
+
+from src.exceptions.custom_exceptions import APIError
+from src.logger import AsyncLogger
+from .base_client import BaseAPIClient
+
+
+class RPCError(APIError):
+    pass
+
+
+@dataclass
+class RPCEndpointState:
+    url: str
+    client: BaseAPIClient
+    latency: float = 0.0
+    requests: int = 0
+    errors: int = 0
+    failures: int = 0
+    evicted_until: float = 0.0
+    wins: int = 0
+
+    @property
+    def evicted(self) -> bool:
+        return self.evicted_until > time.monotonic()
+
+    def record_success(self, latency: float) -> None:
+        self.requests += 1
+        self.failures = 0
+        self.evicted_until = 0.0
+        self.latency = latency if not self.latency else self.latency * 0.8 + latency * 0.2
+
+    def record_failure(self, max_failures: int, eviction_time: float) -> bool:
+        self.requests += 1
+        self.errors += 1
+        self.failures += 1
+        if self.failures >= max_failures and not self.evicted:
+            self.evicted_until = time.monotonic() + eviction_time
+            return True
+        return False
+
+
+class RPCGateway(AsyncLogger):
+    def __init__(
+        self,
+        endpoints: list[str],
+        max_batch: int = 100,
+        linger: float = 0.01,
+        hedge_after: float = 1.0,
+        max_failures: int = 3,
+        eviction_time: float = 30.0,
+        health_check_interval: float = 15.0,
+        connection_limit: int = 20
+    ) -> None:
+        super().__init__()
+        if not endpoints:
+            raise ValueError("At least one RPC endpoint is required")
+
+        self.endpoints = [
+            RPCEndpointState(url, BaseAPIClient(
+                base_url=url, connection_limit=connection_limit, trace_key=f"rpc {URL(url).host}"
+            ))
+            for url in endpoints
+        ]
+        self.max_batch = max_batch
+        self.linger = linger
+        self.hedge_after = hedge_after
+        self.max_failures = max_failures
+        self.eviction_time = eviction_time
+        self.health_check_interval = health_check_interval
+        self.hedged = 0
+        self.loop = asyncio.get_running_loop()
+        self._pending: list[tuple[str, Any, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._health_task: asyncio.Task | None = None
+
+    async def request(self, method: str, params: Any) -> dict[str, Any]:
+        if self._health_task is None:
+            self._health_task = asyncio.create_task(self._check_health())
+
+        future = self.loop.create_future()
+        self._pending.append((method, params, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = self.loop.call_later(self.linger, self._flush)
+        return await future
+
+    async def call(self, method: str, params: Any) -> Any:
+        response = await self.request(method, params)
+        if "error" in response:
+            raise RPCError(f"RPC error in {method}: {response['error']}", response)
+        return response.get("result")
+
+    async def close(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._health_task is not None:
+            self._health_task.cancel()
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(
+            *self._tasks,
+            *([self._health_task] if self._health_task else []),
+            return_exceptions=True
+        )
+        for endpoint in self.endpoints:
+            await endpoint.client.__aexit__(None, None, None)
+
+    def stats(self) -> list[str]:
+        return [
+            f"{endpoint.url} | requests {endpoint.requests} (errors {endpoint.errors}, "
+            f"hedge wins {endpoint.wins}) | latency {endpoint.latency:.3f}s"
+            f"{' | evicted' if endpoint.evicted else ''}"
+            for endpoint in self.endpoints
+        ]
+
+    def _healthy(self) -> list[RPCEndpointState]:
+        healthy = [endpoint for endpoint in self.endpoints if not endpoint.evicted]
+        return sorted(healthy or self.endpoints, key=lambda endpoint: endpoint.latency)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._dispatch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: list[tuple[str, Any, asyncio.Future]]) -> None:
+        payload = [
+            {"jsonrpc": "2.0", "id": idx, "method": method, "params": params}
+            for idx, (method, params, _) in enumerate(batch)
+        ]
+        try:
+            responses = await self._send_hedged(payload)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for idx, (_, _, future) in enumerate(batch):
+            if future.done():
+                continue
+            response = responses.get(idx)
+            if response is None:
+                response = {
+                    "jsonrpc": "2.0",
+                    "id": idx,
+                    "error": {"code": -32603, "message": "Missing response in JSON-RPC batch"}
+                }
+            future.set_result(response)
+
+    async def _send_hedged(self, payload: list[dict[str, Any]]) -> dict[int, dict[str, Any]]:
+        candidates = iter(self._healthy())
+        running: dict[asyncio.Task, RPCEndpointState] = {}
+        last_error: BaseException | None = None
+
+        def launch() -> bool:
+            endpoint = next(candidates, None)
+            if endpoint is None:
+                return False
+            running[asyncio.create_task(self._send(endpoint, payload))] = endpoint
+            return True
+
+        launch()
+        try:
+            while running:
+                done, _ = await asyncio.wait(
+                    running, timeout=self.hedge_after, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    if launch():
+                        self.hedged += 1
+                    continue
+
+                for task in done:
+                    endpoint = running.pop(task)
+                    if task.exception() is None:
+                        if running:
+                            endpoint.wins += 1
+                        return task.result()
+                    last_error = task.exception()
+
+                if not running:
+                    launch()
+        finally:
+            for task in running:
+                task.cancel()
+
+        raise RPCError(f"All RPC endpoints failed: {last_error}") from last_error
+
+    async def _send(
+        self,
+        endpoint: RPCEndpointState,
+        payload: list[dict[str, Any]] | dict[str, Any]
+    ) -> dict[int, dict[str, Any]]:
+        started = time.perf_counter()
+        try:
+            response = await endpoint.client.send_request(
+                request_type="POST",
+                url=endpoint.url,
+                json_data=payload,
+                max_retries=1,
+                response_mode="json"
+            )
+            data = response.get("data")
+            if isinstance(data, dict):
+                data = [data]
+            if not isinstance(data, list):
+                raise RPCError(f"Unexpected RPC response: {(response.get('text') or '')[:200]}", response)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            if endpoint.record_failure(self.max_failures, self.eviction_time):
+                await self.logger_msg(
+                    f"RPC endpoint {endpoint.url} evicted for {self.eviction_time:.0f}s",
+                    type_msg="warning",
+                    method_name="_send"
+                )
+            raise
+
+        endpoint.record_success(time.perf_counter() - started)
+        return {item.get("id"): item for item in data}
+
+    async def _check_health(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            for endpoint in self.endpoints:
+                was_evicted = endpoint.evicted_until > 0
+                try:
+                    await self._send(endpoint, {"jsonrpc": "2.0", "id": 0, "method": "eth_blockNumber", "params": []})
+                except Exception:
+                    continue
+                if was_evicted:
+                    await self.logger_msg(
+                        f"RPC endpoint {endpoint.url} is healthy again",
+                        type_msg="info",
+                        method_name="_check_health"
+                    )
+
+
+class GatewayProvider(AsyncBaseProvider):
+    def __init__(self, gateway: RPCGateway | None = None) -> None:
+        super().__init__()
+        self._gateway = gateway
+
+    @property
+    def gateway(self) -> RPCGateway:
+        return self._gateway or get_rpc_gateway()
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return await self.gateway.request(method, params)
+
+    async def make_batch_request(
+        self,
+        requests: list[tuple[RPCEndpoint, Any]]
+    ) -> list[RPCResponse]:
+        responses = await asyncio.gather(*(
+            self.gateway.request(method, params) for method, params in requests
+        ))
+        return [{**response, "id": idx} for idx, response in enumerate(responses)]
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        try:
+            await self.gateway.call("eth_chainId", [])
+            return True
+        except Exception:
+            if show_traceback:
+                raise
+            return False
+
+
+_gateway: RPCGateway | None = None
+
+
+def get_rpc_gateway() -> RPCGateway:
+    global _gateway
+    from src.utils import load_settings
+
+    loop = asyncio.get_running_loop()
+    if _gateway is None or _gateway.loop is not loop:
+        settings = load_settings().onchain
+        _gateway = RPCGateway(
+            endpoints=settings.rpc_urls,
+            max_batch=settings.batch_size,
+            linger=settings.linger,
+            hedge_after=settings.hedge_after,
+            max_failures=settings.max_failures,
+            eviction_time=settings.eviction_time,
+            health_check_interval=settings.health_check_interval,
+            connection_limit=settings.connection_limit
+        )
+    return _gateway
+
+
+async def close_rpc_gateway() -> None:
+    global _gateway
+    if _gateway is not None and _gateway.loop is asyncio.get_running_loop():
+        await _gateway.close()
+    _gateway = None
@@ -0,0 +1,111 @@
+from collections import deque
+
+import aiohttp
+from yarl import URL
+
+from src.models import TimeoutSettings
+from .tracing import RequestTiming, RequestTracer, request_tracer
+
+PHASES = ("connect", "read", "total")
+
+
+class LatencyWindow:
+    """Last `size` samples of one phase with a percentile refreshed every `refresh` samples."""
+
+    __slots__ = ("samples", "percentile", "refresh", "value", "_pending")
+
+    def __init__(self, size: int, percentile: float, refresh: int = 16) -> None:
+        self.samples: deque[float] = deque(maxlen=size)
+        self.percentile = percentile
+        self.refresh = refresh
+        self.value: float | None = None
+        self._pending = 0
+
+    def add(self, sample: float, min_samples: int) -> bool:
+        self.samples.append(sample)
+        self._pending += 1
+        if len(self.samples) < min_samples or (self.value is not None and self._pending < self.refresh):
+            return False
+
+        ordered = sorted(self.samples)
+        self.value = ordered[min(len(ordered) - 1, int(self.percentile * len(ordered)))]
+        self._pending = 0
+        return True
+
+
+class AdaptiveTimeouts:
+    def __init__(self, settings: TimeoutSettings, tracer: RequestTracer | None = None) -> None:
+        self.settings = settings
+        self.windows: dict[tuple[str, str], dict[str, LatencyWindow]] = {}
+        self.default = aiohttp.ClientTimeout(
+            total=settings.total_ceiling,
+            sock_connect=settings.connect_ceiling if settings.adaptive else None,
+            sock_read=settings.read_ceiling if settings.adaptive else None
+        )
+        self._timeouts: dict[tuple[str, str], aiohttp.ClientTimeout] = {}
+        (tracer or request_tracer).add_callback(self.record)
+
+    def timeout_for(self, proxy: str, host: str) -> aiohttp.ClientTimeout:
+        timeout = self._timeouts.get((proxy, host))
+        if timeout is None:
+            timeout = self._timeouts.get(("*", host), self.default)
+        return timeout
+
+    def latency(self, proxy: str, host: str, phase: str = "total") -> float | None:
+        """Current percentile of `phase` for the proxy and host, None until enough samples."""
+        for key in ((proxy, host), ("*", host)):
+            windows = self.windows.get(key)
+            if windows is not None and windows[phase].value is not None:
+                return windows[phase].value
+        return None
+
+    def record(self, timing: RequestTiming) -> None:
+        if timing.error is not None or timing.attempts != 1 or timing.status is None:
+            return
+
+        host = URL(timing.url).host or ""
+        samples = {"read": timing.server + timing.transfer, "total": timing.total}
+        if timing.connect:
+            samples["connect"] = timing.connect
+
+        for key in ((timing.proxy, host), ("*", host)):
+            windows = self.windows.get(key)
+            if windows is None:
+                windows = self.windows[key] = {
+                    phase: LatencyWindow(self.settings.window, self.settings.percentile) for phase in PHASES
+                }
+            changed = False
+            for phase, sample in samples.items():
+                changed |= windows[phase].add(sample, self.settings.min_samples)
+            if changed and self.settings.adaptive:
+                self._timeouts[key] = self._build(windows)
+
+    def _clamp(self, window: LatencyWindow, floor: float, ceiling: float) -> float:
+        if window.value is None:
+            return ceiling
+        return min(ceiling, max(floor, window.value * self.settings.multiplier))
+
+    def _build(self, windows: dict[str, LatencyWindow]) -> aiohttp.ClientTimeout:
+        settings = self.settings
+        return aiohttp.ClientTimeout(
+            total=self._clamp(windows["total"], settings.total_floor, settings.total_ceiling),
+            sock_connect=self._clamp(windows["connect"], settings.connect_floor, settings.connect_ceiling),
+            sock_read=self._clamp(windows["read"], settings.read_floor, settings.read_ceiling)
+        )
+
+
+_timeouts: AdaptiveTimeouts | None = None
+
+
+def get_adaptive_timeouts() -> AdaptiveTimeouts:
+    global _timeouts
+
+    if _timeouts is None:
+        from src.utils import load_settings
+
+        try:
+            settings = load_settings().timeouts
+        except Exception:
+            settings = TimeoutSettings()
+        _timeouts = AdaptiveTimeouts(settings)
+    return _timeouts
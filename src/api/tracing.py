@@ -0,0 +1,265 @@
+import contextlib
+import time
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Callable, Iterator
+
+import aiohttp
+from better_proxy import Proxy
+
+
+PHASES = ("queued", "dns", "connect", "server", "transfer", "backoff")
+
+
+def format_bytes(size: float) -> str:
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024 or unit == "GiB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def proxy_key(proxy: Proxy | None) -> str:
+    if proxy is None:
+        return "direct"
+    return f"{proxy.host}:{proxy.port}"
+
+
+@dataclass(slots=True)
+class RequestTiming:
+    proxy: str
+    url: str = ""
+    attempts: int = 0
+    reused: int = 0
+    queued: float = 0.0
+    dns: float = 0.0
+    connect: float = 0.0
+    server: float = 0.0
+    transfer: float = 0.0
+    backoff: float = 0.0
+    total: float = 0.0
+    wire_bytes: int = 0
+    body_bytes: int = 0
+    status: int | None = None
+    error: str | None = None
+    started: float = field(default_factory=time.perf_counter)
+    _marks: dict[str, float] = field(default_factory=dict, repr=False)
+
+    def mark(self, name: str) -> None:
+        self._marks[name] = time.perf_counter()
+
+    def elapsed(self, name: str) -> float:
+        started = self._marks.pop(name, None)
+        if started is None:
+            return 0.0
+        return time.perf_counter() - started
+
+
+@dataclass(slots=True)
+class ProxyTraceStats:
+    requests: int = 0
+    failures: int = 0
+    cancelled: int = 0
+    attempts: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    slot_waits: int = 0
+    slot_wait: float = 0.0
+    total: float = 0.0
+    max_total: float = 0.0
+    wire_bytes: int = 0
+    body_bytes: int = 0
+    phases: dict[str, float] = field(default_factory=lambda: dict.fromkeys(PHASES, 0.0))
+    statuses: dict[str, int] = field(default_factory=dict)
+
+    def add(self, timing: RequestTiming) -> None:
+        self.requests += 1
+        self.attempts += timing.attempts
+        if timing.error == "CancelledError":
+            self.cancelled += 1
+        elif timing.error is not None:
+            self.failures += 1
+        self.total += timing.total
+        self.max_total = max(self.max_total, timing.total)
+        self.wire_bytes += timing.wire_bytes
+        self.body_bytes += timing.body_bytes
+        for phase in PHASES:
+            self.phases[phase] += getattr(timing, phase)
+        status = str(timing.status) if timing.error is None else timing.error
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+
+    def merge(self, other: "ProxyTraceStats") -> None:
+        self.requests += other.requests
+        self.failures += other.failures
+        self.cancelled += other.cancelled
+        self.attempts += other.attempts
+        self.hedges += other.hedges
+        self.hedge_wins += other.hedge_wins
+        self.slot_waits += other.slot_waits
+        self.slot_wait += other.slot_wait
+        self.total += other.total
+        self.max_total = max(self.max_total, other.max_total)
+        self.wire_bytes += other.wire_bytes
+        self.body_bytes += other.body_bytes
+        for phase in PHASES:
+            self.phases[phase] += other.phases.get(phase, 0.0)
+        for status, count in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + count
+
+    def format(self) -> str:
+        count = self.requests or 1
+        phases = " ".join(
+            f"{phase} {self.phases[phase] / count:.3f}s" for phase in PHASES
+        )
+        slot_wait = self.slot_wait / self.slot_waits if self.slot_waits else 0.0
+        hedges = f", hedged {self.hedges} won {self.hedge_wins}" if self.hedges else ""
+        cancelled = f", cancelled {self.cancelled}" if self.cancelled else ""
+        return (
+            f"requests {self.requests} (failed {self.failures}, attempts {self.attempts}{hedges}{cancelled}) | "
+            f"avg {self.total / count:.3f}s max {self.max_total:.3f}s | "
+            f"{phases} | slot wait {slot_wait:.3f}s | "
+            f"bytes wire {format_bytes(self.wire_bytes)} body {format_bytes(self.body_bytes)}"
+        )
+
+
+class RequestTracer:
+    def __init__(self) -> None:
+        self.stats: dict[str, ProxyTraceStats] = {}
+        # Total time of every request, only kept once set to a list (benchmarks use it for percentiles)
+        self.samples: list[float] | None = None
+        self._callbacks: list[Callable[[RequestTiming], Any]] = []
+        self._trace_config: aiohttp.TraceConfig | None = None
+        self._muted = 0
+
+    def add_callback(self, callback: Callable[[RequestTiming], Any]) -> None:
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable[[RequestTiming], Any]) -> None:
+        with contextlib.suppress(ValueError):
+            self._callbacks.remove(callback)
+
+    @property
+    def trace_config(self) -> aiohttp.TraceConfig:
+        if self._trace_config is None:
+            self._trace_config = self._build_trace_config()
+        return self._trace_config
+
+    def start(self, proxy: Proxy | None, url: str, key: str | None = None) -> RequestTiming:
+        """`key` files the request under its own summary line instead of the proxy's."""
+        return RequestTiming(proxy=key or proxy_key(proxy), url=url)
+
+    @contextlib.contextmanager
+    def muted(self) -> Iterator[None]:
+        """Requests finished inside are neither counted nor passed to callbacks."""
+        self._muted += 1
+        try:
+            yield
+        finally:
+            self._muted -= 1
+
+    def finish(self, timing: RequestTiming) -> None:
+        timing.total = time.perf_counter() - timing.started
+        if self._muted:
+            return
+        self._stats_for(timing.proxy).add(timing)
+        if self.samples is not None:
+            self.samples.append(timing.total)
+
+        for callback in self._callbacks:
+            with contextlib.suppress(Exception):
+                callback(timing)
+
+    def record_slot_wait(self, proxy: Proxy | None, seconds: float) -> None:
+        stats = self._stats_for(proxy_key(proxy))
+        stats.slot_waits += 1
+        stats.slot_wait += seconds
+
+    def record_hedge(self, proxy: Proxy | None, won: bool) -> None:
+        stats = self._stats_for(proxy_key(proxy))
+        stats.hedges += 1
+        stats.hedge_wins += won
+
+    def merge(self, stats: dict[str, ProxyTraceStats], samples: list[float] | None = None) -> None:
+        for key, other in stats.items():
+            self._stats_for(key).merge(other)
+        if samples and self.samples is not None:
+            self.samples.extend(samples)
+
+    def reset(self) -> None:
+        self.stats.clear()
+        if self.samples is not None:
+            self.samples.clear()
+
+    def summary(self) -> list[str]:
+        ordered = sorted(self.stats.items(), key=lambda item: item[1].total, reverse=True)
+        lines = [f"{key} | {stats.format()}" for key, stats in ordered if stats.requests]
+
+        wire_bytes = sum(stats.wire_bytes for stats in self.stats.values())
+        body_bytes = sum(stats.body_bytes for stats in self.stats.values())
+        hedges = sum(stats.hedges for stats in self.stats.values())
+        if hedges:
+            requests = sum(stats.requests for stats in self.stats.values()) - hedges
+            wins = sum(stats.hedge_wins for stats in self.stats.values())
+            lines.append(
+                f"hedged {hedges} slow requests ({hedges / max(requests, 1):.1%} extra load), "
+                f"the hedge answered first {wins} times"
+            )
+        if body_bytes:
+            lines.append(
+                f"transferred {format_bytes(wire_bytes)} on the wire for {format_bytes(body_bytes)} "
+                f"of response bodies ({1 - wire_bytes / body_bytes:.0%} saved by compression)"
+            )
+        return lines
+
+    def _stats_for(self, key: str) -> ProxyTraceStats:
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = ProxyTraceStats()
+        return stats
+
+    @staticmethod
+    def _timing(ctx: SimpleNamespace) -> RequestTiming | None:
+        timing = getattr(ctx, "trace_request_ctx", None)
+        return timing if isinstance(timing, RequestTiming) else None
+
+    def _build_trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+
+        def on_mark(name: str) -> Callable:
+            async def handler(session, ctx, params) -> None:
+                if timing := self._timing(ctx):
+                    timing.mark(name)
+            return handler
+
+        def on_elapsed(name: str) -> Callable:
+            async def handler(session, ctx, params) -> None:
+                if timing := self._timing(ctx):
+                    setattr(timing, name, getattr(timing, name) + timing.elapsed(name))
+            return handler
+
+        async def on_request_start(session, ctx, params) -> None:
+            if timing := self._timing(ctx):
+                timing.attempts += 1
+
+        async def on_connection_reuse(session, ctx, params) -> None:
+            if timing := self._timing(ctx):
+                timing.reused += 1
+
+        async def on_request_exception(session, ctx, params) -> None:
+            if timing := self._timing(ctx):
+                timing.error = type(params.exception).__name__
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_queued_start.append(on_mark("queued"))
+        trace_config.on_connection_queued_end.append(on_elapsed("queued"))
+        trace_config.on_dns_resolvehost_start.append(on_mark("dns"))
+        trace_config.on_dns_resolvehost_end.append(on_elapsed("dns"))
+        trace_config.on_connection_create_start.append(on_mark("connect"))
+        trace_config.on_connection_create_end.append(on_elapsed("connect"))
+        trace_config.on_connection_reuseconn.append(on_connection_reuse)
+        trace_config.on_request_headers_sent.append(on_mark("server"))
+        trace_config.on_request_end.append(on_elapsed("server"))
+        trace_config.on_request_exception.append(on_request_exception)
+        return trace_config
+
+
+request_tracer = RequestTracer()
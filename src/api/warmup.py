@@ -0,0 +1,71 @@
+import asyncio
+import time
+from typing import Iterable
+
+from yarl import URL
+
+from src.logger import AsyncLogger
+from .base_client import BaseAPIClient
+from .dns import get_resolver
+from .tracing import request_tracer
+
+
+class ConnectionWarmer(AsyncLogger):
+    def __init__(
+        self,
+        connections_per_host: int = 2,
+        dns_ttl: float = 300.0,
+        timeout: float = 10.0
+    ) -> None:
+        super().__init__()
+        self.connections_per_host = connections_per_host
+        self.timeout = timeout
+        self.resolver = get_resolver(dns_ttl)
+
+    async def warm(self, clients: Iterable[BaseAPIClient]) -> None:
+        clients = list(clients)
+        if not clients:
+            return
+
+        started = time.perf_counter()
+        # Resolved with the connector's address family, the cache key the connector itself looks up later
+        hosts = {
+            (client.proxy.host, client.proxy.port, client.address_family) if client.proxy
+            else (URL(client.base_url).host, URL(client.base_url).port or 0, client.address_family)
+            for client in clients
+        }
+        await asyncio.gather(
+            *(self.resolver.resolve(host, port, family) for host, port, family in hosts),
+            return_exceptions=True
+        )
+
+        # Warmup requests would otherwise seed the latency windows of adaptive timeouts and hedging
+        with request_tracer.muted():
+            opened = await asyncio.gather(*(
+                self._open(client)
+                for client in clients
+                for _ in range(self.connections_per_host)
+            ))
+
+        await self.logger_msg(
+            f"Warmed up {sum(opened)}/{len(opened)} connections for {len(clients)} clients "
+            f"in {time.perf_counter() - started:.2f}s",
+            type_msg="info"
+        )
+
+    async def _open(self, client: BaseAPIClient) -> bool:
+        try:
+            await asyncio.wait_for(
+                client.send_request(
+                    request_type="OPTIONS",
+                    url=client.base_url,
+                    verify=False,
+                    max_retries=1,
+                    response_mode="bytes",
+                    max_body_size=1 << 16
+                ),
+                self.timeout
+            )
+            return True
+        except Exception:
+            return False
@@ -19,11 +19,17 @@ sys.path.append(os.path.realpath("."))
 class Console:
     MODULES = (
         "👀 Checker",
+        "💰 SFI balance",
+        "🔍 HD scan",
+        "🔗 Pipeline",
         "🚪 Exit"
     )
     
     MODULES_DATA = {
         "👀 Checker": "checker",
+        "💰 SFI balance": "sfi_balance",
+        "🔍 HD scan": "hd_scan",
+        "🔗 Pipeline": "pipeline",
         "🚪 Exit": "exit"
     }
 
@@ -78,6 +84,8 @@ class Console:
             "Delay before start",
             f"{config.delay_before_start.min} - {config.delay_before_start.max} sec",
         )
+        table.add_row("Start schedule", f"{config.start_schedule.mode}, {config.start_schedule.order} order")
+        table.add_row("Pipeline", " → ".join(config.pipeline.modules))
 
         panel = Panel(
             table,
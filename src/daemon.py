@@ -0,0 +1,123 @@
+import asyncio
+import contextlib
+import time
+from typing import Any
+
+from src.exceptions.custom_exceptions import ConfigurationError
+from src.logger import AsyncLogger
+from src.models import Account, Config, proxy_keys
+from src.report import ResultSink
+from src.scheduler import LiveSchedule, StartPlanner, dispatch
+from src.settings_watcher import SettingsWatcher
+from src.shutdown import shutdown_controller
+from src.task_manager import TaskManager
+from src.utils import AccountProgress, get_address
+
+
+class CheckerDaemon(AsyncLogger):
+    def __init__(self, module: str, config: Config, progress: AccountProgress) -> None:
+        super().__init__()
+        if module not in TaskManager.RESULT_COLUMNS:
+            raise ConfigurationError(f"Module {module} has no result column and cannot run as a daemon")
+
+        self.module = module
+        self.config = config
+        self.settings = config.daemon
+        self.progress = progress
+        self.column = TaskManager.RESULT_COLUMNS[module]
+        self.process_func = getattr(TaskManager, f"process_{module}")
+        self.addresses = {account.mnemonic: get_address(account.mnemonic) for account in config.accounts}
+        self.last_values: dict[str, Any] = {}
+        self.planner = StartPlanner.spread(
+            self.settings.interval, config.start_schedule.order, config.start_schedule.per_proxy_limit
+        )
+        self.keys = proxy_keys(config.accounts)
+        # Starts follow the daemon interval, so only threads and the rate limit are reloaded
+        self.live = LiveSchedule.from_config(config)
+        self.sink = ResultSink(module, config.report, self.column)
+        self.cycle = 0
+
+    async def run(self) -> None:
+        TaskManager.disable_inplace_writes()
+        await self.logger_msg(
+            f"Daemon started: {len(self.config.accounts)} accounts every {self.settings.interval:.0f}s",
+            type_msg="info"
+        )
+
+        try:
+            async with (
+                TaskManager.shared_clients(self.module, self.config.accounts, self.config.warmup),
+                SettingsWatcher(self.live, self.config.reload).watch()
+            ):
+                next_cycle = time.monotonic()
+                while not shutdown_controller.stopping:
+                    await self._run_cycle(next_cycle)
+                    next_cycle = max(next_cycle + self.settings.interval, time.monotonic())
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(shutdown_controller.event.wait(), next_cycle - time.monotonic())
+        finally:
+            await self.sink.close()
+        await self.logger_msg(f"Daemon stopped after {self.cycle} cycles", type_msg="info")
+
+    async def _run_cycle(self, started: float) -> None:
+        self.cycle += 1
+        self.progress.reset()
+        accounts = self.config.accounts
+        checked = 0
+        changed = 0
+        failed = 0
+
+        async def check(account: Account) -> None:
+            nonlocal checked, changed, failed
+            check_started = time.perf_counter()
+            value = await self._check(account)
+            self.progress.increment()
+            checked += 1
+
+            if value is False:
+                failed += 1
+                return
+            previous = self.last_values.get(account.mnemonic)
+            if previous is None or str(previous) != str(value):
+                changed += 1
+                await self.sink.add(
+                    account.mnemonic, self.addresses[account.mnemonic], True, value,
+                    time.perf_counter() - check_started
+                )
+                await self.logger_msg(
+                    f"{self.column}: {previous} -> {value}",
+                    type_msg="success", address=self.addresses[account.mnemonic]
+                )
+            self.last_values[account.mnemonic] = value
+
+        await dispatch(
+            [accounts[idx] for idx in self.planner.arrange(self.keys)],
+            self.planner.plan(len(accounts)),
+            self.config.threads,
+            check,
+            key=lambda account: account.proxy,
+            per_key_limit=self.planner.per_proxy_limit,
+            stop=shutdown_controller.event,
+            grace=shutdown_controller.grace,
+            live=self.live
+        )
+
+        await self.sink.flush()
+        await self.logger_msg(
+            f"Cycle {self.cycle} finished in {time.monotonic() - started:.1f}s: "
+            f"{changed} changed, {checked - changed - failed} unchanged, {failed} failed"
+            + (f", {len(accounts) - checked} skipped" if checked < len(accounts) else ""),
+            type_msg="info"
+        )
+
+    async def _check(self, account: Account) -> Any:
+        try:
+            return await self.process_func(account)
+        except Exception as e:
+            await self.logger_msg(
+                f"Error: {str(e)}",
+                address=self.addresses[account.mnemonic],
+                type_msg="error",
+                method_name="_check"
+            )
+            return False
@@ -0,0 +1,391 @@
+import asyncio
+import contextlib
+import hmac
+import os
+import socket
+import ssl
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import uuid4
+
+from aiohttp import web
+from yarl import URL
+
+from src.api import BaseAPIClient
+from src.exceptions.custom_exceptions import ConfigurationError
+from src.logger import AsyncLogger
+from src.models import AccountTable, Config, DistributedSettings
+from src.scheduler import LiveSchedule, StartPlanner
+from src.settings_watcher import SettingsWatcher
+from src.sharding import run_rows
+from src.shutdown import shutdown_controller
+from src.task_manager import TaskManager
+from src.utils import AccountProgress, prime_derivation_index
+
+LOCAL_HOSTS = frozenset({"127.0.0.1", "localhost", "::1"})
+
+
+def server_ssl_context(settings: DistributedSettings) -> ssl.SSLContext | None:
+    if not settings.tls_cert:
+        return None
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(settings.tls_cert, settings.tls_key or None)
+    return context
+
+
+def client_ssl_context(settings: DistributedSettings) -> ssl.SSLContext | None:
+    return ssl.create_default_context(cafile=settings.tls_ca) if settings.tls_ca else None
+
+
+@dataclass
+class Lease:
+    id: str
+    worker: str
+    rows: set[int]
+    expires: float = field(default=0.0)
+
+
+class LeaseTable:
+    def __init__(self, total: int, lease_size: int, ttl: float) -> None:
+        self.total = total
+        self.lease_size = lease_size
+        self.ttl = ttl
+        self.pending: deque[int] = deque(range(total))
+        self.leases: dict[str, Lease] = {}
+        self.completed = bytearray(total)
+        self.done = 0
+        self.reassigned = 0
+
+    @property
+    def finished(self) -> bool:
+        return self.done >= self.total
+
+    def acquire(self, worker: str) -> Lease | None:
+        self.reclaim_expired()
+
+        rows: set[int] = set()
+        while self.pending and len(rows) < self.lease_size:
+            idx = self.pending.popleft()
+            if not self.completed[idx]:
+                rows.add(idx)
+        if not rows:
+            return None
+
+        lease = Lease(uuid4().hex, worker, rows, time.monotonic() + self.ttl)
+        self.leases[lease.id] = lease
+        return lease
+
+    def renew(self, lease_id: str) -> bool:
+        lease = self.leases.get(lease_id)
+        if lease is None:
+            return False
+        lease.expires = time.monotonic() + self.ttl
+        return True
+
+    def complete(self, lease_id: str, idx: int) -> bool:
+        lease = self.leases.get(lease_id)
+        if lease is not None:
+            lease.rows.discard(idx)
+            lease.expires = time.monotonic() + self.ttl
+            if not lease.rows:
+                del self.leases[lease_id]
+
+        if not 0 <= idx < self.total or self.completed[idx]:
+            return False
+        self.completed[idx] = 1
+        self.done += 1
+        return True
+
+    def reclaim_expired(self) -> int:
+        now = time.monotonic()
+        expired = [lease.id for lease in self.leases.values() if lease.expires < now]
+        reclaimed = sum(self.release(lease_id) for lease_id in expired)
+        self.reassigned += reclaimed
+        return reclaimed
+
+    def release(self, lease_id: str) -> int:
+        lease = self.leases.pop(lease_id, None)
+        if lease is None:
+            return 0
+        rows = sorted(idx for idx in lease.rows if not self.completed[idx])
+        self.pending.extendleft(reversed(rows))
+        return len(rows)
+
+
+class Coordinator(AsyncLogger):
+    SHUTDOWN_GRACE = 3.0
+
+    def __init__(self, module: str, config: Config, progress: AccountProgress) -> None:
+        super().__init__()
+        self.module = module
+        self.config = config
+        self.settings = config.distributed
+        self.progress = progress
+        self.table = LeaseTable(len(config.accounts), self.settings.lease_size, self.settings.lease_ttl)
+        self.results: list[tuple[bool, Any]] = []
+        self.sink = TaskManager.create_sink(module, config.report)
+        self._finished = asyncio.Event()
+
+    async def run(self) -> list[tuple[bool, Any]]:
+        if self.settings.host not in LOCAL_HOSTS:
+            # Leases carry mnemonics and proxy credentials, the token alone does not hide them on the wire
+            if not self.settings.token or not self.settings.tls_cert:
+                raise ConfigurationError(
+                    "distributed.token and distributed.tls_cert are required "
+                    "when the coordinator listens on a non-local address"
+                )
+        ssl_context = server_ssl_context(self.settings)
+
+        app = web.Application(middlewares=[self._authorize])
+        app.router.add_post("/lease", self.handle_lease)
+        app.router.add_post("/heartbeat", self.handle_heartbeat)
+        app.router.add_post("/results", self.handle_results)
+
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, self.settings.host, self.settings.port, ssl_context=ssl_context).start()
+        await self.logger_msg(
+            f"Coordinator serving {self.table.total} accounts on "
+            f"{'https' if ssl_context else 'http'}://{self.settings.host}:{self.settings.port}",
+            type_msg="info"
+        )
+
+        reaper = asyncio.create_task(self._reap_expired())
+        drainer = asyncio.create_task(self._drain_on_stop())
+        try:
+            if not self.table.finished:
+                await self._finished.wait()
+            await asyncio.sleep(self.SHUTDOWN_GRACE)
+        finally:
+            reaper.cancel()
+            drainer.cancel()
+            await runner.cleanup()
+            await self.sink.close()
+
+        if self.table.reassigned:
+            await self.logger_msg(
+                f"Reassigned {self.table.reassigned} accounts from expired leases",
+                type_msg="warning"
+            )
+        return self.results
+
+    @web.middleware
+    async def _authorize(self, request: web.Request, handler) -> web.StreamResponse:
+        token = self.settings.token
+        if token and not hmac.compare_digest(
+            request.headers.get("Authorization", ""), f"Bearer {token}"
+        ):
+            raise web.HTTPUnauthorized()
+        return await handler(request)
+
+    async def _reap_expired(self) -> None:
+        while True:
+            await asyncio.sleep(max(self.settings.lease_ttl / 4, 0.5))
+            reclaimed = self.table.reclaim_expired()
+            if reclaimed:
+                await self.logger_msg(
+                    f"Lease expired, {reclaimed} accounts returned to the queue",
+                    type_msg="warning",
+                    method_name="_reap_expired"
+                )
+
+    async def _drain_on_stop(self) -> None:
+        await shutdown_controller.event.wait()
+        deadline = time.monotonic() + shutdown_controller.grace
+        while self.table.leases and time.monotonic() < deadline:
+            await asyncio.sleep(0.5)
+        self._finished.set()
+
+    async def handle_lease(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        if self.table.finished or shutdown_controller.stopping:
+            return web.json_response({"finished": True})
+
+        lease = self.table.acquire(str(payload.get("worker", "unknown")))
+        if lease is None:
+            return web.json_response({"lease_id": None, "retry_after": self.settings.flush_interval})
+
+        accounts = []
+        for idx in sorted(lease.rows):
+            account = self.config.accounts[idx]
+            accounts.append([idx, account.mnemonic, account.proxy.as_url if account.proxy else None])
+
+        await self.logger_msg(
+            f"Leased {len(accounts)} accounts to {lease.worker}",
+            type_msg="debug",
+            method_name="handle_lease"
+        )
+        return web.json_response({
+            "lease_id": lease.id,
+            "module": self.module,
+            "ttl": self.settings.lease_ttl,
+            "accounts": accounts
+        })
+
+    async def handle_heartbeat(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        return web.json_response({"renewed": self.table.renew(str(payload.get("lease_id")))})
+
+    async def handle_results(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        lease_id = str(payload.get("lease_id"))
+        accepted = 0
+
+        for idx, address, success, data, latency in payload.get("results", []):
+            if not self.table.complete(lease_id, idx):
+                continue
+            accepted += 1
+            self.results.append((success, data))
+            await self.sink.add(self.config.accounts[idx].mnemonic, address, success, data, latency)
+            self.progress.increment()
+            await self.logger_msg(
+                f"Processed accounts: {self.progress.processed}/{self.progress.total}",
+                type_msg="info"
+            )
+
+        if payload.get("release"):
+            self.table.release(lease_id)
+        if self.table.finished:
+            self._finished.set()
+        return web.json_response({"accepted": accepted})
+
+
+class DistributedWorker(AsyncLogger):
+    def __init__(self, coordinator_url: str, config: Config) -> None:
+        super().__init__()
+        self.config = config
+        self.settings = config.distributed
+        url = URL(coordinator_url)
+        if url.scheme != "https" and url.host not in LOCAL_HOSTS:
+            raise ConfigurationError(
+                "Refusing to receive accounts from a non-local coordinator over plain HTTP, use an https:// URL"
+            )
+        self.client = BaseAPIClient(
+            base_url=coordinator_url, ssl_context=client_ssl_context(self.settings), trace_key="coordinator"
+        )
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        self.headers = {"authorization": f"Bearer {self.settings.token}"} if self.settings.token else {}
+        self.processed = 0
+        self._buffer: list[list[Any]] = []
+        self.live = LiveSchedule.from_config(config, StartPlanner.from_config(config))
+
+    async def run(self) -> None:
+        TaskManager.disable_inplace_writes()
+        await self.logger_msg(f"Worker {self.worker_id} started", type_msg="info")
+
+        watcher = SettingsWatcher(self.live, self.config.reload)
+        async with self.client, contextlib.AsyncExitStack() as stack, watcher.watch():
+            clients_open = False
+            while not shutdown_controller.stopping:
+                lease = await self._post("/lease", {"worker": self.worker_id})
+                if lease.get("finished"):
+                    break
+                if not lease.get("lease_id"):
+                    await asyncio.sleep(lease.get("retry_after", 1.0))
+                    continue
+                if not clients_open:
+                    accounts = AccountTable.from_rows(
+                        (mnemonic, proxy) for _, mnemonic, proxy in lease["accounts"]
+                    )
+                    await stack.enter_async_context(TaskManager.shared_clients(
+                        lease["module"], accounts, self.config.warmup
+                    ))
+                    clients_open = True
+                await self._process_lease(lease)
+
+        reason = "Worker stopped" if shutdown_controller.stopping else "Coordinator has no more work"
+        await self.logger_msg(
+            f"{reason}, {self.processed} accounts processed by this worker",
+            type_msg="info"
+        )
+
+    async def _post(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
+        response = await self.client.send_request(
+            request_type="POST",
+            method=path,
+            json_data=payload,
+            headers=self.headers,
+            response_mode="json"
+        )
+        return response.get("data") or {}
+
+    async def _process_lease(self, lease: dict[str, Any]) -> None:
+        lease_id = lease["lease_id"]
+        rows = [tuple(row) for row in lease["accounts"]]
+        # Reloaded settings apply to the current lease and to every later one
+        planner = self.live.planner
+
+        heartbeat = asyncio.create_task(self._heartbeat(lease_id, lease["ttl"]))
+        flusher = asyncio.create_task(self._flush_periodically(lease_id))
+        work: asyncio.Task | None = None
+        try:
+            await prime_derivation_index(
+                (row[1] for row in rows), self.config.processes, shutdown_controller.event
+            )
+            work = asyncio.create_task(run_rows(
+                lease["module"], rows, self.live.workers, planner,
+                lambda *result: self._buffer.append(list(result)),
+                stop=shutdown_controller.event,
+                grace=shutdown_controller.grace,
+                live=self.live
+            ))
+            # The heartbeat only returns once the lease is lost, its rows may already run elsewhere
+            await asyncio.wait({work, heartbeat}, return_when=asyncio.FIRST_COMPLETED)
+            if work.done():
+                work.result()
+        finally:
+            for task in (work, heartbeat, flusher):
+                if task is not None:
+                    task.cancel()
+            await asyncio.gather(*(task for task in (work, heartbeat, flusher) if task), return_exceptions=True)
+            # A stopping worker hands its unfinished rows back instead of letting the lease expire
+            await self._flush(lease_id, release=shutdown_controller.stopping)
+
+    async def _heartbeat(self, lease_id: str, ttl: float) -> None:
+        renewed = time.monotonic()
+        while True:
+            await asyncio.sleep(ttl / 3)
+            try:
+                response = await self._post("/heartbeat", {"lease_id": lease_id})
+            except Exception as e:
+                await self.logger_msg(f"Heartbeat failed: {str(e)}", type_msg="warning", method_name="_heartbeat")
+                if time.monotonic() - renewed < ttl:
+                    continue
+                reason = f"not renewed for {ttl:.0f}s"
+            else:
+                if response.get("renewed"):
+                    renewed = time.monotonic()
+                    continue
+                reason = "the coordinator has reassigned it"
+
+            await self.logger_msg(
+                f"Lease lost ({reason}), abandoning its remaining accounts",
+                type_msg="warning",
+                method_name="_heartbeat"
+            )
+            return
+
+    async def _flush_periodically(self, lease_id: str) -> None:
+        while True:
+            await asyncio.sleep(self.settings.flush_interval)
+            try:
+                await self._flush(lease_id)
+            except Exception as e:
+                await self.logger_msg(
+                    f"Sending results failed, will retry: {str(e)}",
+                    type_msg="warning",
+                    method_name="_flush_periodically"
+                )
+
+    async def _flush(self, lease_id: str, release: bool = False) -> None:
+        if not self._buffer and not release:
+            return
+        batch, self._buffer = self._buffer, []
+        try:
+            await self._post("/results", {"lease_id": lease_id, "results": batch, "release": release})
+            self.processed += len(batch)
+        except Exception:
+            self._buffer = batch + self._buffer
+            raise
@@ -65,6 +65,14 @@ class ServerError(APIError):
     """
 
 
+class ResponseTooLarge(APIError):
+    """
+    Exception for responses exceeding the allowed body size.
+
+    Raised before the rest of the body is read and is not retried.
+    """
+
+
 class WalletError(Exception):
     """
     Base class for wallet-related errors.
@@ -1,2 +1,3 @@
+from .account_table import *
 from .config_model import *
 from .bot_model import *
\ No newline at end of file
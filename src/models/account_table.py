@@ -0,0 +1,144 @@
+from array import array
+from typing import Hashable, Iterable, Iterator, Sequence, overload
+
+from better_proxy import Proxy
+
+ADDRESS_SIZE = 20
+_NO_ADDRESS = bytes(ADDRESS_SIZE)
+
+
+class AccountView:
+    """Row of an AccountTable, usable wherever an Account is expected."""
+
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table: "AccountTable", index: int) -> None:
+        self._table = table
+        self._index = index
+
+    @property
+    def mnemonic(self) -> str:
+        return self._table.mnemonic(self._index)
+
+    @property
+    def proxy(self) -> Proxy | None:
+        return self._table.proxy(self._index)
+
+    @property
+    def address(self) -> str:
+        return self._table.address(self._index)
+
+    def __repr__(self) -> str:
+        return f'Account({self.mnemonic!r})'
+
+
+class AccountTable:
+    """Column-oriented account storage.
+
+    Secrets live in one UTF-8 blob addressed by an offsets array, proxies are parsed
+    once per distinct string and referenced by a 32-bit id (0 - no proxy), and addresses
+    are packed 20-byte values filled in on first use.
+    """
+
+    def __init__(self) -> None:
+        self._secrets = bytearray()
+        self._offsets = array('Q', [0])
+        self._proxy_ids = array('I')
+        self._addresses = bytearray()
+        self._proxies: list[Proxy | None] = [None]
+        self._proxy_ids_by_key: dict[str, int] = {}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple[str, str | Proxy | None]]) -> "AccountTable":
+        table = cls()
+        for mnemonic, proxy in rows:
+            table.append(mnemonic, proxy)
+        return table
+
+    @classmethod
+    def from_accounts(cls, accounts: Iterable) -> "AccountTable":
+        return cls.from_rows((account.mnemonic, account.proxy) for account in accounts)
+
+    def append(self, mnemonic: str, proxy: str | Proxy | None = None) -> None:
+        self._secrets += mnemonic.encode()
+        self._offsets.append(len(self._secrets))
+        self._proxy_ids.append(self._intern(proxy))
+        self._addresses += _NO_ADDRESS
+
+    def _intern(self, proxy: str | Proxy | None) -> int:
+        if not proxy:
+            return 0
+
+        key = proxy.as_url if isinstance(proxy, Proxy) else proxy.strip()
+        proxy_id = self._proxy_ids_by_key.get(key)
+        if proxy_id is None:
+            proxy_id = self._proxy_ids_by_key[key] = len(self._proxies)
+            self._proxies.append(proxy if isinstance(proxy, Proxy) else Proxy.from_str(key))
+        return proxy_id
+
+    def __len__(self) -> int:
+        return len(self._proxy_ids)
+
+    @overload
+    def __getitem__(self, index: int) -> AccountView: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[AccountView]: ...
+
+    def __getitem__(self, index: int | slice) -> AccountView | list[AccountView]:
+        if isinstance(index, slice):
+            return [AccountView(self, idx) for idx in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('account index out of range')
+        return AccountView(self, index)
+
+    def __iter__(self) -> Iterator[AccountView]:
+        return (AccountView(self, idx) for idx in range(len(self)))
+
+    def mnemonic(self, index: int) -> str:
+        return self._secrets[self._offsets[index]:self._offsets[index + 1]].decode()
+
+    def proxy(self, index: int) -> Proxy | None:
+        return self._proxies[self._proxy_ids[index]]
+
+    def proxy_ids(self) -> array:
+        return self._proxy_ids
+
+    def proxies(self) -> list[Proxy | None]:
+        proxies = self._proxies[1:]
+        return [None, *proxies] if 0 in self._proxy_ids else proxies
+
+    def address(self, index: int) -> str:
+        from eth_utils import to_checksum_address
+        from src.utils import get_address
+
+        start = index * ADDRESS_SIZE
+        packed = self._addresses[start:start + ADDRESS_SIZE]
+        if packed != _NO_ADDRESS:
+            return to_checksum_address(bytes(packed))
+
+        address = get_address(self.mnemonic(index))
+        self._addresses[start:start + ADDRESS_SIZE] = bytes.fromhex(address[2:])
+        return address
+
+    def nbytes(self) -> int:
+        return (
+            len(self._secrets)
+            + self._offsets.itemsize * len(self._offsets)
+            + self._proxy_ids.itemsize * len(self._proxy_ids)
+            + len(self._addresses)
+        )
+
+
+def unique_proxies(accounts: Iterable) -> list[Proxy | None]:
+    if isinstance(accounts, AccountTable):
+        return accounts.proxies()
+    return list({account.proxy: None for account in accounts})
+
+
+def proxy_keys(accounts: Iterable) -> Sequence[Hashable]:
+    if isinstance(accounts, AccountTable):
+        return accounts.proxy_ids()
+    return [account.proxy for account in accounts]
@@ -1,6 +1,6 @@
 import orjson
 from pathlib import Path
-from typing import Self
+from typing import Literal, Self
 
 from better_proxy import Proxy
 from pydantic import (
@@ -9,8 +9,11 @@ from pydantic import (
     Field,
     ValidationInfo,
     field_validator,
+    model_validator,
 )
 
+from .account_table import AccountTable
+
 
 class Account:
     __slots__ = (
@@ -56,10 +59,204 @@ class PercentRange(BaseModel):
         return value
 
 
+class StartScheduleSettings(BaseModel):
+    mode: Literal["random", "spread"] = "random"
+    duration: float = Field(default=0, ge=0)
+    order: Literal["file", "round_robin", "group"] = "file"
+    per_proxy_limit: int = Field(default=0, ge=0)
+    rate_limit: float = Field(default=0, ge=0)
+
+    model_config = ConfigDict(frozen=True)
+
+
+class ReloadSettings(BaseModel):
+    enabled: bool = True
+    interval: float = Field(default=2.0, gt=0)
+
+    model_config = ConfigDict(frozen=True)
+
+
+class ShutdownSettings(BaseModel):
+    grace: float = Field(default=30.0, ge=0)
+    deadline: float = Field(default=0.0, ge=0)
+
+    model_config = ConfigDict(frozen=True)
+
+
+class WarmupSettings(BaseModel):
+    enabled: bool = True
+    connections_per_host: int = Field(default=2, ge=1)
+    dns_ttl: float = Field(default=300, ge=0)
+    timeout: float = Field(default=10, gt=0)
+
+    model_config = ConfigDict(frozen=True)
+
+
+class ReportSettings(BaseModel):
+    enabled: bool = True
+    format: Literal["xlsx", "csv"] = "xlsx"
+    directory: str = "results"
+    flush_every: int = Field(default=1000, ge=1)
+    update_accounts: bool = True
+    accounts_batch: int = Field(default=50000, ge=1)
+
+    model_config = ConfigDict(frozen=True)
+
+
+class TimeoutSettings(BaseModel):
+    adaptive: bool = True
+    percentile: float = Field(default=0.95, gt=0, le=1)
+    multiplier: float = Field(default=3.0, ge=1)
+    min_samples: int = Field(default=20, ge=1)
+    window: int = Field(default=200, ge=1)
+    connect_floor: float = Field(default=1.0, gt=0)
+    connect_ceiling: float = Field(default=30.0, gt=0)
+    read_floor: float = Field(default=2.0, gt=0)
+    read_ceiling: float = Field(default=60.0, gt=0)
+    total_floor: float = Field(default=5.0, gt=0)
+    total_ceiling: float = Field(default=120.0, gt=0)
+
+    @model_validator(mode='after')
+    def validate_bounds(self) -> Self:
+        for phase in ('connect', 'read', 'total'):
+            if getattr(self, f'{phase}_floor') > getattr(self, f'{phase}_ceiling'):
+                raise ValueError(f'{phase}_floor must be less than or equal to {phase}_ceiling')
+        return self
+
+    model_config = ConfigDict(frozen=True)
+
+
+class HedgeSettings(BaseModel):
+    enabled: bool = False
+    budget: float = Field(default=0.05, gt=0, le=1)
+    burst: int = Field(default=10, ge=1)
+    min_delay: float = Field(default=0.05, ge=0)
+    alternate_proxy: bool = True
+    max_failures: int = Field(default=3, ge=1)
+
+    model_config = ConfigDict(frozen=True)
+
+
+class FingerprintSettings(BaseModel):
+    pool_size: int = Field(default=32, ge=1)
+
+    model_config = ConfigDict(frozen=True)
+
+
+class HDScanSettings(BaseModel):
+    path: str = "m/44'/60'/0'/0/{index}"
+    start: int = Field(default=0, ge=0)
+    count: int = Field(default=20, ge=1)
+    paths: list[str] = Field(default_factory=list)
+    gap_limit: int = Field(default=5, ge=0)
+    passphrase: str = ""
+
+    @field_validator('path')
+    @classmethod
+    def validate_path(cls, value: str) -> str:
+        if '{index}' not in value:
+            raise ValueError('path must contain the {index} placeholder')
+        return value
+
+    model_config = ConfigDict(frozen=True)
+
+
+class PipelineSettings(BaseModel):
+    modules: list[Literal["checker", "sfi_balance", "hd_scan"]] = Field(
+        default_factory=lambda: ["checker", "sfi_balance"], min_length=1
+    )
+    stop_on_failure: bool = False
+
+    model_config = ConfigDict(frozen=True)
+
+
+class DerivationIndexSettings(BaseModel):
+    enabled: bool = True
+    path: str = "config/data/derivation.idx"
+
+    model_config = ConfigDict(frozen=True)
+
+
+class ProfilingSettings(BaseModel):
+    enabled: bool = False
+    profiler: Literal["cprofile", "sampling"] = "cprofile"
+    sample_interval: float = Field(default=0.005, gt=0)
+    loop_lag_interval: float = Field(default=0.1, gt=0)
+    slow_callback_duration: float = Field(default=0.1, gt=0)
+    tracemalloc_top: int = Field(default=25, ge=0)
+    tracemalloc_frames: int = Field(default=1, ge=1)
+
+    model_config = ConfigDict(frozen=True)
+
+
+class DistributedSettings(BaseModel):
+    host: str = "127.0.0.1"
+    port: int = Field(default=8765, ge=1, le=65535)
+    token: str = ""
+    lease_size: int = Field(default=100, ge=1)
+    lease_ttl: float = Field(default=120, gt=0)
+    flush_interval: float = Field(default=1.0, gt=0)
+    tls_cert: str = ""
+    tls_key: str = ""
+    tls_ca: str = ""
+
+    model_config = ConfigDict(frozen=True)
+
+
+class DaemonSettings(BaseModel):
+    interval: float = Field(default=3600, gt=0)
+
+    model_config = ConfigDict(frozen=True)
+
+
+class ServiceSettings(BaseModel):
+    host: str = "127.0.0.1"
+    port: int = Field(default=8766, ge=1, le=65535)
+    token: str = ""
+    concurrency: int = Field(default=50, ge=1)
+    max_batch: int = Field(default=10000, ge=1)
+    cache_ttl: float = Field(default=300, ge=0)
+    cache_size: int = Field(default=100000, ge=1)
+
+    model_config = ConfigDict(frozen=True)
+
+
+class OnchainSettings(BaseModel):
+    rpc_urls: list[str] = Field(default_factory=lambda: ["https://ethereum.publicnode.com"], min_length=1)
+    token_address: str = ""
+    chunk_size: int = Field(default=500, ge=1)
+    batch_size: int = Field(default=100, ge=1)
+    linger: float = Field(default=0.05, ge=0)
+    hedge_after: float = Field(default=1.0, gt=0)
+    max_failures: int = Field(default=3, ge=1)
+    eviction_time: float = Field(default=30.0, ge=0)
+    health_check_interval: float = Field(default=15.0, gt=0)
+    connection_limit: int = Field(default=20, ge=1)
+
+    model_config = ConfigDict(frozen=True)
+
+
 class Config(BaseModel):
-    accounts: list[Account] = Field(default_factory=list)
+    accounts: AccountTable | list[Account] = Field(default_factory=AccountTable)
     threads: int
+    processes: int = Field(default=1, ge=1)
     delay_before_start: DelayRange
+    start_schedule: StartScheduleSettings = Field(default_factory=StartScheduleSettings)
+    shutdown: ShutdownSettings = Field(default_factory=ShutdownSettings)
+    reload: ReloadSettings = Field(default_factory=ReloadSettings)
+    warmup: WarmupSettings = Field(default_factory=WarmupSettings)
+    fingerprints: FingerprintSettings = Field(default_factory=FingerprintSettings)
+    timeouts: TimeoutSettings = Field(default_factory=TimeoutSettings)
+    hedging: HedgeSettings = Field(default_factory=HedgeSettings)
+    report: ReportSettings = Field(default_factory=ReportSettings)
+    derivation_index: DerivationIndexSettings = Field(default_factory=DerivationIndexSettings)
+    hd_scan: HDScanSettings = Field(default_factory=HDScanSettings)
+    pipeline: PipelineSettings = Field(default_factory=PipelineSettings)
+    profiling: ProfilingSettings = Field(default_factory=ProfilingSettings)
+    distributed: DistributedSettings = Field(default_factory=DistributedSettings)
+    onchain: OnchainSettings = Field(default_factory=OnchainSettings)
+    daemon: DaemonSettings = Field(default_factory=DaemonSettings)
+    service: ServiceSettings = Field(default_factory=ServiceSettings)
     module: str = ""
     route_name: str = "default"
     available_modules: list[str] = Field(default_factory=list)
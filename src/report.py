@@ -0,0 +1,194 @@
+import asyncio
+import csv
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from src.logger import AsyncLogger
+from src.models import ReportSettings
+from src.utils import ConfigLoader, update_token_balances
+
+
+class ReportWriter:
+    def __init__(self, path: str | Path, columns: list[str]) -> None:
+        self.path = Path(path)
+        self.columns = columns
+        self.rows = 0
+        self._file = None
+        self._csv = None
+        self._workbook = None
+        self._sheet = None
+
+    def open(self) -> "ReportWriter":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.suffix == ".csv":
+            self._file = open(self.path, "w", newline="", encoding="utf-8")
+            self._csv = csv.writer(self._file)
+            self._csv.writerow(self.columns)
+        else:
+            import openpyxl
+
+            self._workbook = openpyxl.Workbook(write_only=True)
+            self._sheet = self._workbook.create_sheet("Results")
+            self._sheet.append(self.columns)
+        return self
+
+    def write(self, row: list[Any]) -> None:
+        if self._csv is not None:
+            self._csv.writerow(row)
+        else:
+            self._sheet.append(row)
+        self.rows += 1
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = self._csv = None
+        if self._workbook is not None:
+            self._workbook.save(self.path)
+            self._workbook = self._sheet = None
+
+    def __enter__(self) -> "ReportWriter":
+        return self.open()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ResultSink(AsyncLogger):
+    def __init__(
+        self,
+        module: str,
+        settings: ReportSettings,
+        column: str | None = None,
+        per_address: bool = False,
+        steps: dict[str, str | None] | None = None
+    ) -> None:
+        """`steps` maps pipeline modules to their balance column; each gets its own report column."""
+        super().__init__()
+        self.module = module
+        self.settings = settings
+        self.column = column
+        self.per_address = per_address
+        self.steps = steps
+        # Pending accounts.xlsx values, written in batches of `settings.accounts_batch`
+        self.balances: defaultdict[str, dict[str, Any]] = defaultdict(dict)
+        self._balances_lock = asyncio.Lock()
+        self.report: ReportWriter | None = None
+
+        if settings.enabled:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            results = [name or step for step, name in steps.items()] if steps else [column or "Result"]
+            self.report = ReportWriter(
+                ConfigLoader().base_path / settings.directory / f"{module}_{timestamp}.{settings.format}",
+                ["Address", *results, "Status", "Error", "Latency", "Timestamp"]
+                + (["Path"] if per_address else [])
+            ).open()
+
+    async def add(
+        self,
+        mnemonic: str,
+        address: str,
+        success: bool,
+        data: Any,
+        latency: float
+    ) -> None:
+        if self.steps is not None:
+            self._add_steps(mnemonic, address, success, data, latency)
+        else:
+            self._add_row(mnemonic, address, success, data, latency)
+
+        if sum(map(len, self.balances.values())) >= self.settings.accounts_batch:
+            await self.flush()
+
+    def _add_row(self, mnemonic: str, address: str, success: bool, data: Any, latency: float) -> None:
+        if success and self.column and self.settings.update_accounts:
+            self.balances[self.column][mnemonic] = data
+        if self.report is None:
+            return
+
+        if success and self.per_address:
+            for path, derived_address, value in data:
+                failed = value is False
+                self._write(derived_address, not failed, "Request failed" if failed else value, latency, path)
+        else:
+            self._write(address, success, data, latency)
+
+    def _write(self, address: str, success: bool, data: Any, latency: float, path: str | None = None) -> None:
+        row = [
+            address,
+            data if success else None,
+            "success" if success else "failed",
+            None if success else str(data),
+            round(latency, 3),
+            datetime.now().isoformat(timespec="seconds")
+        ]
+        if self.per_address:
+            row.append(path)
+        self._append(row)
+
+    def _add_steps(self, mnemonic: str, address: str, success: bool, data: Any, latency: float) -> None:
+        values = data if isinstance(data, dict) else {}
+        for step, column in self.steps.items():
+            value = values.get(step)
+            if column and self.settings.update_accounts and value is not None and value is not False:
+                self.balances[column][mnemonic] = value
+        if self.report is None:
+            return
+
+        failed = [step for step in self.steps if values.get(step) is False]
+        if success:
+            error = None
+        elif failed:
+            error = f"Failed: {', '.join(failed)}"
+        else:
+            error = str(data)
+        self._append([
+            address,
+            *(self._cell(values.get(step)) for step in self.steps),
+            "success" if success else "failed",
+            error,
+            round(latency, 3),
+            datetime.now().isoformat(timespec="seconds")
+        ])
+
+    @staticmethod
+    def _cell(value: Any) -> Any:
+        if value is None or value is False or isinstance(value, (str, int, float)):
+            return value
+        return orjson.dumps(value).decode()
+
+    def _append(self, row: list[Any]) -> None:
+        self.report.write(row)
+        if self.report.rows % self.settings.flush_every == 0:
+            self.report.flush()
+
+    async def flush_balances(self) -> None:
+        balances, self.balances = self.balances, defaultdict(dict)
+        async with self._balances_lock:
+            for column, values in balances.items():
+                await update_token_balances(values, column)
+
+    async def flush(self) -> None:
+        if self.report is not None:
+            self.report.flush()
+        await self.flush_balances()
+
+    async def close(self) -> None:
+        await self.flush()
+        if self.report is None:
+            return
+
+        self.report.close()
+        await self.logger_msg(
+            f"Report with {self.report.rows} rows saved to {self.report.path}",
+            type_msg="info"
+        )
+        self.report = None
@@ -0,0 +1,260 @@
+import asyncio
+import contextlib
+import random
+import time
+from collections import defaultdict, deque
+from typing import Awaitable, Callable, Hashable, Iterator, Literal, Sequence, TypeVar
+
+from src.models import Config
+
+T = TypeVar("T")
+
+StartMode = Literal["random", "spread"]
+ScheduleOrder = Literal["file", "round_robin", "group"]
+
+
+class StartPlanner:
+    def __init__(
+        self,
+        mode: StartMode = "random",
+        min_delay: float = 0.0,
+        max_delay: float = 0.0,
+        duration: float = 0.0,
+        order: ScheduleOrder = "file",
+        per_proxy_limit: int = 0
+    ) -> None:
+        self.mode = mode
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.duration = duration
+        self.order = order
+        self.per_proxy_limit = per_proxy_limit
+
+    @classmethod
+    def from_config(cls, config: Config) -> "StartPlanner":
+        return cls(
+            mode=config.start_schedule.mode,
+            min_delay=config.delay_before_start.min,
+            max_delay=config.delay_before_start.max,
+            duration=config.start_schedule.duration,
+            order=config.start_schedule.order,
+            per_proxy_limit=config.start_schedule.per_proxy_limit
+        )
+
+    @classmethod
+    def spread(cls, duration: float, order: ScheduleOrder = "file", per_proxy_limit: int = 0) -> "StartPlanner":
+        return cls(mode="spread", duration=duration, order=order, per_proxy_limit=per_proxy_limit)
+
+    def arrange(self, keys: Sequence[Hashable]) -> list[int]:
+        if self.order == "file":
+            return list(range(len(keys)))
+
+        groups: dict[Hashable, list[int]] = defaultdict(list)
+        for idx, key in enumerate(keys):
+            groups[key].append(idx)
+        if self.order == "group":
+            return [idx for group in groups.values() for idx in group]
+
+        queues = [deque(group) for group in groups.values()]
+        order: list[int] = []
+        while queues:
+            order.extend(group.popleft() for group in queues)
+            queues = [group for group in queues if group]
+        return order
+
+    def plan(self, count: int) -> list[float]:
+        if self.mode == "spread":
+            step = self.duration / count if count else 0.0
+            return [self.min_delay + idx * step for idx in range(count)]
+        if self.max_delay <= 0:
+            return [0.0] * count
+        return [random.uniform(self.min_delay, self.max_delay) for _ in range(count)]
+
+    def timing(self) -> tuple[StartMode, float, float, float]:
+        return self.mode, self.min_delay, self.max_delay, self.duration
+
+
+class LiveSchedule:
+    """Limits a running dispatch() re-reads: `update()` changes them without restarting it.
+
+    New `workers` take effect as soon as a slot frees up, `rate_limit` (starts per second,
+    0 - unlimited) on the next start, and a planner with different timing re-plans every
+    account that has not started yet, counting from the moment of the update.
+    """
+
+    def __init__(self, workers: int, rate_limit: float = 0.0, planner: StartPlanner | None = None) -> None:
+        self.workers = workers
+        self.rate_limit = rate_limit
+        self.planner = planner
+        self.plan_version = 0
+        self._listeners: set[asyncio.Event] = set()
+
+    @classmethod
+    def from_config(cls, config: Config, planner: StartPlanner | None = None) -> "LiveSchedule":
+        return cls(config.threads, config.start_schedule.rate_limit, planner)
+
+    def update(self, workers: int, rate_limit: float, planner: StartPlanner | None = None) -> bool:
+        """Apply new limits, returns True if pending starts are re-planned."""
+        self.workers = workers
+        self.rate_limit = rate_limit
+        replanned = (
+            planner is not None and self.planner is not None and planner.timing() != self.planner.timing()
+        )
+        if replanned:
+            self.planner = planner
+            self.plan_version += 1
+        for event in self._listeners:
+            event.set()
+        return replanned
+
+    @contextlib.contextmanager
+    def listen(self) -> Iterator[asyncio.Event]:
+        event = asyncio.Event()
+        self._listeners.add(event)
+        try:
+            yield event
+        finally:
+            self._listeners.discard(event)
+
+
+async def dispatch(
+    items: Sequence[T],
+    offsets: Sequence[float],
+    workers: int,
+    handler: Callable[[T], Awaitable[None]],
+    on_start: Callable[[T, float], None] | None = None,
+    key: Callable[[T], Hashable] | None = None,
+    per_key_limit: int = 0,
+    stop: asyncio.Event | None = None,
+    grace: float = 0.0,
+    live: LiveSchedule | None = None
+) -> None:
+    """Run `handler` over `items` with `workers` slots, each item released at its start offset.
+
+    Once `stop` is set no further items start; running handlers get `grace` seconds
+    before they are cancelled. With `live` its workers, rate limit and planner replace
+    `workers` and `offsets` whenever they are updated during the run.
+    """
+    queue: asyncio.Queue[tuple[T, float] | None] = asyncio.Queue()
+    order = sorted(range(len(items)), key=offsets.__getitem__)
+    running: dict[Hashable, int] = defaultdict(int)
+    deferred: dict[Hashable, deque[tuple[T, float]]] = defaultdict(deque)
+    stopped = stop.is_set if stop is not None else lambda: False
+    pool: set[asyncio.Task] = set()
+    idle: set[asyncio.Task] = set()
+
+    def slots() -> int:
+        return max(1, min(live.workers if live is not None else workers, len(items)))
+
+    def replan(pending: deque[tuple[float, int]]) -> deque[tuple[float, int]]:
+        now = time.monotonic()
+        indices = [idx for _, idx in pending]
+        planned = zip(live.planner.plan(len(indices)), indices)
+        return deque(sorted(((now + offset, idx) for offset, idx in planned), key=lambda entry: entry[0]))
+
+    async def release(changes: asyncio.Event | None) -> None:
+        started = time.monotonic()
+        pending = deque((started + offsets[idx], idx) for idx in order)
+        plan_version = live.plan_version if live is not None else 0
+        last = float("-inf")
+        while pending:
+            if live is not None and live.plan_version != plan_version:
+                plan_version = live.plan_version
+                pending = replan(pending)
+
+            due, idx = pending[0]
+            rate = live.rate_limit if live is not None else 0.0
+            delay = (max(due, last + 1 / rate) if rate else due) - time.monotonic()
+            if delay > 0:
+                if changes is None:
+                    await asyncio.sleep(delay)
+                else:
+                    # An update may bring the next start closer, so wake up on it and re-check
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(changes.wait(), delay)
+                    changes.clear()
+                continue
+
+            pending.popleft()
+            last = time.monotonic()
+            queue.put_nowait((items[idx], due))
+        # A single sentinel is passed on from worker to worker, however many there are by then
+        queue.put_nowait(None)
+
+    async def start(entry: tuple[T, float]) -> None:
+        item, due = entry
+        if on_start is not None:
+            on_start(item, time.monotonic() - due)
+        await handler(item)
+
+    async def worker() -> None:
+        task = asyncio.current_task()
+        while True:
+            if len(pool) > slots():
+                pool.discard(task)
+                return
+            idle.add(task)
+            try:
+                entry = await queue.get()
+            finally:
+                idle.discard(task)
+            if entry is None:
+                queue.put_nowait(None)
+                return
+            if stopped():
+                return
+            if key is None or not per_key_limit:
+                await start(entry)
+                continue
+
+            # Items over the limit wait until a worker running the same key finishes and picks them up
+            item_key = key(entry[0])
+            if running[item_key] >= per_key_limit:
+                deferred[item_key].append(entry)
+                continue
+
+            running[item_key] += 1
+            try:
+                while entry is not None:
+                    await start(entry)
+                    entry = deferred[item_key].popleft() if deferred[item_key] and not stopped() else None
+            finally:
+                running[item_key] -= 1
+
+    def spawn(tg: asyncio.TaskGroup) -> None:
+        for _ in range(slots() - len(pool)):
+            task = tg.create_task(worker())
+            pool.add(task)
+            task.add_done_callback(pool.discard)
+
+    async def scale(tg: asyncio.TaskGroup, changes: asyncio.Event) -> None:
+        while True:
+            await changes.wait()
+            changes.clear()
+            spawn(tg)
+            # Busy workers retire after their current item, idle ones right away
+            for task in list(idle)[:max(0, len(pool) - slots())]:
+                pool.discard(task)
+                task.cancel()
+
+    async def drain(releaser: asyncio.Task) -> None:
+        await stop.wait()
+        releaser.cancel()
+        queue.put_nowait(None)
+        _, running = await asyncio.wait(set(pool), timeout=grace)
+        for task in running:
+            task.cancel()
+
+    with contextlib.ExitStack() as listeners:
+        async with asyncio.TaskGroup() as tg:
+            releaser = tg.create_task(release(listeners.enter_context(live.listen()) if live else None))
+            spawn(tg)
+            helpers = []
+            if live is not None:
+                helpers.append(tg.create_task(scale(tg, listeners.enter_context(live.listen()))))
+            if stop is not None:
+                helpers.append(tg.create_task(drain(releaser)))
+            while pool:
+                await asyncio.wait(set(pool))
+            for task in helpers:
+                task.cancel()
@@ -0,0 +1,160 @@
+import asyncio
+import hmac
+import itertools
+import time
+from collections import OrderedDict
+from typing import Any
+
+import orjson
+from aiohttp import web
+from eth_utils import is_address, to_checksum_address
+
+from src.api import ClientPool
+from src.api.tracing import proxy_key
+from src.distributed import LOCAL_HOSTS
+from src.exceptions.custom_exceptions import ConfigurationError
+from src.logger import AsyncLogger
+from src.models import Config, unique_proxies
+from src.shutdown import shutdown_controller
+from src.tasks import CheckerModule
+
+
+class PointsService(AsyncLogger):
+    def __init__(self, config: Config) -> None:
+        super().__init__()
+        self.settings = config.service
+        self.pool = ClientPool(CheckerModule.BASE_URL)
+        proxies = {proxy_key(proxy): proxy for proxy in unique_proxies(config.accounts) if proxy}
+        self._proxies = itertools.cycle(list(proxies.values()) or [None])
+        self._slots = asyncio.Semaphore(self.settings.concurrency)
+        # Every entry lives cache_ttl seconds, so insertion order is also expiry order
+        self._cache: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.stats = {"lookups": 0, "cache_hits": 0, "coalesced": 0, "upstream": 0, "failed": 0}
+
+    async def run(self) -> None:
+        if not self.settings.token and self.settings.host not in LOCAL_HOSTS:
+            raise ConfigurationError(
+                "service.token is required when the service listens on a non-local address"
+            )
+
+        app = web.Application(middlewares=[self._authorize])
+        app.router.add_post("/points", self.handle_batch)
+        app.router.add_get("/points/{address}", self.handle_single)
+        app.router.add_get("/stats", self.handle_stats)
+
+        runner = web.AppRunner(app, access_log=None, shutdown_timeout=shutdown_controller.grace)
+        await runner.setup()
+        await web.TCPSite(runner, self.settings.host, self.settings.port).start()
+        await self.logger_msg(
+            f"Points service listening on http://{self.settings.host}:{self.settings.port}",
+            type_msg="info"
+        )
+
+        try:
+            await shutdown_controller.event.wait()
+        finally:
+            await runner.cleanup()
+            await self.pool.close()
+        await self.logger_msg("Points service stopped", type_msg="info")
+
+    @web.middleware
+    async def _authorize(self, request: web.Request, handler) -> web.StreamResponse:
+        token = self.settings.token
+        if token and not hmac.compare_digest(
+            request.headers.get("Authorization", ""), f"Bearer {token}"
+        ):
+            raise web.HTTPUnauthorized()
+        return await handler(request)
+
+    async def lookup(self, address: str) -> dict[str, Any]:
+        self.stats["lookups"] += 1
+        cached = self._cache.get(address)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                self.stats["cache_hits"] += 1
+                return {"address": address, "points": cached[1], "cached": True}
+            del self._cache[address]
+
+        task = self._inflight.get(address)
+        if task is None:
+            task = self._inflight[address] = asyncio.create_task(self._fetch(address))
+            task.add_done_callback(lambda _: self._inflight.pop(address, None))
+        else:
+            self.stats["coalesced"] += 1
+
+        try:
+            points = await asyncio.shield(task)
+        except Exception as e:
+            return {"address": address, "error": str(e)}
+        if points is False:
+            return {"address": address, "error": "Lookup failed"}
+        return {"address": address, "points": points, "cached": False}
+
+    async def _fetch(self, address: str) -> Any:
+        async with self._slots:
+            self.stats["upstream"] += 1
+            points = await CheckerModule.fetch_points(self.pool.get(next(self._proxies)), address)
+
+        if points is False:
+            self.stats["failed"] += 1
+        elif self.settings.cache_ttl > 0:
+            self._remember(address, points)
+        return points
+
+    def _remember(self, address: str, points: Any) -> None:
+        now = time.monotonic()
+        self._cache.pop(address, None)
+        self._cache[address] = (now + self.settings.cache_ttl, points)
+        while self._cache:
+            oldest, (expires, _) = next(iter(self._cache.items()))
+            if expires > now and len(self._cache) <= self.settings.cache_size:
+                break
+            del self._cache[oldest]
+
+    @staticmethod
+    def _parse_address(value: Any) -> str:
+        if not isinstance(value, str) or not is_address(value):
+            raise web.HTTPBadRequest(text=f"Invalid address: {value}")
+        return to_checksum_address(value)
+
+    async def handle_batch(self, request: web.Request) -> web.StreamResponse:
+        try:
+            payload = await request.json()
+        except ValueError:
+            raise web.HTTPBadRequest(text="Body must be JSON")
+
+        addresses = payload.get("addresses") if isinstance(payload, dict) else payload
+        if not isinstance(addresses, list):
+            raise web.HTTPBadRequest(text='Expected {"addresses": [...]}')
+        if len(addresses) > self.settings.max_batch:
+            raise web.HTTPRequestEntityTooLarge(
+                max_size=self.settings.max_batch, actual_size=len(addresses)
+            )
+        addresses = list(dict.fromkeys(self._parse_address(address) for address in addresses))
+
+        response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        await response.prepare(request)
+
+        pending = [asyncio.create_task(self.lookup(address)) for address in addresses]
+        try:
+            for result in asyncio.as_completed(pending):
+                await response.write(orjson.dumps(await result) + b"\n")
+        finally:
+            for task in pending:
+                task.cancel()
+
+        await response.write_eof()
+        return response
+
+    async def handle_single(self, request: web.Request) -> web.Response:
+        result = await self.lookup(self._parse_address(request.match_info["address"]))
+        return web.json_response(result, status=502 if "error" in result else 200)
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response({
+            **self.stats,
+            "cached": len(self._cache),
+            "in_flight": len(self._inflight),
+            "clients": len(self.pool)
+        })
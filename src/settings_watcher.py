@@ -0,0 +1,103 @@
+import asyncio
+import contextlib
+import signal
+from typing import AsyncIterator
+
+from src.logger import AsyncLogger
+from src.models import Config, ReloadSettings
+from src.scheduler import LiveSchedule, StartPlanner
+from src.utils.load_config import ConfigLoader
+
+
+class SettingsWatcher(AsyncLogger):
+    """Re-reads settings.yaml during a run and applies its live values to a LiveSchedule.
+
+    The file is checked every `interval` seconds and re-read when it changed, or at once
+    on SIGHUP. A file that fails to load is reported and the current values stay in effect.
+    With `shares` processes each re-reading the file, each gets its share of the rate limit.
+    """
+
+    def __init__(
+        self,
+        schedule: LiveSchedule,
+        settings: ReloadSettings,
+        signals: bool = True,
+        shares: int = 1
+    ) -> None:
+        super().__init__()
+        self.schedule = schedule
+        self.settings = settings
+        self.signals = signals
+        self.shares = shares
+        self.loader = ConfigLoader()
+        # Unknown until the first check, which also catches edits made while the run was starting
+        self._mtime: int | None = None
+        self._wakeup: asyncio.Event | None = None
+
+    def _stat(self) -> int | None:
+        try:
+            return self.loader.settings_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def apply(self, config: Config) -> list[str]:
+        schedule = self.schedule
+        changes = []
+        if config.threads != schedule.workers:
+            changes.append(f"threads {schedule.workers} → {config.threads}")
+        rate_limit = config.start_schedule.rate_limit / self.shares
+        if rate_limit != schedule.rate_limit:
+            changes.append(f"rate limit {schedule.rate_limit:g} → {rate_limit:g}/s")
+
+        if schedule.update(config.threads, rate_limit, StartPlanner.from_config(config)):
+            changes.append("start delays re-planned for waiting accounts")
+        return changes
+
+    async def reload(self) -> None:
+        try:
+            config = self.loader.load_settings()
+        except Exception as e:
+            await self.logger_msg(f"Settings not reloaded, keeping current values: {e}", type_msg="warning")
+            return
+
+        changes = self.apply(config)
+        if changes:
+            await self.logger_msg(f"⚙ Settings reloaded: {', '.join(changes)}", type_msg="info")
+        else:
+            await self.logger_msg("Settings reloaded, no live values changed", type_msg="debug")
+
+    async def _run(self) -> None:
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self.settings.interval)
+            forced = self._wakeup.is_set()
+            self._wakeup.clear()
+
+            mtime = self._stat()
+            if forced or mtime != self._mtime:
+                self._mtime = mtime
+                await self.reload()
+
+    @contextlib.asynccontextmanager
+    async def watch(self) -> AsyncIterator[LiveSchedule]:
+        if not self.settings.enabled:
+            yield self.schedule
+            return
+
+        loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        hangup = getattr(signal, "SIGHUP", None) if self.signals else None
+        if hangup is not None:
+            try:
+                loop.add_signal_handler(hangup, self._wakeup.set)
+            except NotImplementedError:
+                hangup = None
+
+        task = asyncio.create_task(self._run())
+        try:
+            yield self.schedule
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            if hangup is not None:
+                loop.remove_signal_handler(hangup)
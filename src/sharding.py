@@ -0,0 +1,262 @@
+import asyncio
+import multiprocessing
+import queue
+import signal
+import sys
+import time
+from typing import Any, Callable
+
+from src.api import request_tracer
+from src.api.rpc_gateway import close_rpc_gateway
+from src.logger import AsyncLogger
+from src.models import Account, AccountTable, Config, ReloadSettings, WarmupSettings, proxy_keys
+from src.scheduler import LiveSchedule, StartPlanner, dispatch
+from src.settings_watcher import SettingsWatcher
+from src.shutdown import shutdown_controller
+from src.task_manager import TaskManager
+from src.utils import AccountProgress
+
+ShardRow = tuple[int, str, str | None]
+
+
+def _shard_rows(config: Config, processes: int) -> list[list[ShardRow]]:
+    keys = proxy_keys(config.accounts)
+    groups: dict[Any, list[int]] = {}
+    for idx, key in enumerate(keys):
+        groups.setdefault(key, []).append(idx)
+
+    schedule = config.start_schedule
+    if (schedule.order != "file" or schedule.per_proxy_limit) and len(groups) >= processes:
+        # Keep every proxy in one process so its connections and per-proxy limit are not split
+        shards: list[list[int]] = [[] for _ in range(processes)]
+        for group in sorted(groups.values(), key=len, reverse=True):
+            min(shards, key=len).extend(group)
+        for shard in shards:
+            shard.sort()
+    else:
+        shards = [list(range(shard, len(keys), processes)) for shard in range(processes)]
+
+    return [[_shard_row(idx, config.accounts[idx]) for idx in shard] for shard in shards]
+
+
+def _shard_row(idx: int, account: Account) -> ShardRow:
+    return idx, account.mnemonic, account.proxy.as_url if account.proxy else None
+
+
+async def run_rows(
+    module: str,
+    rows: list[ShardRow],
+    threads: int,
+    planner: StartPlanner,
+    emit: Callable[[int, str, bool, Any, float], None],
+    accounts: AccountTable | None = None,
+    stop: asyncio.Event | None = None,
+    grace: float = 0.0,
+    live: LiveSchedule | None = None
+) -> None:
+    logger = AsyncLogger()
+    process_func = getattr(TaskManager, f"process_{module}")
+    if accounts is None:
+        accounts = AccountTable.from_rows((mnemonic, proxy) for _, mnemonic, proxy in rows)
+
+    async def handle(position: int) -> None:
+        idx = rows[position][0]
+        account = accounts[position]
+        address = account.address
+        started = time.perf_counter()
+        try:
+            result = await process_func(account)
+            if isinstance(result, tuple) and len(result) == 2:
+                success, data = result
+            else:
+                success, data = bool(result), result
+        except Exception as e:
+            await logger.logger_msg(
+                f"Error: {str(e)}",
+                address=address,
+                type_msg="error",
+                method_name="run_rows"
+            )
+            success, data = False, str(e)
+        emit(idx, address, success, data, time.perf_counter() - started)
+
+    keys = accounts.proxy_ids()
+    await dispatch(
+        planner.arrange(keys), planner.plan(len(rows)), threads, handle,
+        key=keys.__getitem__, per_key_limit=planner.per_proxy_limit,
+        stop=stop, grace=grace, live=live
+    )
+
+
+def run_shard(
+    shard: int,
+    module: str,
+    rows: list[ShardRow],
+    threads: int,
+    planner: StartPlanner,
+    warmup: WarmupSettings,
+    results: multiprocessing.Queue,
+    base_url: str,
+    stop_requested: multiprocessing.Event,
+    grace: float,
+    rate_limit: float,
+    reload: ReloadSettings,
+    processes: int = 1,
+    keep_samples: bool = False
+) -> None:
+    from src.tasks import CheckerModule
+
+    CheckerModule.BASE_URL = base_url
+    TaskManager.disable_inplace_writes()
+    if keep_samples:
+        request_tracer.samples = []
+    # Ctrl+C reaches the whole process group; the parent decides when and how shards stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+    async def watch_stop(stop: asyncio.Event) -> None:
+        while not stop_requested.is_set():
+            await asyncio.sleep(ShardedRunner.POLL_INTERVAL)
+        stop.set()
+
+    async def run() -> None:
+        accounts = AccountTable.from_rows((mnemonic, proxy) for _, mnemonic, proxy in rows)
+        stop = asyncio.Event()
+        watcher = asyncio.create_task(watch_stop(stop))
+        # Every shard re-reads settings.yaml itself: threads stay per process, the rate limit is split
+        live = LiveSchedule(threads, rate_limit / processes, planner)
+        try:
+            async with (
+                TaskManager.shared_clients(module, accounts, warmup),
+                SettingsWatcher(live, reload, signals=False, shares=processes).watch()
+            ):
+                await run_rows(
+                    module, rows, threads, planner,
+                    lambda *result: results.put(("result", *result)),
+                    accounts, stop, grace, live
+                )
+        finally:
+            watcher.cancel()
+            await close_rpc_gateway()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        results.put(("done", shard, dict(request_tracer.stats), request_tracer.samples))
+
+
+class ShardedRunner(AsyncLogger):
+    POLL_INTERVAL = 0.5
+    STOP_MARGIN = 5.0
+
+    def __init__(self, module: str, config: Config, progress: AccountProgress) -> None:
+        super().__init__()
+        self.module = module
+        self.config = config
+        self.progress = progress
+        self.processes = min(config.processes, len(config.accounts)) or 1
+
+    async def run(self) -> list[tuple[bool, Any]]:
+        from src.tasks import CheckerModule
+
+        context = multiprocessing.get_context("spawn")
+        results_queue = context.Queue()
+        stop_requested = context.Event()
+        planner = StartPlanner.from_config(self.config)
+        shards = _shard_rows(self.config, self.processes)
+
+        workers = [
+            context.Process(
+                target=run_shard,
+                args=(
+                    shard,
+                    self.module,
+                    shards[shard],
+                    self.config.threads,
+                    planner,
+                    self.config.warmup,
+                    results_queue,
+                    CheckerModule.BASE_URL,
+                    stop_requested,
+                    shutdown_controller.grace,
+                    self.config.start_schedule.rate_limit,
+                    self.config.reload,
+                    self.processes,
+                    request_tracer.samples is not None
+                ),
+                daemon=True
+            )
+            for shard in range(self.processes)
+        ]
+        for process in workers:
+            process.start()
+
+        await self.logger_msg(
+            f"Started {self.processes} worker processes for {len(self.config.accounts)} accounts",
+            type_msg="info"
+        )
+
+        try:
+            return await self._collect(results_queue, workers, stop_requested)
+        finally:
+            for process in workers:
+                if process.is_alive():
+                    process.terminate()
+                process.join(timeout=5)
+
+    async def _collect(
+        self,
+        results_queue: multiprocessing.Queue,
+        workers: list[multiprocessing.Process],
+        stop_requested: multiprocessing.Event
+    ) -> list[tuple[bool, Any]]:
+        loop = asyncio.get_running_loop()
+        results: list[tuple[bool, Any]] = [(False, "Not started")] * len(self.config.accounts)
+        sink = TaskManager.create_sink(self.module, self.config.report)
+        finished: set[int] = set()
+        stop_by: float | None = None
+
+        try:
+            while len(finished) < len(workers):
+                if shutdown_controller.stopping and stop_by is None:
+                    stop_requested.set()
+                    stop_by = time.monotonic() + shutdown_controller.grace + self.STOP_MARGIN
+                if stop_by is not None and time.monotonic() > stop_by:
+                    break
+
+                try:
+                    item = await loop.run_in_executor(
+                        None, results_queue.get, True, self.POLL_INTERVAL
+                    )
+                except queue.Empty:
+                    for shard, process in enumerate(workers):
+                        if shard not in finished and not process.is_alive() and process.exitcode:
+                            await self.logger_msg(
+                                f"Worker {shard} exited with code {process.exitcode}",
+                                type_msg="error",
+                                method_name="_collect"
+                            )
+                            finished.add(shard)
+                    continue
+
+                match item:
+                    case ("result", idx, address, success, data, latency):
+                        results[idx] = (success, data)
+                        await sink.add(self.config.accounts[idx].mnemonic, address, success, data, latency)
+                        self.progress.increment()
+                        await self.logger_msg(
+                            f"Processed accounts: {self.progress.processed}/{self.progress.total}",
+                            type_msg="info"
+                        )
+                    case ("done", shard, stats, samples):
+                        request_tracer.merge(stats, samples)
+                        finished.add(shard)
+        finally:
+            await sink.close()
+        return results
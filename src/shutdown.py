@@ -0,0 +1,96 @@
+import asyncio
+import contextlib
+import signal
+from typing import AsyncIterator
+
+from src.logger import AsyncLogger
+from src.models import ShutdownSettings
+
+
+class ShutdownController(AsyncLogger):
+    """Turns SIGINT/SIGTERM and the run deadline into a graceful drain.
+
+    The first signal stops new accounts from starting and gives running ones `grace`
+    seconds to finish; a second signal cancels them at once. Either way the runners'
+    cleanup still flushes every completed result.
+    """
+
+    SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.settings = ShutdownSettings()
+        self.reason: str | None = None
+        self._event: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._notices: set[asyncio.Task] = set()
+
+    @property
+    def event(self) -> asyncio.Event:
+        if self._event is None:
+            self._event = asyncio.Event()
+        return self._event
+
+    @property
+    def stopping(self) -> bool:
+        return self._event is not None and self._event.is_set()
+
+    @property
+    def grace(self) -> float:
+        return self.settings.grace
+
+    def request(self, reason: str) -> None:
+        if self.stopping:
+            if reason != "deadline" and self._task is not None:
+                self._task.cancel()
+            return
+
+        self.reason = reason
+        self.event.set()
+        cause = "Run deadline reached" if reason == "deadline" else f"{reason} received"
+        notice = asyncio.ensure_future(self.logger_msg(
+            f"🛑 {cause}: no new accounts will start, waiting up to {self.grace:.0f}s "
+            f"for running ones (send it again to stop now)",
+            type_msg="warning"
+        ))
+        self._notices.add(notice)
+        notice.add_done_callback(self._notices.discard)
+
+    @contextlib.asynccontextmanager
+    async def guard(self, settings: ShutdownSettings | None = None) -> AsyncIterator[asyncio.Event]:
+        loop = asyncio.get_running_loop()
+        self.settings = settings or self.settings
+        self.reason = None
+        self._event = asyncio.Event()
+        self._task = asyncio.current_task()
+
+        installed: list[signal.Signals] = []
+        previous: dict[signal.Signals, object] = {}
+        for sig in self.SIGNALS:
+            try:
+                loop.add_signal_handler(sig, self.request, sig.name)
+                installed.append(sig)
+            except NotImplementedError:
+                previous[sig] = signal.signal(
+                    sig, lambda signum, frame: loop.call_soon_threadsafe(self.request, signal.Signals(signum).name)
+                )
+
+        deadline = (
+            loop.call_later(self.settings.deadline, self.request, "deadline")
+            if self.settings.deadline
+            else None
+        )
+        try:
+            yield self.event
+        finally:
+            if deadline is not None:
+                deadline.cancel()
+            for sig in installed:
+                loop.remove_signal_handler(sig)
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+            self._task = None
+            await asyncio.gather(*self._notices, return_exceptions=True)
+
+
+shutdown_controller = ShutdownController()
@@ -1,9 +1,77 @@
+import contextlib
+from typing import Any, AsyncIterator
+
+from src.api import ClientPool
+from src.api.rpc_gateway import get_rpc_gateway
+from src.api.warmup import ConnectionWarmer
 from src.tasks import *
-from src.models import Account
+from src.models import Account, AccountTable, ReportSettings, WarmupSettings, unique_proxies
+from src.report import ResultSink
 
 
 class TaskManager:
+    RESULT_COLUMNS = {
+        "checker": "Tokens",
+        "sfi_balance": BalanceModule.COLUMN
+    }
+    PER_ADDRESS_MODULES = frozenset({"hd_scan"})
+
+    @classmethod
+    def create_sink(cls, module: str, settings: ReportSettings) -> ResultSink:
+        if module == "pipeline":
+            steps = {step: cls.RESULT_COLUMNS.get(step) for step in PipelineModule.steps()}
+            return ResultSink(module, settings, steps=steps)
+        return ResultSink(
+            module, settings, cls.RESULT_COLUMNS.get(module), module in cls.PER_ADDRESS_MODULES
+        )
+
+    @staticmethod
+    def disable_inplace_writes() -> None:
+        CheckerModule.WRITE_BALANCE = False
+        BalanceModule.WRITE_BALANCE = False
+
+    @staticmethod
+    @contextlib.asynccontextmanager
+    async def shared_clients(
+        module: str,
+        accounts: AccountTable | list[Account],
+        warmup: WarmupSettings
+    ) -> AsyncIterator[ClientPool]:
+        # No per-connector cap: dispatch() bounds concurrent accounts by the live thread count
+        pool = CheckerModule.CLIENT_POOL = ClientPool(CheckerModule.BASE_URL, connection_limit=0)
+        try:
+            if warmup.enabled:
+                steps = PipelineModule.steps() if module == "pipeline" else [module]
+                clients = []
+                if {"checker", "hd_scan"} & set(steps):
+                    for proxy in unique_proxies(accounts):
+                        pool.get(proxy)
+                    clients += pool.clients()
+                if "sfi_balance" in steps:
+                    clients += [endpoint.client for endpoint in get_rpc_gateway().endpoints]
+                await ConnectionWarmer(warmup.connections_per_host, warmup.dns_ttl, warmup.timeout).warm(clients)
+            yield pool
+        finally:
+            CheckerModule.CLIENT_POOL = None
+            await pool.close()
+
     @staticmethod
     async def process_checker(account: Account) -> str | bool:
         async with CheckerModule(account) as module:
-            return await module.run()
\ No newline at end of file
+            return await module.run()
+
+    @staticmethod
+    async def process_sfi_balance(account: Account) -> str | bool:
+        async with BalanceModule(account) as module:
+            return await module.run()
+
+    @staticmethod
+    async def process_hd_scan(account: Account) -> list | bool:
+        async with HDScanModule(account) as module:
+            return await module.run()
+
+    @staticmethod
+    async def process_pipeline(account: Account) -> tuple[bool, dict[str, Any]]:
+        async with PipelineModule(account) as module:
+            results = await module.run()
+        return all(value is not False for value in results.values()), results
@@ -1 +1,4 @@
 from .checker import CheckerModule
+from .balance import BalanceModule
+from .hd_scan import HDScanModule
+from .pipeline import PipelineModule
\ No newline at end of file
@@ -0,0 +1,89 @@
+import asyncio
+from decimal import Decimal
+from typing import Self
+
+from src.api.multicall import BalanceBatcher, MulticallBalanceReader
+from src.api.rpc_gateway import get_rpc_gateway
+from src.exceptions.custom_exceptions import ConfigurationError
+from src.logger import AsyncLogger
+from src.models import Account, OnchainSettings
+from src.utils import get_address, load_settings
+from src.utils.utils import update_token_balance
+
+
+class BalanceModule:
+    logger = AsyncLogger()
+    WRITE_BALANCE = True
+    COLUMN = "SFI Balance"
+    _settings: OnchainSettings | None = None
+    _batcher: BalanceBatcher | None = None
+
+    def __init__(self, account: Account) -> None:
+        self.account = account
+        self.wallet_address = get_address(account.mnemonic)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    @classmethod
+    def batcher(cls) -> BalanceBatcher:
+        if cls._settings is None:
+            cls._settings = load_settings().onchain
+        if not cls._settings.token_address:
+            raise ConfigurationError("onchain.token_address is not set in settings.yaml")
+
+        loop = asyncio.get_running_loop()
+        if cls._batcher is None or cls._batcher.loop is not loop:
+            reader = MulticallBalanceReader(
+                gateway=get_rpc_gateway(),
+                token_address=cls._settings.token_address,
+                chunk_size=cls._settings.chunk_size
+            )
+            cls._batcher = BalanceBatcher(reader, cls._settings.linger)
+        return cls._batcher
+
+    async def run(self) -> str | bool:
+        return await self.check(self.account, self.wallet_address)
+
+    @classmethod
+    async def check(cls, account: Account, wallet_address: str) -> str | bool:
+        await cls.logger.logger_msg(
+            msg="Processing SFI balance...",
+            type_msg="info", address=wallet_address
+        )
+
+        try:
+            batcher = cls.batcher()
+            raw_balance, decimals = await asyncio.gather(
+                batcher.balance_of(wallet_address), batcher.decimals()
+            )
+
+            if raw_balance is None:
+                await cls.logger.logger_msg(
+                    msg="Token contract did not return a balance",
+                    type_msg="error", address=wallet_address,
+                    class_name=cls.__name__, method_name="check"
+                )
+                return False
+
+            balance = f"{Decimal(raw_balance).scaleb(-decimals).normalize():f}"
+            await cls.logger.logger_msg(
+                msg=f"SFI balance: {balance}",
+                type_msg="success", address=wallet_address
+            )
+
+            if cls.WRITE_BALANCE:
+                await update_token_balance(account, balance, cls.COLUMN)
+
+            return balance
+
+        except Exception as e:
+            await cls.logger.logger_msg(
+                msg=f"Critical error: {str(e)}",
+                type_msg="error", address=wallet_address,
+                class_name=cls.__name__, method_name="check"
+            )
+            return False
@@ -1,6 +1,7 @@
-from typing import Self
+from typing import Any, Self
 
-from src.api import BaseAPIClient
+from src.api import BaseAPIClient, ClientPool
+from src.api.fingerprints import frozen_headers
 from src.wallet import Wallet
 from src.logger import AsyncLogger
 from src.models import Account
@@ -10,41 +11,69 @@ from src.utils.utils import update_token_balance
 class CheckerModule(Wallet):
     logger = AsyncLogger()
     ATTEMPTS = 3
+    MAX_BODY_SIZE = 1 << 20
+    BASE_URL = "https://staking-mainnet.singularityfinance.ai"
+    WRITE_BALANCE = True
+    CLIENT_POOL: ClientPool | None = None
+    HEADERS = frozen_headers({
+        'accept': 'application/json, text/plain, */*',
+        'accept-language': 'ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7,pt;q=0.6,uk;q=0.5',
+        'cache-control': 'no-cache',
+        'origin': 'https://singularityfinance.ai',
+        'pragma': 'no-cache',
+        'priority': 'u=1, i',
+        'referer': 'https://singularityfinance.ai/',
+        'sec-fetch-dest': 'empty',
+        'sec-fetch-mode': 'cors',
+        'sec-fetch-site': 'same-site'
+    })
     
     def __init__(self, account: Account) -> None:
-        Wallet.__init__(self, account.mnemonic, "https://ethereum.publicnode.com", account.proxy)
+        Wallet.__init__(self, account.mnemonic, proxy=account.proxy)
         self.account = account
         self.api_client: BaseAPIClient | None = None
 
     async def __aenter__(self) -> Self:
         await Wallet.__aenter__(self)
+        if self.CLIENT_POOL is not None:
+            self.api_client = self.CLIENT_POOL.get(self.account.proxy)
+            return self
+
         self.api_client = BaseAPIClient(
-            base_url="https://staking-mainnet.singularityfinance.ai",
+            base_url=self.BASE_URL,
             proxy=self.account.proxy
         )
         await self.api_client.__aenter__()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if hasattr(self, 'api_client') and self.api_client:
+        if self.api_client and self.CLIENT_POOL is None:
             await self.api_client.__aexit__(exc_type, exc_val, exc_tb)
         await Wallet.__aexit__(self, exc_type, exc_val, exc_tb)
 
-    def _get_headers(self) -> dict[str, str]:
-        return {
-            'accept': 'application/json, text/plain, */*',
-            'accept-language': 'ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7,pt;q=0.6,uk;q=0.5',
-            'cache-control': 'no-cache',
-            'origin': 'https://singularityfinance.ai',
-            'pragma': 'no-cache',
-            'priority': 'u=1, i',
-            'referer': 'https://singularityfinance.ai/',
-            'sec-ch-ua-mobile': '?0',
-            'sec-ch-ua-platform': '"Windows"',
-            'sec-fetch-dest': 'empty',
-            'sec-fetch-mode': 'cors',
-            'sec-fetch-site': 'same-site'
-        }
+    @staticmethod
+    def _extract_points(data: Any) -> Any:
+        return data.get("totalPoints") if isinstance(data, dict) else None
+
+    @classmethod
+    async def fetch_points(cls, api_client: BaseAPIClient, wallet_address: str) -> str | bool:
+        for _ in range(cls.ATTEMPTS):
+            response = await api_client.send_request(
+                request_type="GET",
+                method="/staking/v1/dashboard",
+                params={'walletAddress': wallet_address},
+                headers=cls.HEADERS,
+                verify=False,
+                response_mode="json",
+                max_body_size=cls.MAX_BODY_SIZE,
+                extract=cls._extract_points,
+                hedge=True
+            )
+            
+            if response.get("status_code") == 200:
+                return response.get("data")
+            
+        return False
         
     async def run(self) -> str | bool:
         await self.logger.logger_msg(
@@ -53,31 +82,19 @@ class CheckerModule(Wallet):
         )
 
         try:
-            for _ in range(self.ATTEMPTS):
-                response = await self.api_client.send_request(
-                    request_type="GET",
-                    method="/staking/v1/dashboard",
-                    params={'walletAddress': self.wallet_address},
-                    headers=self._get_headers(),
-                    verify=False
-                )
-                
-                if response.get("status_code") == 200:
-                    response = response.get("data")
-                    token_amount = response.get("totalPoints")
-                    
-                    await self.logger.logger_msg(
-                        msg=f"Token amount: {token_amount}",
-                        type_msg="success", address=self.wallet_address
-                    )
-                    
-                    await update_token_balance(self.account, token_amount)
-                    
-                    return token_amount
-                else:
-                    continue
-                
-            return False
+            token_amount = await self.fetch_points(self.api_client, self.wallet_address)
+            if token_amount is False:
+                return False
+            
+            await self.logger.logger_msg(
+                msg=f"Token amount: {token_amount}",
+                type_msg="success", address=self.wallet_address
+            )
+            
+            if self.WRITE_BALANCE:
+                await update_token_balance(self.account, token_amount)
+            
+            return token_amount
         
         except Exception as e:
             await self.logger.logger_msg(
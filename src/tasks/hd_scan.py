@@ -0,0 +1,117 @@
+import asyncio
+from typing import Any, Self
+
+from src.api import BaseAPIClient
+from src.logger import AsyncLogger
+from src.models import Account, HDScanSettings
+from src.utils import get_address, load_settings, normalize_secret
+from src.utils.hd_keychain import HDKeychain
+from .checker import CheckerModule
+
+
+class HDScanModule:
+    logger = AsyncLogger()
+    _settings: HDScanSettings | None = None
+
+    def __init__(self, account: Account) -> None:
+        self.account = account
+        self.wallet_address = get_address(account.mnemonic)
+        self.api_client: BaseAPIClient | None = None
+
+    async def __aenter__(self) -> Self:
+        if CheckerModule.CLIENT_POOL is not None:
+            self.api_client = CheckerModule.CLIENT_POOL.get(self.account.proxy)
+            return self
+
+        self.api_client = BaseAPIClient(base_url=CheckerModule.BASE_URL, proxy=self.account.proxy)
+        await self.api_client.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.api_client and CheckerModule.CLIENT_POOL is None:
+            await self.api_client.__aexit__(exc_type, exc_val, exc_tb)
+
+    @classmethod
+    def settings(cls) -> HDScanSettings:
+        if cls._settings is None:
+            cls._settings = load_settings().hd_scan
+        return cls._settings
+
+    @classmethod
+    def paths(cls) -> list[str]:
+        settings = cls.settings()
+        if settings.paths:
+            return list(settings.paths)
+        return [
+            settings.path.format(index=index)
+            for index in range(settings.start, settings.start + settings.count)
+        ]
+
+    @staticmethod
+    def _used(points: Any) -> bool:
+        try:
+            return points is not False and points is not None and float(points) > 0
+        except (TypeError, ValueError):
+            return False
+
+    @classmethod
+    async def scan(cls, account: Account, wallet_address: str, api_client: BaseAPIClient) -> list[list[Any]]:
+        settings = cls.settings()
+        secret = normalize_secret(account.mnemonic)
+        if " " not in secret:
+            return [["", wallet_address, await CheckerModule.fetch_points(api_client, wallet_address)]]
+
+        keychain = await asyncio.to_thread(HDKeychain, secret, settings.passphrase)
+        paths = cls.paths()
+        window = settings.gap_limit or len(paths)
+        results: list[list[Any]] = []
+        gap = 0
+
+        for offset in range(0, len(paths), window):
+            batch = [(path, keychain.address(path)) for path in paths[offset:offset + window]]
+            points = await asyncio.gather(*(
+                CheckerModule.fetch_points(api_client, address) for _, address in batch
+            ))
+            for (path, address), value in zip(batch, points):
+                results.append([path, address, value])
+                gap = 0 if cls._used(value) else gap + 1
+                if settings.gap_limit and gap >= settings.gap_limit:
+                    return results
+        return results
+
+    async def run(self) -> list[list[Any]] | bool:
+        return await self.check(self.account, self.wallet_address, self.api_client)
+
+    @classmethod
+    async def check(
+        cls, account: Account, wallet_address: str, api_client: BaseAPIClient
+    ) -> list[list[Any]] | bool:
+        await cls.logger.logger_msg(
+            msg="Scanning derived addresses...",
+            type_msg="info", address=wallet_address
+        )
+
+        try:
+            results = await cls.scan(account, wallet_address, api_client)
+            for path, address, points in results:
+                if cls._used(points):
+                    await cls.logger.logger_msg(
+                        msg=f"{path or 'private key'}: {points} points",
+                        type_msg="success", address=address
+                    )
+
+            used = sum(1 for *_, points in results if cls._used(points))
+            failed = sum(1 for *_, points in results if points is False)
+            await cls.logger.logger_msg(
+                msg=f"Scanned {len(results)} addresses: {used} with points, {failed} failed",
+                type_msg="info", address=wallet_address
+            )
+            return results if failed < len(results) else False
+
+        except Exception as e:
+            await cls.logger.logger_msg(
+                msg=f"Critical error: {str(e)}",
+                type_msg="error", address=wallet_address,
+                class_name=cls.__name__, method_name="check"
+            )
+            return False
@@ -0,0 +1,47 @@
+from typing import Any
+
+from src.exceptions.custom_exceptions import ConfigurationError
+from src.models import PipelineSettings
+from src.utils import load_settings
+from .balance import BalanceModule
+from .checker import CheckerModule
+from .hd_scan import HDScanModule
+
+
+class PipelineModule(CheckerModule):
+    """Runs the configured modules for one account inside a single wallet and API client context.
+
+    Every step gets this module's account, address and API client instead of opening its own.
+    """
+
+    _settings: PipelineSettings | None = None
+
+    @classmethod
+    def settings(cls) -> PipelineSettings:
+        if cls._settings is None:
+            cls._settings = load_settings().pipeline
+        return cls._settings
+
+    @classmethod
+    def steps(cls) -> list[str]:
+        return list(cls.settings().modules)
+
+    async def run_step(self, step: str, wallet_address: str) -> Any:
+        match step:
+            case "checker":
+                return await CheckerModule.run(self)
+            case "sfi_balance":
+                return await BalanceModule.check(self.account, wallet_address)
+            case "hd_scan":
+                return await HDScanModule.check(self.account, wallet_address, self.api_client)
+        raise ConfigurationError(f"Module {step} cannot run in a pipeline")
+
+    async def run(self) -> dict[str, Any]:
+        settings = self.settings()
+        wallet_address = self.wallet_address
+        results: dict[str, Any] = {}
+        for step in settings.modules:
+            results[step] = await self.run_step(step, wallet_address)
+            if results[step] is False and settings.stop_on_failure:
+                break
+        return results
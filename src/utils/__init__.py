@@ -1,3 +1,4 @@
 from .load_config import *
 from .bot_utils import *
+from .derivation_index import *
 from .utils import *
\ No newline at end of file
@@ -0,0 +1,275 @@
+import asyncio
+import hashlib
+import mmap
+import os
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Iterable
+
+from eth_account import Account
+from eth_utils import to_checksum_address
+
+from src.logger import AsyncLogger
+from src.utils.load_config import ConfigLoader, load_settings
+
+Account.enable_unaudited_hdwallet_features()
+
+_ACCOUNT = Account()
+
+MAGIC = b"SFIDIDX\x01"
+HEADER = struct.Struct("<8s16sII")
+DIGEST_SIZE = 16
+ADDRESS_SIZE = 20
+SLOT_SIZE = DIGEST_SIZE + ADDRESS_SIZE
+EMPTY = bytes(DIGEST_SIZE)
+MIN_CAPACITY = 1024
+PRIME_CHUNK = 5000
+
+
+def normalize_secret(secret: str) -> str:
+    words = secret.split()
+    if len(words) in (12, 24):
+        return " ".join(words)
+    secret = secret.strip()
+    return secret if secret.startswith("0x") else "0x" + secret
+
+
+@lru_cache(maxsize=65536)
+def derive_address(secret: str) -> str:
+    secret = normalize_secret(secret)
+    if " " in secret:
+        return _ACCOUNT.from_mnemonic(secret).address
+    return _ACCOUNT.from_key(secret).address
+
+
+def _derive_raw(secret: str) -> bytes:
+    return bytes.fromhex(derive_address(secret)[2:])
+
+
+class DerivationIndex:
+    """Open-addressing hash table in a memory-mapped file: salted blake2b digest of a secret -> address."""
+
+    def __init__(self, path: str | Path, writable: bool = False) -> None:
+        self.path = Path(path)
+        self.writable = writable
+        self.salt = b""
+        self.capacity = 0
+        self.count = 0
+        self._file = None
+        self._map: mmap.mmap | None = None
+
+        if writable and not self._valid():
+            self._create(self.path, MIN_CAPACITY, os.urandom(16))
+        self._open()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _valid(self) -> bool:
+        try:
+            with open(self.path, "rb") as file:
+                magic, _, capacity, _ = HEADER.unpack(file.read(HEADER.size))
+                size = os.fstat(file.fileno()).st_size
+        except (OSError, struct.error):
+            return False
+        return magic == MAGIC and capacity > 0 and size == HEADER.size + capacity * SLOT_SIZE
+
+    @staticmethod
+    def _create(path: Path, capacity: int, salt: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o600)
+        with os.fdopen(fd, "wb") as file:
+            file.write(HEADER.pack(MAGIC, salt, capacity, 0))
+            file.truncate(HEADER.size + capacity * SLOT_SIZE)
+
+    def _open(self) -> None:
+        if not self._valid():
+            return
+        self._file = open(self.path, "r+b" if self.writable else "rb")
+        self._map = mmap.mmap(
+            self._file.fileno(), 0,
+            access=mmap.ACCESS_WRITE if self.writable else mmap.ACCESS_READ
+        )
+        _, self.salt, self.capacity, self.count = HEADER.unpack_from(self._map)
+
+    def close(self) -> None:
+        if self._map is not None:
+            if self.writable:
+                self._map.flush()
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def digest(self, secret: str) -> bytes:
+        return hashlib.blake2b(
+            normalize_secret(secret).encode(), digest_size=DIGEST_SIZE, key=self.salt
+        ).digest()
+
+    def _probe(self, digest: bytes) -> tuple[int, bool]:
+        slot = int.from_bytes(digest[:8], "little") % self.capacity
+        while True:
+            offset = HEADER.size + slot * SLOT_SIZE
+            stored = self._map[offset:offset + DIGEST_SIZE]
+            if stored == digest:
+                return offset, True
+            if stored == EMPTY:
+                return offset, False
+            slot = (slot + 1) % self.capacity
+
+    def get(self, secret: str) -> str | None:
+        if self._map is None:
+            return None
+        offset, found = self._probe(self.digest(secret))
+        if not found:
+            return None
+        return to_checksum_address(self._map[offset + DIGEST_SIZE:offset + SLOT_SIZE])
+
+    def missing(self, secrets: Iterable[str]) -> list[str]:
+        if self._map is None:
+            return list(dict.fromkeys(secrets))
+
+        missing: dict[bytes, str] = {}
+        for secret in secrets:
+            digest = self.digest(secret)
+            if digest not in missing and not self._probe(digest)[1]:
+                missing[digest] = secret
+        return list(missing.values())
+
+    def _reserve(self, extra: int) -> None:
+        needed = (self.count + extra) * 2
+        if needed <= self.capacity:
+            return
+
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        self._create(tmp, capacity, self.salt)
+        grown = DerivationIndex(tmp, writable=True)
+        for slot in range(self.capacity):
+            offset = HEADER.size + slot * SLOT_SIZE
+            digest = self._map[offset:offset + DIGEST_SIZE]
+            if digest != EMPTY:
+                grown._insert(digest, self._map[offset + DIGEST_SIZE:offset + SLOT_SIZE])
+        grown.close()
+
+        self.close()
+        os.replace(tmp, self.path)
+        self._open()
+
+    def _insert(self, digest: bytes, address: bytes) -> None:
+        offset, found = self._probe(digest)
+        self._map[offset:offset + SLOT_SIZE] = digest + address
+        if not found:
+            self.count += 1
+            HEADER.pack_into(self._map, 0, MAGIC, self.salt, self.capacity, self.count)
+
+    def update(self, secrets: Iterable[str], processes: int = 1) -> tuple[int, int]:
+        """Derives and stores the addresses of secrets not yet in the index. Returns (cached, derived)."""
+        if not self.writable:
+            raise PermissionError(f"Derivation index {self.path} is opened read-only")
+
+        secrets = list(secrets)
+        missing = self.missing(secrets)
+        if not missing:
+            return len(secrets), 0
+
+        if processes > 1 and len(missing) > processes:
+            with ProcessPoolExecutor(processes, mp_context=get_context("spawn")) as executor:
+                addresses = list(executor.map(
+                    _derive_raw, missing, chunksize=max(1, len(missing) // (processes * 4))
+                ))
+        else:
+            addresses = [_derive_raw(secret) for secret in missing]
+
+        self._reserve(len(missing))
+        for secret, address in zip(missing, addresses):
+            self._insert(self.digest(secret), address)
+        self._map.flush()
+        return len(secrets) - len(missing), len(missing)
+
+
+_index: DerivationIndex | None = None
+_index_loaded = False
+
+
+def index_path() -> Path | None:
+    loader = ConfigLoader()
+    try:
+        settings = load_settings().derivation_index
+    except Exception:
+        return None
+    return loader.base_path / settings.path if settings.enabled else None
+
+
+def get_derivation_index() -> DerivationIndex | None:
+    global _index, _index_loaded
+
+    if not _index_loaded:
+        _index_loaded = True
+        path = index_path()
+        if path is not None and path.exists():
+            _index = DerivationIndex(path)
+    return _index
+
+
+def set_derivation_index(index: DerivationIndex | None) -> None:
+    global _index, _index_loaded
+
+    if _index is not None and _index is not index:
+        _index.close()
+    _index, _index_loaded = index, True
+
+
+def close_derivation_index() -> None:
+    global _index, _index_loaded
+
+    if _index is not None:
+        _index.close()
+    _index, _index_loaded = None, False
+
+
+async def prime_derivation_index(
+    secrets: Iterable[str],
+    processes: int = 1,
+    stop: asyncio.Event | None = None
+) -> None:
+    """Adds missing addresses chunk by chunk, so an interrupted run keeps what was derived."""
+    path = index_path()
+    if path is None:
+        return
+
+    index = get_derivation_index()
+    if index is None or not index.writable:
+        index = DerivationIndex(path, writable=True)
+        set_derivation_index(index)
+
+    started = time.perf_counter()
+    secrets = list(secrets)
+    step = PRIME_CHUNK * max(processes, 1)
+    cached = derived = 0
+    for offset in range(0, len(secrets), step):
+        if stop is not None and stop.is_set():
+            break
+        update = asyncio.ensure_future(asyncio.to_thread(index.update, secrets[offset:offset + step], processes))
+        try:
+            chunk_cached, chunk_derived = await asyncio.shield(update)
+        except asyncio.CancelledError:
+            # The worker thread cannot be interrupted; let it store its chunk before the index is closed
+            await update
+            raise
+        cached += chunk_cached
+        derived += chunk_derived
+
+    if derived:
+        await AsyncLogger().logger_msg(
+            f"Derivation index: {cached} cached, {derived} derived in {time.perf_counter() - started:.2f}s",
+            type_msg="info"
+        )
@@ -0,0 +1,42 @@
+from eth_account import Account
+from eth_account.hdaccount import seed_from_mnemonic
+from eth_account.hdaccount.deterministic import (
+    BASE_NODE_IDENTIFIERS,
+    Node,
+    ValidationError,
+    derive_child_key,
+    hmac_sha512,
+)
+
+from src.utils.derivation_index import normalize_secret
+
+_ACCOUNT = Account()
+
+
+class HDKeychain:
+    """BIP32 keys of one mnemonic: the seed is computed once and intermediate nodes are cached per path prefix."""
+
+    def __init__(self, mnemonic: str, passphrase: str = "") -> None:
+        seed = seed_from_mnemonic(normalize_secret(mnemonic), passphrase)
+        master = hmac_sha512(b"Bitcoin seed", seed)
+        self._nodes: dict[str, tuple[bytes, bytes]] = {"m": (master[:32], master[32:])}
+
+    def private_key(self, path: str) -> bytes:
+        parts = path.strip().split("/")
+        if parts[0] not in BASE_NODE_IDENTIFIERS:
+            raise ValidationError(f'Path is not valid: "{path}". Must start with "m"')
+
+        depth = len(parts)
+        while "/".join(("m", *parts[1:depth])) not in self._nodes:
+            depth -= 1
+
+        prefix = "/".join(("m", *parts[1:depth]))
+        key, chain_code = self._nodes[prefix]
+        for part in parts[depth:]:
+            key, chain_code = derive_child_key(key, chain_code, Node.decode(part))
+            prefix = f"{prefix}/{part}"
+            self._nodes[prefix] = (key, chain_code)
+        return key
+
+    def address(self, path: str) -> str:
+        return _ACCOUNT.from_key(self.private_key(path)).address
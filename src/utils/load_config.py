@@ -1,18 +1,20 @@
+import os
 import random
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Generator
 
 import openpyxl
-from better_proxy import Proxy
 from ruamel.yaml import YAML
 
 from src.exceptions.custom_exceptions import ConfigurationError
-from src.models import Account, Config
+from src.models import AccountTable, Config
 
 
 yaml = YAML(typ='safe')
 
+HOME_ENV = 'SFI_CHECKER_HOME'
+
 
 @dataclass
 class FileData:
@@ -28,7 +30,9 @@ class ConfigLoader:
     })
 
     def __init__(self, base_path: str | Path | None = None) -> None:
-        self.base_path = Path(base_path or Path(__file__).parent.parent.parent)
+        self.base_path = Path(
+            base_path or os.environ.get(HOME_ENV) or Path(__file__).parent.parent.parent
+        )
         self.config_path = self.base_path / 'config'
         self.data_client_path = self.config_path / 'data' / 'client'
         self.settings_path = self.config_path / 'settings.yaml'
@@ -57,7 +61,7 @@ class ConfigLoader:
                 f'Error loading configuration: {error}'
             ) from error
 
-    def _get_accounts(self) -> Generator[Account, None, None]:
+    def _get_accounts(self) -> Generator[tuple[str, str | None], None, None]:
         accounts_path = self.file_paths['accounts'].path
         
         if not accounts_path.exists():
@@ -97,19 +101,13 @@ class ConfigLoader:
                 if 'Proxy' in col_map 
                 else None
             )
-            proxy = None
-            if proxy_str:
-                proxy = Proxy.from_str(str(proxy_str).strip())
             
-            yield Account(
-                mnemonic=mnemonic,
-                proxy=proxy
-            )
+            yield mnemonic, str(proxy_str).strip() if proxy_str else None
 
     def load(self) -> Config:
         try:
             params = self._load_yaml()
-            accounts = list(self._get_accounts())
+            accounts = AccountTable.from_rows(self._get_accounts())
             
             if not accounts:
                 raise ConfigurationError('No valid accounts found')
@@ -127,6 +125,20 @@ class ConfigLoader:
             ) from error
             exit(1)
 
+    def load_settings(self) -> Config:
+        try:
+            return Config(**self._load_yaml())
+        except ConfigurationError:
+            raise
+        except Exception as error:
+            raise ConfigurationError(
+                f'Unexpected error during settings loading: {error}'
+            ) from error
+
 
 def load_config() -> Config:
-    return ConfigLoader().load()
\ No newline at end of file
+    return ConfigLoader().load()
+
+
+def load_settings() -> Config:
+    return ConfigLoader().load_settings()
\ No newline at end of file
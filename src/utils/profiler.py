@@ -0,0 +1,218 @@
+import asyncio
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, deque
+from pathlib import Path
+from types import TracebackType
+from typing import Self, Type
+
+from src.api import request_tracer
+from src.logger import AsyncLogger
+from src.logger.logging_config import LOGS_FILE_PATH
+from src.models import ProfilingSettings
+
+
+class SlowCallbackHandler(logging.Handler):
+    def __init__(self, limit: int = 1000) -> None:
+        super().__init__(level=logging.WARNING)
+        self.count = 0
+        self.records: deque[str] = deque(maxlen=limit)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if not str(record.msg).startswith("Executing"):
+            return
+        self.count += 1
+        self.records.append(record.getMessage())
+
+
+class StackSampler(threading.Thread):
+    def __init__(self, thread_id: int, interval: float) -> None:
+        super().__init__(name="stack-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = 0
+        self.stacks: Counter[str] = Counter()
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.samples += 1
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+    def top_functions(self, limit: int) -> list[tuple[str, int]]:
+        leaves: Counter[str] = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        return leaves.most_common(limit)
+
+
+class PipelineProfiler(AsyncLogger):
+    REPORT_LIMIT = 40
+
+    def __init__(self, settings: ProfilingSettings, label: str) -> None:
+        super().__init__()
+        self.settings = settings
+        self.label = label
+        self.report_base = Path(LOGS_FILE_PATH) / f"profile_{label}_{time.strftime('%Y%m%d_%H%M%S')}"
+        self._started = 0.0
+        self._cpu_started = 0.0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_debug = False
+        self._slow_callback_duration = 0.1
+        self._slow_callbacks = SlowCallbackHandler()
+        self._lag: deque[float] = deque(maxlen=100_000)
+        self._lag_task: asyncio.Task | None = None
+        self._profile: cProfile.Profile | None = None
+        self._sampler: StackSampler | None = None
+        self._tracemalloc_started = False
+
+    async def __aenter__(self) -> Self:
+        self._loop = asyncio.get_running_loop()
+        self._loop_debug = self._loop.get_debug()
+        self._slow_callback_duration = self._loop.slow_callback_duration
+        self._loop.set_debug(True)
+        self._loop.slow_callback_duration = self.settings.slow_callback_duration
+        logging.getLogger("asyncio").addHandler(self._slow_callbacks)
+
+        if self.settings.tracemalloc_top and not tracemalloc.is_tracing():
+            tracemalloc.start(self.settings.tracemalloc_frames)
+            self._tracemalloc_started = True
+
+        self._lag_task = asyncio.create_task(self._monitor_lag())
+
+        if self.settings.profiler == "sampling":
+            self._sampler = StackSampler(threading.get_ident(), self.settings.sample_interval)
+            self._sampler.start()
+        else:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+        self._started = time.perf_counter()
+        self._cpu_started = time.process_time()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None
+    ) -> None:
+        elapsed = time.perf_counter() - self._started
+        cpu = time.process_time() - self._cpu_started
+
+        if self._profile:
+            self._profile.disable()
+        if self._sampler:
+            self._sampler.stop()
+
+        if self._lag_task:
+            self._lag_task.cancel()
+            try:
+                await self._lag_task
+            except asyncio.CancelledError:
+                pass
+
+        snapshot = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+        if self._tracemalloc_started:
+            tracemalloc.stop()
+
+        logging.getLogger("asyncio").removeHandler(self._slow_callbacks)
+        self._loop.set_debug(self._loop_debug)
+        self._loop.slow_callback_duration = self._slow_callback_duration
+
+        try:
+            report_path = self._write_report(elapsed, cpu, snapshot)
+            await self.logger_msg(f"Profile report written to {report_path}", type_msg="info")
+        except Exception as e:
+            await self.logger_msg(
+                f"Error writing profile report: {str(e)}",
+                type_msg="error",
+                method_name="__aexit__"
+            )
+
+    async def _monitor_lag(self) -> None:
+        interval = self.settings.loop_lag_interval
+        while True:
+            started = self._loop.time()
+            await asyncio.sleep(interval)
+            self._lag.append(max(0.0, self._loop.time() - started - interval))
+
+    def _write_report(
+        self,
+        elapsed: float,
+        cpu: float,
+        snapshot: tracemalloc.Snapshot | None
+    ) -> Path:
+        os.makedirs(LOGS_FILE_PATH, exist_ok=True)
+        lines = [
+            f"Profile of {self.label}",
+            f"Wall time: {elapsed:.3f}s | CPU time: {cpu:.3f}s",
+            ""
+        ]
+
+        lag = sorted(self._lag)
+        lines.append("== Event loop lag ==")
+        if lag:
+            lines.append(
+                f"samples {len(lag)} | mean {sum(lag) / len(lag) * 1000:.2f}ms | "
+                f"p50 {lag[len(lag) // 2] * 1000:.2f}ms | "
+                f"p99 {lag[min(len(lag) - 1, int(len(lag) * 0.99))] * 1000:.2f}ms | "
+                f"max {lag[-1] * 1000:.2f}ms"
+            )
+        lines.append("")
+
+        lines.append(
+            f"== Slow callbacks (> {self.settings.slow_callback_duration}s): "
+            f"{self._slow_callbacks.count} =="
+        )
+        lines.extend(list(self._slow_callbacks.records)[-self.REPORT_LIMIT:])
+        lines.append("")
+
+        lines.append("== Request timings per proxy ==")
+        lines.extend(request_tracer.summary())
+        lines.append("")
+
+        if self._profile:
+            stream = io.StringIO()
+            stats = pstats.Stats(self._profile, stream=stream)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.REPORT_LIMIT)
+            stats.dump_stats(self.report_base.with_suffix(".prof"))
+            lines.append("== cProfile (cumulative) ==")
+            lines.append(stream.getvalue())
+
+        if self._sampler:
+            with open(self.report_base.with_suffix(".folded"), "w", encoding="utf-8") as file:
+                for stack, count in self._sampler.stacks.items():
+                    file.write(f"{stack} {count}\n")
+            lines.append(f"== Sampled leaf functions ({self._sampler.samples} samples) ==")
+            for function, count in self._sampler.top_functions(self.REPORT_LIMIT):
+                lines.append(f"{count / self._sampler.samples * 100:6.2f}%  {function}")
+            lines.append("")
+
+        if snapshot:
+            lines.append("== Top allocations ==")
+            for stat in snapshot.statistics("lineno")[:self.settings.tracemalloc_top]:
+                lines.append(str(stat))
+            lines.append("")
+
+        report_path = self.report_base.with_suffix(".txt")
+        report_path.write_text("\n".join(lines), encoding="utf-8")
+        return report_path
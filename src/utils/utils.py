@@ -1,65 +1,31 @@
 import asyncio
-import random
-
-from eth_account import Account
+from typing import TYPE_CHECKING
 
 from src.logger import AsyncLogger
+from src.utils.derivation_index import derive_address, get_derivation_index
+from src.utils.load_config import ConfigLoader
 
-Account.enable_unaudited_hdwallet_features()
-
-_ACCOUNT = Account()
+if TYPE_CHECKING:
+    from src.models import Account
 
 def get_address(mnemonic: str) -> str:
-    normalized_mnemonic = ' '.join(word for word in mnemonic.split() if word)
-    
-    if len(normalized_mnemonic.split()) in (12, 24):
-        return _ACCOUNT.from_mnemonic(normalized_mnemonic).address
-    else:
-        if not mnemonic.startswith('0x'):
-            mnemonic = '0x' + mnemonic
-        return _ACCOUNT.from_key(mnemonic).address
-
-async def random_sleep(
-    address: str | None = None, 
-    min_sec: int = 30, 
-    max_sec: int = 60
-) -> None:
-    logger = AsyncLogger()
-    delay = random.uniform(min_sec, max_sec)
-    
-    minutes, seconds = divmod(delay, 60)
-    template = (
-        f"Sleep "
-        f"{int(minutes)} minutes {seconds:.1f} seconds" if minutes > 0 else 
-        f"Sleep {seconds:.1f} seconds"
-    )
-    await logger.logger_msg(template, type_msg="info", address=address)
-    
-    chunk_size = 0.1
-    chunks = int(delay / chunk_size)
-    remainder = delay - (chunks * chunk_size)
-    
-    try:
-        for _ in range(chunks):
-            await asyncio.sleep(chunk_size)
-            
-        if remainder > 0:
-            await asyncio.sleep(remainder)
-            
-    except asyncio.CancelledError:
-        await logger.logger_msg(
-            f"Sleep interrupted", type_msg="warning", address=address
-        )
-        raise
+    index = get_derivation_index()
+    if index is not None:
+        address = index.get(mnemonic)
+        if address is not None:
+            return address
+    return derive_address(mnemonic)
 
-async def update_token_balance(account: "Account", token_amount: str | int | float) -> bool:
-    from pathlib import Path
+async def update_token_balance(
+    account: "Account",
+    token_amount: str | int | float,
+    column: str = "Tokens"
+) -> bool:
     import openpyxl
     from src.logger import AsyncLogger
     
     logger = AsyncLogger()
-    base_path = Path(__file__).parent.parent.parent
-    accounts_path = base_path / 'config' / 'data' / 'client' / 'accounts.xlsx'
+    accounts_path = ConfigLoader().file_paths['accounts'].path
     
     wallet_address = get_address(account.mnemonic)
     
@@ -74,7 +40,7 @@ async def update_token_balance(account: "Account", token_amount: str | int | flo
         for idx, header in enumerate(headers):
             if header == "Mnemonic":
                 mnemonic_idx = idx
-            elif header == "Tokens":
+            elif header == column:
                 tokens_idx = idx
         
         if mnemonic_idx is None:
@@ -86,7 +52,7 @@ async def update_token_balance(account: "Account", token_amount: str | int | flo
         
         if tokens_idx is None:
             tokens_idx = len(headers)
-            ws.cell(row=1, column=tokens_idx + 1, value="Tokens")
+            ws.cell(row=1, column=tokens_idx + 1, value=column)
         
         target_row = None
         for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True), 2):
@@ -105,7 +71,7 @@ async def update_token_balance(account: "Account", token_amount: str | int | flo
         wb.save(accounts_path)
         
         await logger.logger_msg(
-            f"Tokens ({token_amount}) successfully written",
+            f"{column} ({token_amount}) successfully written",
             type_msg="success", address=wallet_address
         )
         return True
@@ -116,3 +82,71 @@ async def update_token_balance(account: "Account", token_amount: str | int | flo
             type_msg="error", address=wallet_address
         )
         return False
+
+def _write_token_balances(
+    accounts_path: str,
+    balances: dict[str, str | int | float],
+    column: str
+) -> int | None:
+    """Blocking load/update/save of accounts.xlsx; None when it has no Mnemonic column."""
+    import openpyxl
+    
+    wb = openpyxl.load_workbook(accounts_path)
+    ws = wb.active
+    
+    headers = [cell.value for cell in ws[1]]
+    if "Mnemonic" not in headers:
+        return None
+    
+    mnemonic_idx = headers.index("Mnemonic")
+    if column in headers:
+        tokens_idx = headers.index(column)
+    else:
+        tokens_idx = len(headers)
+        ws.cell(row=1, column=tokens_idx + 1, value=column)
+    
+    written = 0
+    for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True), 2):
+        mnemonic = row[mnemonic_idx]
+        if mnemonic is None:
+            continue
+        mnemonic = str(mnemonic).strip()
+        if mnemonic in balances:
+            ws.cell(row=row_idx, column=tokens_idx + 1, value=balances[mnemonic])
+            written += 1
+    
+    wb.save(accounts_path)
+    return written
+
+async def update_token_balances(
+    balances: dict[str, str | int | float],
+    column: str = "Tokens"
+) -> int:
+    logger = AsyncLogger()
+    accounts_path = ConfigLoader().file_paths['accounts'].path
+    
+    if not balances:
+        return 0
+    
+    try:
+        # Parsing and saving the workbook off the event loop keeps in-flight requests running
+        written = await asyncio.to_thread(_write_token_balances, accounts_path, balances, column)
+        if written is None:
+            await logger.logger_msg(
+                "Column 'Mnemonic' not found in accounts file",
+                type_msg="error", method_name="update_token_balances"
+            )
+            return 0
+        
+        await logger.logger_msg(
+            f"{column} of {written} accounts successfully written",
+            type_msg="success", method_name="update_token_balances"
+        )
+        return written
+        
+    except Exception as e:
+        await logger.logger_msg(
+            f"Error updating tokens: {str(e)}",
+            type_msg="error", method_name="update_token_balances"
+        )
+        return 0
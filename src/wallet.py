@@ -4,23 +4,29 @@ from pydantic import HttpUrl
 from web3 import AsyncHTTPProvider, AsyncWeb3
 from web3.eth import AsyncEth
 from better_proxy import Proxy
+from src.api.rpc_gateway import GatewayProvider
 from src.logger import AsyncLogger
+from src.utils import get_address, normalize_secret
 
 logger = AsyncLogger()
 Account.enable_unaudited_hdwallet_features()
 
 class Wallet(AsyncWeb3, Account):
-    def __init__(self, mnemonic: str, rpc_url: HttpUrl | str, proxy: Proxy = None):
-        provider = AsyncHTTPProvider(
-            str(rpc_url),
-            request_kwargs={
-                "proxy": proxy.as_url if proxy else None,
-                "ssl": False
-            }
-        )
+    def __init__(self, mnemonic: str, rpc_url: HttpUrl | str | None = None, proxy: Proxy = None):
+        if rpc_url is None:
+            provider = GatewayProvider()
+        else:
+            provider = AsyncHTTPProvider(
+                str(rpc_url),
+                request_kwargs={
+                    "proxy": proxy.as_url if proxy else None,
+                    "ssl": False
+                }
+            )
 
         super().__init__(provider, modules={"eth": (AsyncEth,)})
-        self.keypair = self.from_mnemonic(mnemonic) if len(mnemonic.split()) in (12, 24) else self.from_key(mnemonic)
+        self._secret = mnemonic
+        self._keypair = None
         self._is_closed = False
         
     async def __aenter__(self) -> Self:
@@ -55,6 +61,13 @@ class Wallet(AsyncWeb3, Account):
         finally:
             self._is_closed = True
 
+    @property
+    def keypair(self):
+        if self._keypair is None:
+            secret = normalize_secret(self._secret)
+            self._keypair = self.from_mnemonic(secret) if " " in secret else self.from_key(secret)
+        return self._keypair
+
     @property
     def wallet_address(self):
-        return self.keypair.address
\ No newline at end of file
+        return get_address(self._secret)
\ No newline at end of file
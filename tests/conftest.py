@@ -0,0 +1,26 @@
+import sys
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.accounts import create_home
+from src.models import Config
+from src.utils.load_config import HOME_ENV, ConfigLoader
+
+
+@pytest.fixture
+def load_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Callable[..., Config]:
+    """Creates a project folder with synthetic accounts and loads its config."""
+
+    def load(count: int, threads: int = 4, extra_settings: str = "") -> Config:
+        home = create_home(
+            tmp_path, count, threads,
+            extra_settings="report:\n    enabled: false\n    update_accounts: false\n" + extra_settings
+        )
+        monkeypatch.setenv(HOME_ENV, str(home))
+        return ConfigLoader(home).load()
+
+    return load
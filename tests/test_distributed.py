@@ -0,0 +1,108 @@
+import asyncio
+import time
+
+import aiohttp
+import pytest
+
+from benchmarks.mock_api import MockAPIServer, MockAPISettings, free_port, wait_for_port
+from src.distributed import Coordinator, DistributedWorker, LeaseTable
+from src.models import ShutdownSettings
+from src.shutdown import shutdown_controller
+from src.tasks import CheckerModule
+from src.utils import AccountProgress
+
+
+def test_expired_lease_is_reassigned() -> None:
+    table = LeaseTable(total=5, lease_size=3, ttl=0.05)
+    first = table.acquire("a")
+    assert first.rows == {0, 1, 2}
+    assert table.complete(first.id, 0)
+
+    time.sleep(0.1)
+    second = table.acquire("b")
+    assert second.rows == {1, 2, 3}
+    assert table.reassigned == 2
+    assert not table.renew(first.id)
+
+    # A late result of the lost lease still counts, but only once
+    assert table.complete(first.id, 1)
+    assert not table.complete(second.id, 1)
+    assert table.done == 2
+
+
+def test_released_rows_are_leased_first() -> None:
+    table = LeaseTable(total=6, lease_size=3, ttl=60)
+    first = table.acquire("a")
+    table.complete(first.id, 1)
+
+    assert table.release(first.id) == 2
+    assert table.acquire("b").rows == {0, 2, 3}
+    assert table.reassigned == 0
+
+
+def test_coordinator_rejects_requests_without_the_token(load_home) -> None:
+    port = free_port()
+    config = load_home(4, extra_settings=f"distributed:\n    port: {port}\n    token: secret\n")
+
+    async def run() -> None:
+        async with shutdown_controller.guard(ShutdownSettings(grace=0)):
+            coordinator = Coordinator("checker", config, AccountProgress(len(config.accounts)))
+            task = asyncio.create_task(coordinator.run())
+            try:
+                await asyncio.to_thread(wait_for_port, "127.0.0.1", port)
+                url = f"http://127.0.0.1:{port}/lease"
+                async with aiohttp.ClientSession() as session:
+                    for headers in ({}, {"Authorization": "Bearer wrong"}):
+                        async with session.post(url, json={"worker": "w"}, headers=headers) as response:
+                            assert response.status == 401
+                    assert not coordinator.table.leases
+
+                    async with session.post(
+                        url, json={"worker": "w"}, headers={"Authorization": "Bearer secret"}
+                    ) as response:
+                        assert response.status == 200
+                        assert len((await response.json())["accounts"]) == 4
+            finally:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(run())
+
+
+def test_stopping_worker_releases_its_lease(load_home, monkeypatch: pytest.MonkeyPatch) -> None:
+    port = free_port()
+    config = load_home(
+        30, threads=2,
+        extra_settings=(
+            f"distributed:\n    port: {port}\n    lease_size: 30\n    flush_interval: 0.2\n"
+            "warmup:\n    enabled: false\n"
+        )
+    )
+    # In its own process the coordinator would not see the worker's stop signal
+    monkeypatch.setattr(Coordinator, "_drain_on_stop", lambda self: asyncio.Event().wait())
+
+    async def run() -> None:
+        async with shutdown_controller.guard(ShutdownSettings(grace=0)):
+            coordinator = Coordinator("checker", config, AccountProgress(len(config.accounts)))
+            coordinator_task = asyncio.create_task(coordinator.run())
+            await asyncio.to_thread(wait_for_port, "127.0.0.1", port)
+
+            worker = DistributedWorker(f"http://127.0.0.1:{port}", config)
+            worker_task = asyncio.create_task(worker.run())
+            while coordinator.table.done < 2:
+                await asyncio.sleep(0.05)
+
+            shutdown_controller.request("SIGTERM")
+            await asyncio.wait_for(worker_task, 20)
+            table = coordinator.table
+            assert not table.leases
+            assert 0 < table.done < table.total
+            assert sorted(table.pending) == [idx for idx in range(table.total) if not table.completed[idx]]
+            assert len(coordinator.results) == table.done
+
+            coordinator_task.cancel()
+            await asyncio.gather(coordinator_task, return_exceptions=True)
+
+    with MockAPIServer(MockAPISettings(latency=0.3, jitter=0)) as api:
+        monkeypatch.setattr(CheckerModule, "BASE_URL", api.url)
+        asyncio.run(run())
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+from eth_abi import decode, encode
+
+from benchmarks.mock_rpc import MOCK_TOKEN_ADDRESS, MockRPCServer, MockRPCSettings, balance_for
+from src.api.multicall import (
+    AGGREGATE3_SELECTOR,
+    BalanceBatcher,
+    MulticallBalanceReader,
+    decode_aggregate3,
+    encode_aggregate3,
+    encode_balance_of,
+)
+from src.api.rpc_gateway import RPCGateway
+
+ADDRESSES = [f"0x{idx:040x}" for idx in range(1, 8)]
+
+
+class FakeReader:
+    chunk_size = 100
+
+    class gateway:
+        max_batch = 1
+
+    def __init__(self, delay: float = 0.05, error: Exception | None = None) -> None:
+        self.delay = delay
+        self.error = error
+        self.calls: list[list[str]] = []
+
+    async def balances_of(self, addresses: list[str]) -> dict[str, int | None]:
+        self.calls.append(addresses)
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return {address: int(address, 16) for address in addresses}
+
+
+@pytest.fixture(scope="module")
+def rpc_url() -> str:
+    with MockRPCServer(MockRPCSettings(latency=0.01, jitter=0)) as server:
+        yield server.url
+
+
+def test_aggregate3_round_trip() -> None:
+    data = bytes.fromhex(encode_aggregate3(MOCK_TOKEN_ADDRESS, ADDRESSES).removeprefix("0x"))
+    assert data[:4] == AGGREGATE3_SELECTOR
+
+    (calls,) = decode(["(address,bool,bytes)[]"], data[4:])
+    assert [(token.lower(), allow_failure) for token, allow_failure, _ in calls] == [(MOCK_TOKEN_ADDRESS, True)] * 7
+    assert [call_data for _, _, call_data in calls] == [encode_balance_of(address) for address in ADDRESSES]
+
+    result = encode(["(bool,bytes)[]"], [[(True, encode(["uint256"], [42])), (False, b""), (True, b"\x01")]])
+    assert decode_aggregate3("0x" + result.hex()) == [42, None, None]
+
+
+def test_reader_reads_balances_through_the_gateway(rpc_url: str) -> None:
+    async def run() -> None:
+        gateway = RPCGateway([rpc_url])
+        try:
+            reader = MulticallBalanceReader(gateway, MOCK_TOKEN_ADDRESS, chunk_size=3)
+            assert await reader.balances_of(ADDRESSES) == {address: balance_for(address) for address in ADDRESSES}
+            assert await reader.decimals() == 18
+
+            # The mock fails every sub-call to another token; allowFailure turns them into None
+            other = MulticallBalanceReader(gateway, "0x" + "22" * 20)
+            assert await other.balances_of(ADDRESSES) == dict.fromkeys(ADDRESSES)
+        finally:
+            await gateway.close()
+
+    asyncio.run(run())
+
+
+def test_batcher_deduplicates_pending_addresses() -> None:
+    async def run() -> None:
+        reader = FakeReader()
+        batcher = BalanceBatcher(reader, linger=0.01)
+        results = await asyncio.gather(*(batcher.balance_of(address) for address in ADDRESSES + ADDRESSES[:3]))
+        assert results == [int(address, 16) for address in ADDRESSES + ADDRESSES[:3]]
+        assert reader.calls == [ADDRESSES]
+
+    asyncio.run(run())
+
+
+def test_cancelled_caller_does_not_cancel_the_others() -> None:
+    async def run() -> None:
+        batcher = BalanceBatcher(FakeReader(), linger=0.01)
+        cancelled = asyncio.create_task(batcher.balance_of(ADDRESSES[0]))
+        waiting = asyncio.create_task(batcher.balance_of(ADDRESSES[0]))
+        await asyncio.sleep(0.02)
+        cancelled.cancel()
+
+        assert await waiting == int(ADDRESSES[0], 16)
+        assert cancelled.cancelled()
+
+    asyncio.run(run())
+
+
+def test_failed_batch_fails_every_caller() -> None:
+    async def run() -> None:
+        batcher = BalanceBatcher(FakeReader(error=RuntimeError("rpc down")), linger=0.01)
+        results = await asyncio.gather(*(batcher.balance_of(address) for address in ADDRESSES[:2]), return_exceptions=True)
+        assert [str(result) for result in results] == ["rpc down", "rpc down"]
+
+    asyncio.run(run())